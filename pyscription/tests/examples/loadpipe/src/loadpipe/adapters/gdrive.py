@@ -1,35 +1,124 @@
 
 from __future__ import annotations
+import email.utils
+import fnmatch
 import json
+import queue
 import re
+import socket
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional
 
 from googleapiclient.discovery import build as _build
 from googleapiclient.errors import HttpError
 
+from ..limiter import AdaptiveLimiter
+from ..retry import RetryPolicy
+
 RETRYABLE_STATUS_CODES = {429}
+LIST_PAGE_SIZE = 1000  # files.list maximum
+FOLDER_MIME = "application/vnd.google-apps.folder"
+_GLOB_CHARS = "*?["
+FILES_URL = "https://www.googleapis.com/drive/v3/files"
+UPLOAD_URL = "https://www.googleapis.com/upload/drive/v3/files?uploadType=resumable"
 RETRY_DELAY_BASE = 1.0
 MAX_RETRIES = 5
+_TRANSIENT_ERRORS = (ConnectionError, TimeoutError, socket.timeout)
+
+_default_policy = RetryPolicy(max_retries=MAX_RETRIES, base_delay=RETRY_DELAY_BASE)
+_default_limiter = AdaptiveLimiter()
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """Install the process-wide retry policy used when callers do not pass one."""
+    global _default_policy
+    _default_policy = policy
+
+
+def get_retry_policy() -> RetryPolicy:
+    return _default_policy
+
+
+def set_limiter(limiter: AdaptiveLimiter) -> None:
+    """Install the process-wide concurrency limiter shared by every Drive call."""
+    global _default_limiter
+    _default_limiter = limiter
+
+
+def get_limiter() -> AdaptiveLimiter:
+    return _default_limiter
 
 
 def _should_retry(status: Optional[int]) -> bool:
     return status in RETRYABLE_STATUS_CODES or (status is not None and 500 <= status < 600)
 
 
-def _execute_with_retries(action: Callable[[], Any]) -> Any:
-    attempt = 0
-    while True:
-        try:
-            return action()
-        except HttpError as exc:
-            status = getattr(exc, "status_code", None) or getattr(getattr(exc, "resp", None), "status", None)
-            if attempt >= MAX_RETRIES or not _should_retry(status):
-                raise
-            sleep_for = RETRY_DELAY_BASE * (2 ** attempt)
-            time.sleep(sleep_for)
-            attempt += 1
+def _retry_after(resp: Any) -> Optional[float]:
+    value = resp.get("retry-after") if hasattr(resp, "get") else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _classify(exc: BaseException) -> tuple[bool, Optional[float]]:
+    if isinstance(exc, HttpError):
+        resp = getattr(exc, "resp", None)
+        status = getattr(exc, "status_code", None) or getattr(resp, "status", None)
+        if not _should_retry(status):
+            return False, None
+        return True, _retry_after(resp) if status in {429, 503} else None
+    if isinstance(exc, _TRANSIENT_ERRORS):
+        return True, None
+    return False, None
+
+
+def _overloaded(exc: BaseException) -> bool:
+    if not isinstance(exc, HttpError):
+        return False
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "resp", None), "status", None)
+    return status in {429, 503}
+
+
+def _execute_with_retries(
+    action: Callable[[], Any],
+    policy: Optional[RetryPolicy] = None,
+    *,
+    kind: str = "api",
+    size: Optional[int] = None,
+) -> Any:
+    # Each attempt holds a limiter slot; backoff sleeps between attempts do not.
+    limiter = _default_limiter
+    return (policy or _default_policy).call(
+        lambda: limiter.call(action, _overloaded, kind=kind, size=size),
+        _classify,
+    )
+
+
+async def _aexecute_with_retries(
+    action: Callable[[], Awaitable[Any]],
+    policy: Optional[RetryPolicy] = None,
+    *,
+    kind: str = "api",
+    size: Optional[int] = None,
+) -> Any:
+    """Async twin of ``_execute_with_retries`` sharing the same policy and limiter."""
+    limiter = _default_limiter
+    return await (policy or _default_policy).acall(
+        lambda: limiter.acall(action, _overloaded, kind=kind, size=size),
+        _classify,
+    )
 
 
 def _authorized_http(service: Any):
@@ -39,19 +128,32 @@ def _authorized_http(service: Any):
     return http
 
 
-def _http_request_with_retries(service: Any, url: str, *, method: str, headers: Optional[dict] = None, body: Optional[bytes] = None):
+def _check_response(response: Any, content: bytes, uri: str) -> None:
+    status = getattr(response, "status", None)
+    if _should_retry(status):
+        raise HttpError(response, content, uri=uri)
+    if status is not None and status >= 400 and status not in {308}:  # 308 == resumable upload incomplete
+        raise HttpError(response, content, uri=uri)
+
+
+def _http_request_with_retries(
+    service: Any,
+    url: str,
+    *,
+    method: str,
+    headers: Optional[dict] = None,
+    body: Optional[bytes] = None,
+    policy: Optional[RetryPolicy] = None,
+    size: Optional[int] = None,
+):
     http = _authorized_http(service)
 
     def _do_request():
         response, content = http.request(url, method=method, headers=headers or {}, body=body)
-        status = getattr(response, "status", None)
-        if _should_retry(status):
-            raise HttpError(response, content, uri=url)
-        if status is not None and status >= 400 and status not in {308}:  # 308 == resumable upload incomplete
-            raise HttpError(response, content, uri=url)
+        _check_response(response, content, url)
         return response, content
 
-    return _execute_with_retries(_do_request)
+    return _execute_with_retries(_do_request, policy, kind="media", size=size)
 
 @dataclass
 class FileMeta:
@@ -61,6 +163,15 @@ class FileMeta:
     md5: Optional[str] = None
     mime: Optional[str] = None
     modified: Optional[str] = None
+    path: Optional[str] = None  # relative to the walked root (walk_files only)
+
+@dataclass
+class FileChange:
+    file_id: str
+    removed: bool = False
+    trashed: bool = False
+    parents: List[str] = field(default_factory=list)
+    meta: Optional[FileMeta] = None
 
 @dataclass
 class UploadSession:
@@ -69,6 +180,37 @@ class UploadSession:
     folder_id: str
     total: Optional[int] = None
 
+class ServicePool:
+    """Hand out one Drive service per thread; googleapiclient/httplib2 clients are not thread-safe."""
+
+    def __init__(self, factory: Callable[[], Any], *, primary: Any = None) -> None:
+        self._factory = factory
+        self._local = threading.local()
+        if primary is not None:
+            self._local.service = primary
+
+    def get(self) -> Any:
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = self._factory()
+            self._local.service = service
+        return service
+
+_FILE_FIELDS = "id, name, size, md5Checksum, mimeType, modifiedTime"
+
+
+def _file_meta(item: dict[str, Any], fallback_id: str = "") -> FileMeta:
+    size = int(item["size"]) if item.get("size") is not None else None
+    return FileMeta(
+        id=item.get("id", fallback_id),
+        name=item.get("name", ""),
+        size=size,
+        md5=item.get("md5Checksum"),
+        mime=item.get("mimeType"),
+        modified=item.get("modifiedTime"),
+    )
+
+
 def build_service(credentials: Any) -> Any:
     """Construct a Google Drive API v3 client."""
 
@@ -80,70 +222,266 @@ def build_service(credentials: Any) -> Any:
     except HttpError as exc:
         raise RuntimeError(f"Failed to initialize Google Drive service: {exc}") from exc
 
-def list_files(service: Any, folder_id: str, pattern: Optional[str] = None) -> List[FileMeta]:
-    """Return a list of files for a given Drive folder."""
+def _quote(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
 
-    query_parts = [f"'{folder_id}' in parents", "trashed = false"]
-    if pattern:
-        escaped = pattern.replace("'", "\'")
-        query_parts.append(f"name contains '{escaped}'")
-    query = " and ".join(query_parts)
-
-    request = service.files().list(
-        q=query,
-        spaces="drive",
-        fields="files(id, name, size, md5Checksum, mimeType, modifiedTime)",
-    )
+@dataclass(frozen=True)
+class NamePattern:
+    """A ``source.pattern`` glob split into a Drive query pushdown and a local matcher."""
 
-    response = _execute_with_retries(request.execute)
-    files: Iterable[dict[str, Any]] = response.get("files", [])
-    result: List[FileMeta] = []
+    query: Optional[str]
+    regex: Optional["re.Pattern[str]"]
+
+    def matches(self, name: Optional[str]) -> bool:
+        return self.regex is None or self.regex.match(name or "") is not None
+
+@lru_cache(maxsize=128)
+def compile_pattern(pattern: Optional[str], mime: Optional[str] = None) -> NamePattern:
+    """
+    Compile a glob (``fnmatch`` semantics, case-sensitive) once.
+
+    Whatever the Drive query language can express is pushed down: an exact
+    ``name =`` for literal patterns, ``name contains`` for the leading word of a
+    literal prefix (Drive only prefix-matches whole name terms, so the prefix is
+    cut at the first non-alphanumeric character), and ``mimeType =`` when given.
+    The rest is filtered locally by ``NamePattern.matches``.
+    """
+
+    clauses: List[str] = []
+    regex = None
+    if pattern:
+        regex = re.compile(fnmatch.translate(pattern))
+        if not any(ch in pattern for ch in _GLOB_CHARS):
+            clauses.append(f"name = {_quote(pattern)}")
+        else:
+            literal = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+            word = re.match(r"[A-Za-z0-9]+", literal)
+            if word:
+                clauses.append(f"name contains {_quote(word.group(0))}")
+    if mime:
+        clauses.append(f"mimeType = {_quote(mime)}")
+    return NamePattern(query=" and ".join(clauses) or None, regex=regex)
+
+def _list_query(folder_id: str, compiled: NamePattern, include_folders: bool) -> str:
+    query_parts = [f"{_quote(folder_id)} in parents", "trashed = false"]
+    if compiled.query and include_folders:
+        query_parts.append(f"(mimeType = {_quote(FOLDER_MIME)} or ({compiled.query}))")
+    elif compiled.query:
+        query_parts.append(compiled.query)
+    return " and ".join(query_parts)
+
+def _listed(files: Iterable[dict[str, Any]], compiled: NamePattern, include_folders: bool) -> Iterator[FileMeta]:
     for item in files:
-        size = int(item["size"]) if item.get("size") is not None else None
-        result.append(
-            FileMeta(
-                id=item.get("id", ""),
-                name=item.get("name", ""),
-                size=size,
-                md5=item.get("md5Checksum"),
-                mime=item.get("mimeType"),
-                modified=item.get("modifiedTime"),
-            )
+        meta = _file_meta(item)
+        if include_folders and meta.mime == FOLDER_MIME:
+            yield meta
+        elif compiled.matches(meta.name):
+            yield meta
+
+def list_files(
+    service: Any,
+    folder_id: str,
+    pattern: Optional[str] = None,
+    *,
+    mime: Optional[str] = None,
+    fields: Optional[str] = None,
+    page_size: int = LIST_PAGE_SIZE,
+    include_folders: bool = False,
+) -> Iterator[FileMeta]:
+    """
+    Stream the files of a Drive folder matching the glob ``pattern``, following ``nextPageToken``.
+
+    ``fields`` is the per-file field mask (defaults to every ``FileMeta`` column);
+    callers that only need e.g. ``"id, name, modifiedTime"`` can trim the response.
+    Only one page is held in memory at a time. ``include_folders`` also yields
+    every subfolder regardless of the pattern (used by ``walk_files``).
+    """
+
+    compiled = compile_pattern(pattern, mime)
+    query = _list_query(folder_id, compiled, include_folders)
+
+    page_token: Optional[str] = None
+    while True:
+        request = service.files().list(
+            q=query,
+            spaces="drive",
+            pageSize=page_size,
+            pageToken=page_token,
+            fields=f"nextPageToken, files({fields or _FILE_FIELDS})",
         )
-    return result
 
-def stat(service: Any, file_id: str) -> FileMeta:
+        response = _execute_with_retries(request.execute)
+        yield from _listed(response.get("files", []), compiled, include_folders)
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return
+
+def name_matches(name: Optional[str], pattern: Optional[str]) -> bool:
+    """Local equivalent of the ``list_files`` glob filter."""
+    return compile_pattern(pattern).matches(name)
+
+def walk_files(
+    pool: ServicePool,
+    folder_id: str,
+    pattern: Optional[str] = None,
+    *,
+    mime: Optional[str] = None,
+    max_depth: Optional[int] = None,
+    fan_out: int = 8,
+    fields: Optional[str] = None,
+) -> Iterator[FileMeta]:
+    """
+    Recursively stream files below ``folder_id``, listing up to ``fan_out`` folders at once.
+
+    Each yielded ``FileMeta`` carries ``path`` relative to ``folder_id``.
+    ``max_depth=0`` lists only the root folder; ``None`` walks the whole tree.
+    Output order follows completion, not tree order.
+    """
+
+    if fan_out <= 0:
+        raise ValueError("fan_out must be positive")
+    mask = fields or _FILE_FIELDS
+    if "mimeType" not in mask:
+        mask = f"{mask}, mimeType"  # needed to recognise subfolders
+
+    results: "queue.Queue[tuple[str, Any]]" = queue.Queue(maxsize=fan_out * LIST_PAGE_SIZE)
+    stop = threading.Event()
+
+    def _put(item: tuple[str, Any]) -> None:
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _list(folder: str, prefix: str, depth: int) -> None:
+        try:
+            for meta in list_files(pool.get(), folder, pattern, mime=mime, fields=mask, include_folders=True):
+                if stop.is_set():
+                    return
+                meta.path = f"{prefix}{meta.name}"
+                _put(("item", (meta, depth)))
+        except BaseException as exc:  # surfaced in the consumer thread
+            _put(("error", exc))
+        finally:
+            _put(("done", None))
+
+    executor = ThreadPoolExecutor(max_workers=fan_out, thread_name_prefix="gdrive-walk")
+    try:
+        pending = 1
+        executor.submit(_list, folder_id, "", 0)
+        while pending:
+            kind, payload = results.get()
+            if kind == "done":
+                pending -= 1
+                continue
+            if kind == "error":
+                raise payload
+            meta, depth = payload
+            if meta.mime == FOLDER_MIME:
+                if max_depth is None or depth < max_depth:
+                    pending += 1
+                    executor.submit(_list, meta.id, f"{meta.path}/", depth + 1)
+                continue
+            yield meta
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def stat(service: Any, file_id: str, *, policy: Optional[RetryPolicy] = None) -> FileMeta:
     request = service.files().get(
         fileId=file_id,
-        fields="id, name, size, md5Checksum, mimeType, modifiedTime",
+        fields=_FILE_FIELDS,
     )
 
-    info = _execute_with_retries(request.execute)
-    size = int(info["size"]) if info.get("size") is not None else None
-    return FileMeta(
-        id=info.get("id", file_id),
-        name=info.get("name", ""),
-        size=size,
-        md5=info.get("md5Checksum"),
-        mime=info.get("mimeType"),
-        modified=info.get("modifiedTime"),
+    info = _execute_with_retries(request.execute, policy)
+    return _file_meta(info, fallback_id=file_id)
+
+def copy_file(service: Any, file_id: str, *, name: str, folder_id: str) -> FileMeta:
+    """Server-side copy of ``file_id`` into ``folder_id`` under ``name`` (no bytes leave Drive)."""
+
+    body: dict[str, Any] = {"name": name}
+    if folder_id:
+        body["parents"] = [folder_id]
+    request = service.files().copy(
+        fileId=file_id,
+        body=body,
+        fields=_FILE_FIELDS,
     )
 
-def download_range(service: Any, file_id: str, start: int, end: int) -> bytes:
-    if start < 0 or end < start:
-        raise ValueError("Invalid byte range")
+    # Copy time grows with the file, so it must not feed the "api" latency baseline.
+    info = _execute_with_retries(request.execute, kind="copy")
+    return _file_meta(info)
+
+def get_start_page_token(service: Any) -> str:
+    """Return the Drive changes cursor for "now"; later changes are fetched relative to it."""
 
-    url = f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
-    headers = {"Range": f"bytes={start}-{end}"}
+    request = service.changes().getStartPageToken()
+    response = _execute_with_retries(request.execute)
+    return str(response["startPageToken"])
+
+def list_changes(service: Any, page_token: str) -> tuple[List[FileChange], str]:
+    """Fetch every change since ``page_token`` and return them with the next start token."""
+
+    changes: List[FileChange] = []
+    token = page_token
+    while True:
+        request = service.changes().list(
+            pageToken=token,
+            spaces="drive",
+            pageSize=1000,
+            includeRemoved=True,
+            fields=f"nextPageToken, newStartPageToken, changes(fileId, removed, file({_FILE_FIELDS}, parents, trashed))",
+        )
+        response = _execute_with_retries(request.execute)
+        for item in response.get("changes", []):
+            info = item.get("file") or {}
+            changes.append(
+                FileChange(
+                    file_id=item.get("fileId", info.get("id", "")),
+                    removed=bool(item.get("removed")),
+                    trashed=bool(info.get("trashed")),
+                    parents=list(info.get("parents") or []),
+                    meta=_file_meta(info) if info else None,
+                )
+            )
+        if response.get("newStartPageToken"):
+            return changes, str(response["newStartPageToken"])
+        token = response.get("nextPageToken")
+        if not token:  # pragma: no cover - API always returns one of the two tokens
+            return changes, page_token
+
+def _download(
+    service: Any, file_id: str, byte_range: str, policy: Optional[RetryPolicy], size: int
+) -> bytes:
+    url = f"{FILES_URL}/{file_id}?alt=media"
+    headers = {"Range": f"bytes={byte_range}"}
     response, content = _http_request_with_retries(
-        service, url, method="GET", headers=headers
+        service, url, method="GET", headers=headers, policy=policy, size=size
     )
     status = getattr(response, "status", None)
     if status not in {200, 206}:
         raise HttpError(response, content, uri=url)
     return content or b""
 
-def begin_resumable_upload(service: Any, name: str, folder_id: str, size: Optional[int] = None, mime: str = "application/octet-stream") -> UploadSession:
+
+def download_range(service: Any, file_id: str, start: int, end: int, *, policy: Optional[RetryPolicy] = None) -> bytes:
+    if start < 0 or end < start:
+        raise ValueError("Invalid byte range")
+    return _download(service, file_id, f"{start}-{end}", policy, end - start + 1)
+
+
+def download_tail(service: Any, file_id: str, length: int, *, policy: Optional[RetryPolicy] = None) -> bytes:
+    """Fetch the last ``length`` bytes (the whole file if shorter) without knowing its size."""
+    if length <= 0:
+        raise ValueError("Invalid tail length")
+    return _download(service, file_id, f"-{length}", policy, length)
+
+def _resumable_upload_request(
+    name: str, folder_id: str, size: Optional[int], mime: str
+) -> tuple[dict[str, str], bytes]:
     metadata: dict[str, Any] = {"name": name, "mimeType": mime}
     if folder_id:
         metadata["parents"] = [folder_id]
@@ -155,44 +493,32 @@ def begin_resumable_upload(service: Any, name: str, folder_id: str, size: Option
     }
     if size is not None:
         headers["X-Upload-Content-Length"] = str(size)
+    return headers, body
 
-    url = "https://www.googleapis.com/upload/drive/v3/files?uploadType=resumable"
-    response, _ = _http_request_with_retries(
-        service, url, method="POST", headers=headers, body=body
-    )
+
+def _upload_session(response: Any, *, name: str, folder_id: str, size: Optional[int]) -> UploadSession:
     session_url = response.get("location") or response.get("Location")
     if not session_url:
         raise RuntimeError("Unable to obtain upload session Location header")
-
     return UploadSession(session_url=session_url, name=name, folder_id=folder_id, total=size)
 
 
-def query_upload_status(service: Any, session: UploadSession, total: Optional[int] = None) -> int:
-    """Return the next expected byte offset for a resumable upload session."""
-
-    total_bytes = total or session.total
-    range_total = str(total_bytes) if total_bytes is not None else "*"
-    headers = {
-        "Content-Length": "0",
-        "Content-Range": f"bytes */{range_total}",
+def _chunk_headers(length: int, content_range: str) -> dict[str, str]:
+    return {
+        "Content-Length": str(length),
+        "Content-Range": content_range,
         "Content-Type": "application/octet-stream",
     }
 
-    def _do_request():
-        response, content = _authorized_http(service).request(
-            session.session_url,
-            method="PUT",
-            headers=headers,
-            body=b"",
-        )
-        status = getattr(response, "status", None)
-        if _should_retry(status):
-            raise HttpError(response, content, uri=session.session_url)
-        if status is not None and status >= 400 and status not in {308}:
-            raise HttpError(response, content, uri=session.session_url)
-        return response, content
 
-    response, content = _execute_with_retries(_do_request)
+def _session_offset(response: Any, content: bytes, *, default: int, done: Optional[int] = None) -> int:
+    """
+    Next byte offset reported by a resumable-upload response.
+
+    308 carries the persisted ``Range``; 200/201 means the upload finished and the
+    size comes from the file resource (else ``done``). Anything else yields ``default``.
+    """
+
     status = getattr(response, "status", None)
     if status == 308:
         range_header = response.get("Range") or response.get("range")
@@ -200,7 +526,7 @@ def query_upload_status(service: Any, session: UploadSession, total: Optional[in
             match = re.search(r"bytes=(\d+)-(\d+)", range_header)
             if match:
                 return int(match.group(2)) + 1
-        return 0
+        return default
 
     if status in {200, 201}:
         if content:
@@ -210,13 +536,65 @@ def query_upload_status(service: Any, session: UploadSession, total: Optional[in
                     return int(payload["size"])
             except (ValueError, TypeError):
                 pass
-        if total_bytes is not None:
-            return int(total_bytes)
+        if done is not None:
+            return int(done)
+
+    return default
+
+
+def begin_resumable_upload(
+    service: Any,
+    name: str,
+    folder_id: str,
+    size: Optional[int] = None,
+    mime: str = "application/octet-stream",
+    *,
+    policy: Optional[RetryPolicy] = None,
+) -> UploadSession:
+    headers, body = _resumable_upload_request(name, folder_id, size, mime)
+    response, _ = _http_request_with_retries(
+        service, UPLOAD_URL, method="POST", headers=headers, body=body, policy=policy
+    )
+    return _upload_session(response, name=name, folder_id=folder_id, size=size)
 
-    return 0
 
+def query_upload_status(
+    service: Any,
+    session: UploadSession,
+    total: Optional[int] = None,
+    *,
+    policy: Optional[RetryPolicy] = None,
+) -> int:
+    """Return the next expected byte offset for a resumable upload session."""
 
-def upload_chunk(service: Any, session: UploadSession, data: bytes, start: int, end: int, total: Optional[int] = None) -> int:
+    total_bytes = total or session.total
+    range_total = str(total_bytes) if total_bytes is not None else "*"
+    headers = _chunk_headers(0, f"bytes */{range_total}")
+
+    def _do_request():
+        response, content = _authorized_http(service).request(
+            session.session_url,
+            method="PUT",
+            headers=headers,
+            body=b"",
+        )
+        _check_response(response, content, session.session_url)
+        return response, content
+
+    response, content = _execute_with_retries(_do_request, policy, kind="media")
+    return _session_offset(response, content, default=0, done=total_bytes)
+
+
+def upload_chunk(
+    service: Any,
+    session: UploadSession,
+    data: bytes,
+    start: int,
+    end: int,
+    total: Optional[int] = None,
+    *,
+    policy: Optional[RetryPolicy] = None,
+) -> int:
     if end < start:
         raise ValueError("Invalid chunk boundaries")
     if len(data) != end - start + 1:
@@ -224,11 +602,7 @@ def upload_chunk(service: Any, session: UploadSession, data: bytes, start: int,
 
     total_bytes = total or session.total
     range_total = str(total_bytes) if total_bytes is not None else "*"
-    headers = {
-        "Content-Length": str(len(data)),
-        "Content-Range": f"bytes {start}-{end}/{range_total}",
-        "Content-Type": "application/octet-stream",
-    }
+    headers = _chunk_headers(len(data), f"bytes {start}-{end}/{range_total}")
 
     def _do_upload():
         response, content = _authorized_http(service).request(
@@ -237,31 +611,8 @@ def upload_chunk(service: Any, session: UploadSession, data: bytes, start: int,
             headers=headers,
             body=data,
         )
-        status = getattr(response, "status", None)
-        if _should_retry(status):
-            raise HttpError(response, content, uri=session.session_url)
-        if status is not None and status >= 400 and status not in {308}:
-            raise HttpError(response, content, uri=session.session_url)
+        _check_response(response, content, session.session_url)
         return response, content
 
-    response, content = _execute_with_retries(_do_upload)
-    status = getattr(response, "status", None)
-    if status == 308:
-        range_header = response.get("Range") or response.get("range")
-        if range_header:
-            match = re.search(r"bytes=(\d+)-(\d+)", range_header)
-            if match:
-                return int(match.group(2)) + 1
-        return end + 1
-
-    if status in {200, 201}:
-        if content:
-            try:
-                payload = json.loads(content.decode("utf-8"))
-                if "size" in payload:
-                    return int(payload["size"])
-            except (ValueError, TypeError):
-                pass
-        return end + 1
-
-    return end + 1
+    response, content = _execute_with_retries(_do_upload, policy, kind="media", size=len(data))
+    return _session_offset(response, content, default=end + 1)
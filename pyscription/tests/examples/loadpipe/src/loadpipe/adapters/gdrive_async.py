@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Mapping, Optional
+
+import httplib2
+from google_auth_httplib2 import Request as _AuthRequest
+
+from ..errors import LoadpipeError
+from ..retry import RetryPolicy
+from . import gdrive
+from .gdrive import FileMeta, HttpError, UploadSession
+
+try:  # pragma: no cover - optional dependency
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+class AsyncDriveClient:
+    """
+    Non-blocking Drive client on top of ``aiohttp`` for use inside one event loop.
+
+    Requests go through the same retry policy and AIMD limiter as the blocking
+    adapter (``gdrive._aexecute_with_retries``) and raise the same ``HttpError``,
+    so callers handle both APIs alike. Credentials are refreshed off-loop when
+    expired. Use as ``async with AsyncDriveClient(creds) as client: ...``.
+    """
+
+    def __init__(self, credentials: Any, *, session: Any = None, connections: int = 100) -> None:
+        if session is None and aiohttp is None:
+            raise LoadpipeError(
+                "The async Drive client needs aiohttp. Install loadpipe with the 'async' extra."
+            )
+        self._credentials = credentials
+        self._session = session
+        self._owns_session = session is None
+        self._connections = connections
+        self._refresh_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncDriveClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _client_session(self) -> Any:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connections),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _token(self) -> str:
+        if not self._credentials.valid:
+            async with self._refresh_lock:
+                if not self._credentials.valid:
+                    await asyncio.to_thread(self._credentials.refresh, _AuthRequest(httplib2.Http()))
+        return self._credentials.token
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        policy: Optional[RetryPolicy] = None,
+        kind: str = "api",
+        size: Optional[int] = None,
+    ) -> tuple[httplib2.Response, bytes]:
+        """
+        Send one request with retries; returns an httplib2-style ``(response, content)`` pair.
+
+        ``size`` (bytes transferred) lets the limiter compare media latency per MB.
+        """
+
+        async def _once() -> tuple[httplib2.Response, bytes]:
+            request_headers = dict(headers or {})
+            request_headers["Authorization"] = f"Bearer {await self._token()}"
+            async with self._client_session().request(
+                method,
+                url,
+                params=dict(params) if params else None,
+                headers=request_headers,
+                data=body,
+                # 308 is "resume incomplete" for uploads, not a redirect.
+                allow_redirects=method == "GET",
+            ) as resp:
+                content = await resp.read()
+                info = {key.lower(): value for key, value in resp.headers.items()}
+                info["status"] = str(resp.status)
+                info["reason"] = resp.reason or ""
+            response = httplib2.Response(info)
+            gdrive._check_response(response, content, url)
+            return response, content
+
+        return await gdrive._aexecute_with_retries(_once, policy, kind=kind, size=size)
+
+
+async def astat(client: AsyncDriveClient, file_id: str, *, policy: Optional[RetryPolicy] = None) -> FileMeta:
+    _, content = await client.request(
+        "GET",
+        f"{gdrive.FILES_URL}/{file_id}",
+        params={"fields": gdrive._FILE_FIELDS},
+        policy=policy,
+    )
+    return gdrive._file_meta(json.loads(content or b"{}"), fallback_id=file_id)
+
+
+async def alist_files(
+    client: AsyncDriveClient,
+    folder_id: str,
+    pattern: Optional[str] = None,
+    *,
+    mime: Optional[str] = None,
+    fields: Optional[str] = None,
+    page_size: int = gdrive.LIST_PAGE_SIZE,
+    include_folders: bool = False,
+) -> AsyncIterator[FileMeta]:
+    """Async ``gdrive.list_files``: same query pushdown, paging and local glob filter."""
+
+    compiled = gdrive.compile_pattern(pattern, mime)
+    params: dict[str, Any] = {
+        "q": gdrive._list_query(folder_id, compiled, include_folders),
+        "spaces": "drive",
+        "pageSize": page_size,
+        "fields": f"nextPageToken, files({fields or gdrive._FILE_FIELDS})",
+    }
+    while True:
+        _, content = await client.request("GET", gdrive.FILES_URL, params=params)
+        response = json.loads(content or b"{}")
+        for meta in gdrive._listed(response.get("files", []), compiled, include_folders):
+            yield meta
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return
+        params["pageToken"] = page_token
+
+
+async def _adownload(
+    client: AsyncDriveClient, file_id: str, byte_range: str, policy: Optional[RetryPolicy], size: int
+) -> bytes:
+    url = f"{gdrive.FILES_URL}/{file_id}?alt=media"
+    response, content = await client.request(
+        "GET", url, headers={"Range": f"bytes={byte_range}"}, policy=policy, kind="media", size=size
+    )
+    if response.status not in {200, 206}:
+        raise HttpError(response, content, uri=url)
+    return content or b""
+
+
+async def adownload_range(
+    client: AsyncDriveClient,
+    file_id: str,
+    start: int,
+    end: int,
+    *,
+    policy: Optional[RetryPolicy] = None,
+) -> bytes:
+    if start < 0 or end < start:
+        raise ValueError("Invalid byte range")
+    return await _adownload(client, file_id, f"{start}-{end}", policy, end - start + 1)
+
+
+async def adownload_tail(
+    client: AsyncDriveClient, file_id: str, length: int, *, policy: Optional[RetryPolicy] = None
+) -> bytes:
+    if length <= 0:
+        raise ValueError("Invalid tail length")
+    return await _adownload(client, file_id, f"-{length}", policy, length)
+
+
+async def abegin_resumable_upload(
+    client: AsyncDriveClient,
+    name: str,
+    folder_id: str,
+    size: Optional[int] = None,
+    mime: str = "application/octet-stream",
+    *,
+    policy: Optional[RetryPolicy] = None,
+) -> UploadSession:
+    headers, body = gdrive._resumable_upload_request(name, folder_id, size, mime)
+    response, _ = await client.request(
+        "POST", gdrive.UPLOAD_URL, headers=headers, body=body, policy=policy, kind="media"
+    )
+    return gdrive._upload_session(response, name=name, folder_id=folder_id, size=size)
+
+
+async def aquery_upload_status(
+    client: AsyncDriveClient,
+    session: UploadSession,
+    total: Optional[int] = None,
+    *,
+    policy: Optional[RetryPolicy] = None,
+) -> int:
+    """Return the next expected byte offset for a resumable upload session."""
+
+    total_bytes = total or session.total
+    range_total = str(total_bytes) if total_bytes is not None else "*"
+    response, content = await client.request(
+        "PUT",
+        session.session_url,
+        headers=gdrive._chunk_headers(0, f"bytes */{range_total}"),
+        body=b"",
+        policy=policy,
+        kind="media",
+    )
+    return gdrive._session_offset(response, content, default=0, done=total_bytes)
+
+
+async def aupload_chunk(
+    client: AsyncDriveClient,
+    session: UploadSession,
+    data: bytes,
+    start: int,
+    end: int,
+    total: Optional[int] = None,
+    *,
+    policy: Optional[RetryPolicy] = None,
+) -> int:
+    if end < start:
+        raise ValueError("Invalid chunk boundaries")
+    if len(data) != end - start + 1:
+        raise ValueError("Chunk buffer length does not match Content-Range")
+
+    total_bytes = total or session.total
+    range_total = str(total_bytes) if total_bytes is not None else "*"
+    response, content = await client.request(
+        "PUT",
+        session.session_url,
+        headers=gdrive._chunk_headers(len(data), f"bytes {start}-{end}/{range_total}"),
+        body=data,
+        policy=policy,
+        kind="media",
+        size=len(data),
+    )
+    return gdrive._session_offset(response, content, default=end + 1)
+
+
+__all__ = [
+    "AsyncDriveClient",
+    "astat",
+    "alist_files",
+    "adownload_range",
+    "adownload_tail",
+    "abegin_resumable_upload",
+    "aquery_upload_status",
+    "aupload_chunk",
+]
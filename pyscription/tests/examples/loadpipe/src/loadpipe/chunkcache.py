@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Hashable, Optional
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:  # pragma: no cover - optional dependency
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    ghost_hits: int = 0  # 2Q only: misses on recently evicted keys, admitted straight to the hot queue
+    cold_hits: int = 0  # compressed tier only: hits served by decompressing a demoted chunk
+    decompress_s: float = 0.0  # compressed tier only: total time spent in those decompressions
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ChunkCache:
+    """
+    Byte-bounded, thread-safe cache of Drive chunks keyed by chunk index.
+
+    Subclasses implement the replacement policy in ``_lookup``/``_insert``;
+    locking and statistics live here. ``snapshot()`` returns the counters plus
+    the current ``entries``/``bytes`` for logs and metrics. ``on_evict(key,
+    value)``, when set, sees every chunk the policy drops.
+    """
+
+    policy = "base"
+
+    def __init__(self, limit_bytes: int) -> None:
+        self._limit = max(1, limit_bytes)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+        self.on_evict: Optional[Callable[[Hashable, bytes], None]] = None
+
+    def get(self, key: Hashable, *, count: bool = True) -> Optional[bytes]:
+        """Return the cached chunk or ``None``; ``count=False`` re-checks without touching stats."""
+        with self._lock:
+            value = self._lookup(key)
+            if count:
+                if value is None:
+                    self.stats.misses += 1
+                else:
+                    self.stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: bytes) -> None:
+        with self._lock:
+            self._insert(key, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            data = asdict(self.stats)
+            data["hit_rate"] = round(self.stats.hit_rate, 4)
+            data["policy"] = self.policy
+            data["entries"] = self._entry_count()
+            data["bytes"] = self._size
+            return data
+
+    def _evicted(self, key: Hashable, value: bytes) -> None:
+        self.stats.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _lookup(self, key: Hashable) -> Optional[bytes]:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def _insert(self, key: Hashable, value: bytes) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def _entry_count(self) -> int:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class LRUChunkCache(ChunkCache):
+    """Plain least-recently-used eviction."""
+
+    policy = "lru"
+
+    def __init__(self, limit_bytes: int) -> None:
+        super().__init__(limit_bytes)
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+
+    def _lookup(self, key: Hashable) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _insert(self, key: Hashable, value: bytes) -> None:
+        existing = self._entries.pop(key, None)
+        if existing is not None:
+            self._size -= len(existing)
+        self._entries[key] = value
+        self._size += len(value)
+        while self._entries and self._size > self._limit:
+            key, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self._evicted(key, evicted)
+
+    def _entry_count(self) -> int:
+        return len(self._entries)
+
+
+class TwoQChunkCache(ChunkCache):
+    """
+    Scan-resistant 2Q replacement (Johnson & Shasha), sized in bytes.
+
+    New chunks enter a small FIFO (``in_fraction`` of the budget) and leave it
+    without touching the main LRU, so a one-pass scan only churns the FIFO.
+    A chunk is promoted to the main LRU, where footers, dictionary pages and
+    other re-read chunks live, when it is hit again in the FIFO after newer
+    chunks were admitted (hits on the newest chunk are a reader consuming it
+    piecewise, not reuse), or when it is requested again while remembered in
+    the ghost list of keys recently evicted from the FIFO (up to
+    ``ghost_fraction`` of the budget, counted by the evicted sizes).
+    """
+
+    policy = "2q"
+
+    def __init__(self, limit_bytes: int, *, in_fraction: float = 0.25, ghost_fraction: float = 0.5) -> None:
+        super().__init__(limit_bytes)
+        if not 0 < in_fraction < 1:
+            raise ValueError("in_fraction must be between 0 and 1")
+        self._in_limit = max(1, int(self._limit * in_fraction))
+        self._ghost_limit = max(1, int(self._limit * ghost_fraction))
+        self._in: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._in_size = 0
+        self._main: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._ghosts: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._ghost_size = 0
+
+    def _lookup(self, key: Hashable) -> Optional[bytes]:
+        entry = self._main.get(key)
+        if entry is not None:
+            self._main.move_to_end(key)
+            return entry
+        entry = self._in.get(key)
+        if entry is not None and key != next(reversed(self._in)):
+            del self._in[key]
+            self._in_size -= len(entry)
+            self._main[key] = entry
+        return entry
+
+    def _insert(self, key: Hashable, value: bytes) -> None:
+        self._discard(key)
+        if key in self._ghosts:
+            self._ghost_size -= self._ghosts.pop(key)
+            self.stats.ghost_hits += 1
+            self._main[key] = value
+        else:
+            self._in[key] = value
+            self._in_size += len(value)
+        self._size += len(value)
+        self._reclaim()
+
+    def _discard(self, key: Hashable) -> None:
+        for queue in (self._in, self._main):
+            existing = queue.pop(key, None)
+            if existing is not None:
+                self._size -= len(existing)
+                if queue is self._in:
+                    self._in_size -= len(existing)
+
+    def _reclaim(self) -> None:
+        while self._size > self._limit and (self._in or self._main):
+            if self._in and (self._in_size > self._in_limit or not self._main):
+                key, evicted = self._in.popitem(last=False)
+                self._in_size -= len(evicted)
+                self._ghosts[key] = len(evicted)
+                self._ghost_size += len(evicted)
+                while self._ghost_size > self._ghost_limit and self._ghosts:
+                    _, size = self._ghosts.popitem(last=False)
+                    self._ghost_size -= size
+            else:
+                key, evicted = self._main.popitem(last=False)
+            self._size -= len(evicted)
+            self._evicted(key, evicted)
+
+    def _entry_count(self) -> int:
+        return len(self._in) + len(self._main)
+
+
+@dataclass(frozen=True)
+class Codec:
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _zstd_codec(level: Optional[int]) -> Codec:
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+    decompressor = zstandard.ZstdDecompressor()
+    return Codec("zstd", compressor.compress, decompressor.decompress)
+
+
+def _lz4_codec(level: Optional[int]) -> Codec:
+    return Codec(
+        "lz4",
+        lambda data: lz4_frame.compress(data, compression_level=level or 0),
+        lz4_frame.decompress,
+    )
+
+
+def _zlib_codec(level: Optional[int]) -> Codec:
+    return Codec("zlib", lambda data: zlib.compress(data, 1 if level is None else level), zlib.decompress)
+
+
+# Preference order for "auto"; zlib (stdlib) is always available.
+CODECS: dict[str, tuple[Callable[[], bool], Callable[[Optional[int]], Codec]]] = {
+    "zstd": (lambda: zstandard is not None, _zstd_codec),
+    "lz4": (lambda: lz4_frame is not None, _lz4_codec),
+    "zlib": (lambda: True, _zlib_codec),
+}
+
+
+def resolve_codec(name: str = "auto", level: Optional[int] = None) -> Codec:
+    """Codec by name (``zstd``, ``lz4``, ``zlib``), or the first installed one for ``auto``."""
+    if name == "auto":
+        name = next(candidate for candidate, (available, _) in CODECS.items() if available())
+    try:
+        available, factory = CODECS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown cache compression {name!r}; expected auto or one of {', '.join(CODECS)}"
+        ) from None
+    if not available():
+        raise ValueError(f"Cache compression {name!r} is not installed; use 'auto' to pick an available codec")
+    return factory(level)
+
+
+class CompressedChunkCache(ChunkCache):
+    """
+    Two-tier cache: raw chunks in a hot ``policy`` cache, demoted chunks compressed.
+
+    The hot tier gets ``hot_fraction`` of the budget; chunks it evicts are
+    compressed into a cold LRU that holds the rest, counted by compressed size.
+    A cold hit decompresses the chunk and moves it back to the hot tier, so
+    repeated reads of the same chunk pay for decompression once. Chunks that do
+    not shrink are kept as-is. ``snapshot()`` adds the codec, the compression
+    ratio of everything demoted so far, and ``cold_hits``/``decompress_s``.
+    """
+
+    policy = "compressed"
+
+    def __init__(
+        self,
+        limit_bytes: int,
+        *,
+        hot: "str | Callable[[int], ChunkCache]" = "lru",
+        hot_fraction: float = 0.5,
+        codec: "str | Codec" = "auto",
+    ) -> None:
+        super().__init__(limit_bytes)
+        if not 0 < hot_fraction < 1:
+            raise ValueError("hot_fraction must be between 0 and 1")
+        hot_limit = max(1, int(self._limit * hot_fraction))
+        self._hot = make_chunk_cache(hot, hot_limit)
+        self._hot.on_evict = self._demote
+        self._codec = resolve_codec(codec) if isinstance(codec, str) else codec
+        self._cold_limit = max(1, self._limit - hot_limit)
+        self._cold: "OrderedDict[Hashable, tuple[bytes, bool]]" = OrderedDict()
+        self._cold_size = 0
+        self._raw_in = 0
+        self._stored_out = 0
+        self.policy = f"{self._hot.policy}+{self._codec.name}"
+
+    def _lookup(self, key: Hashable) -> Optional[bytes]:
+        value = self._hot.get(key, count=False)
+        if value is not None:
+            return value
+        entry = self._cold.pop(key, None)
+        if entry is None:
+            return None
+        payload, compressed = entry
+        self._cold_size -= len(payload)
+        if compressed:
+            started = time.perf_counter()
+            value = self._codec.decompress(payload)
+            self.stats.decompress_s += time.perf_counter() - started
+        else:
+            value = payload
+        self.stats.cold_hits += 1
+        self._hot.put(key, value)
+        self._resize()
+        return value
+
+    def _insert(self, key: Hashable, value: bytes) -> None:
+        entry = self._cold.pop(key, None)
+        if entry is not None:
+            self._cold_size -= len(entry[0])
+        self._hot.put(key, value)
+        self._resize()
+
+    def _demote(self, key: Hashable, value: bytes) -> None:
+        payload = self._codec.compress(value)
+        compressed = len(payload) < len(value)
+        if not compressed:
+            payload = value
+        self._raw_in += len(value)
+        self._stored_out += len(payload)
+        if len(payload) > self._cold_limit:
+            self.stats.evictions += 1
+            return
+        self._cold[key] = (payload, compressed)
+        self._cold_size += len(payload)
+        while self._cold_size > self._cold_limit:
+            _, (dropped, _) = self._cold.popitem(last=False)
+            self._cold_size -= len(dropped)
+            self.stats.evictions += 1
+
+    def _resize(self) -> None:
+        self._size = self._hot._size + self._cold_size
+
+    def _entry_count(self) -> int:
+        return self._hot._entry_count() + len(self._cold)
+
+    def snapshot(self) -> dict[str, Any]:
+        data = super().snapshot()
+        hot = self._hot.snapshot()
+        with self._lock:
+            data["ghost_hits"] = hot["ghost_hits"]
+            data["codec"] = self._codec.name
+            data["hot_bytes"] = hot["bytes"]
+            data["cold_bytes"] = self._cold_size
+            data["cold_entries"] = len(self._cold)
+            data["compression_ratio"] = round(self._raw_in / self._stored_out, 3) if self._stored_out else None
+            data["decompress_s"] = round(self.stats.decompress_s, 6)
+        return data
+
+
+CACHE_POLICIES: dict[str, Callable[[int], ChunkCache]] = {
+    "lru": LRUChunkCache,
+    "2q": TwoQChunkCache,
+}
+
+
+def make_chunk_cache(
+    policy: "str | Callable[[int], ChunkCache]",
+    limit_bytes: int,
+    *,
+    compression: Optional[str] = None,
+) -> ChunkCache:
+    """
+    Build a cache from a policy name in ``CACHE_POLICIES`` or a ``factory(limit_bytes)``.
+
+    With ``compression`` (a codec name or ``auto``) the policy becomes the hot
+    tier of a ``CompressedChunkCache`` sharing the same budget.
+    """
+    if compression:
+        return CompressedChunkCache(limit_bytes, hot=policy, codec=compression)
+    if callable(policy):
+        return policy(limit_bytes)
+    try:
+        factory = CACHE_POLICIES[policy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown cache policy {policy!r}; expected one of {', '.join(sorted(CACHE_POLICIES))}"
+        ) from None
+    return factory(limit_bytes)
+
+
+__all__ = [
+    "CACHE_POLICIES",
+    "CODECS",
+    "CacheStats",
+    "ChunkCache",
+    "Codec",
+    "CompressedChunkCache",
+    "LRUChunkCache",
+    "TwoQChunkCache",
+    "make_chunk_cache",
+    "resolve_codec",
+]
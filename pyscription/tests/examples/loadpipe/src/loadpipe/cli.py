@@ -1,20 +1,27 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Callable, Iterable, Iterator, Optional
+from typing import Callable, Iterable, Iterator, List, Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from . import __version__
-from .config import Config, ConfigError
-from .errors import LoadpipeError
+from .config import Config, ConfigError, ProcessConfig
+from .errors import CircuitOpenError, IntegrityError, LoadpipeError
+from .io.chunking import UPLOAD_ALIGNMENT, ChunkSizer
+from .limiter import AdaptiveLimiter
 from .log import get_logger
-from .state import Manifest
+from .retry import RetryPolicy
+from .state import Manifest, SharedManifest
 
 app = typer.Typer(no_args_is_help=True, help="loadpipe CLI")
 console = Console()
@@ -58,20 +65,116 @@ def _require_drive_modules():
 
 def _build_service(cfg: Config):
     oauth, gdrive = _require_drive_modules()
+    # One retry policy (budget, breaker, stats) and one AIMD concurrency limiter
+    # for every Drive call of this run.
+    gdrive.set_retry_policy(RetryPolicy.from_config(cfg.runtime))
+    gdrive.set_limiter(AdaptiveLimiter.from_config(cfg.runtime))
     creds = oauth.credentials(cfg.auth)
     service = gdrive.build_service(creds)
     return service, gdrive
 
 
+def _log_drive_stats(logger: logging.Logger, gdrive, hedger=None) -> None:
+    logger.info("retry stats", extra={"ctx": gdrive.get_retry_policy().snapshot()})
+    logger.info("concurrency stats", extra={"ctx": gdrive.get_limiter().snapshot()})
+    if hedger is not None:
+        logger.info("hedge stats", extra={"ctx": hedger.snapshot()})
+        hedger.close()
+
+
+def _service_pool(cfg: Config, service):
+    """Per-thread services for concurrent Drive calls; the calling thread reuses ``service``."""
+    oauth, gdrive = _require_drive_modules()
+    creds = oauth.credentials(cfg.auth)
+    return gdrive.ServicePool(lambda: gdrive.build_service(creds), primary=service)
+
+
+def _iter_source(
+    cfg: Config,
+    service,
+    gdrive,
+    folder_id: str,
+    pattern: Optional[str],
+    *,
+    fields: Optional[str] = None,
+    manifest: Optional[Manifest] = None,
+    newest_first: bool = False,
+    limit: Optional[int] = None,
+):
+    if manifest is not None and cfg.source.listing_refresh and not cfg.source.recursive:
+        from . import listing
+
+        return listing.cached_files(
+            service,
+            manifest,
+            folder_id,
+            pattern,
+            mime=cfg.source.mime,
+            policy=cfg.source.listing_refresh,
+            ttl_s=cfg.source.listing_ttl_s,
+            newest_first=newest_first,
+            limit=limit,
+        )
+    if cfg.source.recursive:
+        return gdrive.walk_files(
+            _service_pool(cfg, service),
+            folder_id,
+            pattern,
+            mime=cfg.source.mime,
+            max_depth=cfg.source.max_depth,
+            fan_out=cfg.source.fan_out,
+            fields=fields,
+        )
+    return gdrive.list_files(service, folder_id, pattern=pattern, mime=cfg.source.mime, fields=fields)
+
+
+def _hedger(cfg: Config, service, *, workers: Optional[int] = None):
+    """
+    Range-request hedger for ``download.hedge``; ``None`` when hedging is off.
+
+    ``workers`` is the effective download concurrency (``--workers`` overrides
+    ``download.workers``) and sizes the hedge executor.
+    """
+    if not cfg.download.hedge:
+        return None
+    from .hedging import Hedger
+
+    return Hedger(
+        _service_pool(cfg, service),
+        percentile=cfg.download.hedge_percentile,
+        budget=cfg.download.hedge_budget,
+        concurrency=workers or cfg.download.workers,
+    )
+
+
 def _manifest(cfg: Config) -> Manifest:
     return Manifest(cfg.runtime.state_db)
 
 
+_LIST_FIELDS = "id, name, size, modifiedTime"
+
+
 def _bytes_from_mb(value: Optional[int], fallback: int) -> int:
     mb_value = value if value is not None else fallback
     return max(1, mb_value) * 1024 * 1024
 
 
+def _chunk_sizer(section, chunk_mb: Optional[int] = None, *, alignment: int = 1) -> ChunkSizer:
+    """Chunk sizer for ``download``/``upload`` config; ``--chunk-mb`` overrides the upper bound."""
+    maximum = _bytes_from_mb(chunk_mb, section.chunk_mb)
+    if not section.adaptive:
+        return ChunkSizer.fixed(maximum, alignment=alignment)
+    return ChunkSizer(minimum=section.min_chunk_kb * 1024, maximum=maximum, alignment=alignment)
+
+
+def _output_target(destination: Optional[str], default_name: str) -> Path:
+    target = Path(destination or default_name)
+    if not target.name:
+        target = target / default_name
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return target
+
+
 def _write_stream(stream: Iterable[bytes], *, destination: Optional[str], default_name: str) -> str:
     total = 0
     if destination == "-":
@@ -82,10 +185,7 @@ def _write_stream(stream: Iterable[bytes], *, destination: Optional[str], defaul
         out.flush()
         return f"stdout ({total} bytes)"
 
-    target = Path(destination or default_name)
-    if not target.name:
-        target = target / default_name
-    target.parent.mkdir(parents=True, exist_ok=True)
+    target = _output_target(destination, default_name)
     with target.open("wb") as fh:
         for chunk in stream:
             fh.write(chunk)
@@ -93,6 +193,59 @@ def _write_stream(stream: Iterable[bytes], *, destination: Optional[str], defaul
     return f"{target} ({total} bytes)"
 
 
+def _write_in_place(
+    open_stream: Callable[[int], Iterable[bytes]],
+    meta,
+    *,
+    target: Path,
+    logger: logging.Logger,
+) -> str:
+    """
+    Download ``meta`` into ``target`` through a preallocated partial file written at offsets.
+
+    A partial left by an interrupted pull of the same revision is continued where
+    its progress sidecar says it stopped; anything else starts from 0. Once every
+    byte is written the partial is checked against the Drive md5 (when known) and
+    renamed over ``target``; a mismatch discards it so the next pull starts over.
+    """
+
+    from .io import output
+
+    part = output.partial_path(target, meta.id)
+    start = output.resume_offset(part, meta)
+    if start:
+        logger.info("Resuming %s in place at byte %s of %s", target, start, meta.size)
+    offset = start
+    # From byte 0 the md5 is computed as chunks arrive; a resumed partial is re-read at the end.
+    digest = hashlib.md5() if meta.md5 and not start else None
+    with output.OffsetFile(part, meta.size) as out:
+        for chunk in open_stream(start):
+            out.pwrite(chunk, offset)
+            offset += len(chunk)
+            if digest is not None:
+                digest.update(chunk)
+            output.record_progress(part, meta, offset)
+        if offset != meta.size:
+            raise LoadpipeError(
+                f"Download of {meta.name or meta.id} stopped at byte {offset} of {meta.size}.",
+                context={"file_id": meta.id, "partial": str(part)},
+            )
+        out.sync()
+    if meta.md5:
+        actual = digest.hexdigest() if digest is not None else output.file_md5(part)
+        if actual != meta.md5:
+            os.remove(part)
+            output.clear_progress(part)
+            raise IntegrityError(
+                f"Download of {meta.name or meta.id} failed the md5 check; the partial output was discarded.",
+                context={"file_id": meta.id, "expected": meta.md5, "actual": actual},
+            )
+    os.replace(part, target)
+    output.clear_progress(part)
+    resumed = f", resumed at {start}" if start else ""
+    return f"{target} ({meta.size} bytes{resumed})"
+
+
 def _handle_failure(exc: Exception, *, exit_code: int = 1) -> "NoReturn":
     if isinstance(exc, LoadpipeError):
         _print_error(str(exc), hint=getattr(exc, "hint", None))
@@ -101,12 +254,18 @@ def _handle_failure(exc: Exception, *, exit_code: int = 1) -> "NoReturn":
     raise typer.Exit(code=exit_code) from exc
 
 
-def _processor(kind: str) -> Callable[[Iterable[bytes]], Iterator[bytes]]:
-    if kind == "identity":
-        from .processing import identity
+def _processor(process: ProcessConfig) -> Callable[[Iterable[bytes]], Iterator[bytes]]:
+    from .processing import get_processor
 
-        return identity
-    raise typer.BadParameter(f"Unknown processor kind: {kind}")
+    try:
+        return get_processor(
+            process.kind,
+            workers=process.workers,
+            columns=process.columns,
+            filters=process.filters,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
 
 
 @app.command(help="Show package version")
@@ -138,36 +297,276 @@ def auth_login(
 @app.command("list", help="List files within a Drive folder (id, name, size, modified)")
 def list_cmd(
     folder: Optional[str] = typer.Option(None, "--folder", help="Drive folder ID"),
-    pattern: Optional[str] = typer.Option(None, "--pattern", help="Glob-ish filter e.g. '*.zst'"),
+    pattern: Optional[str] = typer.Option(None, "--pattern", help="Glob filter e.g. '*.zst'"),
+    mime: Optional[str] = typer.Option(None, "--mime", help="Exact mimeType filter (default: source.mime)"),
+    plain: bool = typer.Option(False, "--plain", help="Stream tab-separated rows instead of rendering a table"),
+    recursive: Optional[bool] = typer.Option(None, "--recursive/--no-recursive", help="Walk subfolders (default: source.recursive)"),
+    max_depth: Optional[int] = typer.Option(None, "--max-depth", min=0, help="Deepest subfolder level to walk"),
+    fan_out: Optional[int] = typer.Option(None, "--fan-out", min=1, help="Folders listed concurrently when recursive"),
+    refresh: Optional[str] = typer.Option(
+        None, "--refresh", help="Serve from the manifest listing index: ttl, force or delta (default: source.listing_refresh)"
+    ),
     config: Optional[str] = typer.Option("configs/config.yaml", "--config", help="Path to config file"),
 ):
     cfg = _load_config_or_exit(config)
+    if refresh is not None:
+        if refresh not in {"ttl", "force", "delta"}:
+            raise typer.BadParameter("--refresh must be one of ttl, force, delta")
+        cfg.source.listing_refresh = refresh
+    if mime is not None:
+        cfg.source.mime = mime
+    if recursive is not None:
+        cfg.source.recursive = recursive
+    if max_depth is not None:
+        cfg.source.max_depth = max_depth
+    if fan_out is not None:
+        cfg.source.fan_out = fan_out
     folder_id = folder or cfg.source.folder_id
     if not folder_id:
         console.print("[red]Missing folder_id (--folder flag or source.folder_id in configs/config.yaml).[/red]")
         raise typer.Exit(code=2)
 
     service, gdrive = _build_service(cfg)
-    files = gdrive.list_files(service, folder_id, pattern=pattern)
-    table = Table(title=f"Files in {folder_id}")
-    table.add_column("id")
-    table.add_column("name")
-    table.add_column("size", justify="right")
-    table.add_column("modified")
-    for f in files:
-        table.add_row(f.id, f.name, str(f.size or "-"), f.modified or "-")
+    with _manifest(cfg) as manifest:
+        files = _iter_source(cfg, service, gdrive, folder_id, pattern, fields=_LIST_FIELDS, manifest=manifest)
+        if plain:
+            # Stream rows as pages arrive so huge folders list in bounded memory.
+            for f in files:
+                console.print(f"{f.id}\t{f.path or f.name}\t{f.size or '-'}\t{f.modified or '-'}", markup=False, highlight=False)
+            return
+        table = Table(title=f"Files in {folder_id}")
+        table.add_column("id")
+        table.add_column("path" if cfg.source.recursive else "name")
+        table.add_column("size", justify="right")
+        table.add_column("modified")
+        for f in files:
+            table.add_row(f.id, f.path or f.name, str(f.size or "-"), f.modified or "-")
     console.print(table)
 
 
-@app.command("pull", help="Download a Drive file into stdout or a file on disk")
+def _pull_file(
+    cfg: Config,
+    download_mod,
+    service,
+    manifest,
+    meta,
+    *,
+    out: Optional[str],
+    sizer: ChunkSizer,
+    logger: logging.Logger,
+    hedger=None,
+) -> str:
+    """Download one file to ``out`` (a path, or ``-`` for stdout); returns a label for the summary."""
+
+    cache_target = None
+    if cfg.runtime.cache_dir:
+        cache_target = os.fspath(Path(cfg.runtime.cache_dir) / f"{meta.id}.cache")
+
+    def _open_stream(start: Optional[int] = None) -> Iterator[bytes]:
+        return download_mod.download_iter(
+            service=service,
+            manifest=manifest,
+            file_meta=meta,
+            chunk_size=sizer.maximum,
+            chunk_sizer=sizer,
+            logger=logger,
+            cache_path=cache_target,
+            hedger=hedger,
+            start=start,
+        )
+
+    if out == "-" or meta.size is None:
+        return _write_stream(_open_stream(0), destination=out, default_name=meta.name or meta.id)
+    return _write_in_place(
+        _open_stream,
+        meta,
+        target=_output_target(out, meta.name or meta.id),
+        logger=logger,
+    )
+
+
+def _read_ids(path: str) -> Iterator[str]:
+    """File ids from ``path`` (``-`` for stdin), one per line; blank lines and ``#`` comments are skipped."""
+    handle = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        for line in handle:
+            file_id = line.split("#", 1)[0].strip()
+            if file_id:
+                yield file_id
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def _unique_sources(groups: Iterable[Iterable]) -> Iterator:
+    """Chain file ids and listed files, skipping ids already seen."""
+    seen: set[str] = set()
+    for group in groups:
+        for source in group:
+            file_id = source if isinstance(source, str) else source.id
+            if file_id not in seen:
+                seen.add(file_id)
+                yield source
+
+
+def _rate(size: int, seconds: float) -> float:
+    return size / seconds / (1024 * 1024) if seconds > 0 else 0.0
+
+
+def _safe_component(name: str) -> str:
+    """One path component of a Drive name, with separators replaced; ``.``/``..`` are refused."""
+    name = name.replace("/", "_").replace("\\", "_").replace("\0", "_").strip()
+    if name in {"", ".", ".."}:
+        raise ValueError(f"Refusing unsafe output name: {name!r}")
+    return name
+
+
+def _output_relative(meta) -> str:
+    """Relative output path for ``meta``: its walk path (or name, or id) made safe component by component."""
+    name = meta.name or meta.id
+    parents: list[str] = []
+    if meta.path and meta.name and meta.path.endswith(meta.name):
+        # ``walk_files`` joins folder names with "/"; the file name itself is the known tail.
+        parents = [part for part in meta.path[: -len(meta.name)].split("/") if part]
+    return "/".join([*(_safe_component(part) for part in parents), _safe_component(name)])
+
+
+def _pull_many(
+    cfg: Config,
+    service,
+    gdrive,
+    download_mod,
+    sources: Iterable,
+    *,
+    manifest: SharedManifest,
+    directory: Path,
+    chunk_mb: Optional[int],
+    workers: int,
+    logger: logging.Logger,
+    hedger=None,
+) -> list[tuple[str, str]]:
+    """
+    Pull every source (a file id, or a listed ``FileMeta``) into ``directory``.
+
+    ``workers`` threads share one ``ServicePool`` and the caller's
+    ``SharedManifest``; ids are ``stat``ed by the worker that downloads them.
+    Listed subfolders are skipped, and every output path must stay inside
+    ``directory``. At most ``2 * workers`` files are queued ahead, so a large
+    listing streams through in bounded memory. Each file is reported with its throughput as it completes, followed
+    by the aggregate. Returns ``(source, error)`` for the files that failed.
+    """
+
+    pool = _service_pool(cfg, service)
+    root = directory.resolve()
+    taken: set[str] = set()
+    taken_lock = threading.Lock()
+
+    def _relative(meta) -> str:
+        relative = _output_relative(meta)
+        if not (root / relative).resolve().is_relative_to(root):
+            raise ValueError(f"Output path {relative!r} escapes {directory}")
+        with taken_lock:
+            if relative in taken:
+                # Same name twice (e.g. Drive allows duplicates in a folder): keep both.
+                head, _, tail = relative.rpartition("/")
+                relative = f"{head}/{meta.id}-{tail}" if head else f"{meta.id}-{tail}"
+            taken.add(relative)
+        return relative
+
+    def _one(source) -> tuple[object, str, float]:
+        worker_service = pool.get()
+        meta = gdrive.stat(worker_service, source) if isinstance(source, str) else source
+        started = time.monotonic()
+        label = _pull_file(
+            cfg,
+            download_mod,
+            worker_service,
+            manifest,
+            meta,
+            out=os.fspath(directory / _relative(meta)),
+            sizer=_chunk_sizer(cfg.download, chunk_mb),
+            logger=logger,
+            hedger=hedger,
+        )
+        return meta, label, time.monotonic() - started
+
+    pulled = 0
+    pulled_bytes = 0
+    failures: list[tuple[str, str]] = []
+
+    def _report(future, source) -> None:
+        nonlocal pulled, pulled_bytes
+        try:
+            meta, label, seconds = future.result()
+        except Exception as exc:
+            label = source if isinstance(source, str) else f"{source.name} ({source.id})"
+            failures.append((label, str(exc)))
+            err_console.print(f"[red]Failed {label}: {exc}[/red]")
+            return
+        size = meta.size or 0
+        pulled += 1
+        pulled_bytes += size
+        logger.info(
+            "pulled file",
+            extra={"ctx": {"file_id": meta.id, "bytes": size, "seconds": round(seconds, 3), "mb_s": round(_rate(size, seconds), 2)}},
+        )
+        err_console.print(f"[green]{meta.name or meta.id} → {label} in {seconds:.2f}s ({_rate(size, seconds):.1f} MB/s)[/green]")
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lp-pull") as executor:
+        pending: dict = {}
+        for source in sources:
+            if not isinstance(source, str) and source.mime == gdrive.FOLDER_MIME:
+                continue
+            pending[executor.submit(_one, source)] = source
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _report(future, pending.pop(future))
+        for future in wait(pending).done:
+            _report(future, pending[future])
+
+    seconds = time.monotonic() - started
+    summary = {
+        "files": pulled,
+        "failed": len(failures),
+        "bytes": pulled_bytes,
+        "seconds": round(seconds, 3),
+        "mb_s": round(_rate(pulled_bytes, seconds), 2),
+        "files_s": round(pulled / seconds, 2) if seconds > 0 else 0.0,
+    }
+    logger.info("pull stats", extra={"ctx": summary})
+    err_console.print(
+        f"[green]Pulled {pulled} files, {pulled_bytes} bytes in {seconds:.1f}s "
+        f"({summary['mb_s']:.1f} MB/s, {summary['files_s']:.1f} files/s)[/green]"
+        + (f" [red]{len(failures)} failed[/red]" if failures else "")
+    )
+    return failures
+
+
+@app.command("pull", help="Download Drive files into stdout, a file, or a directory")
 def pull_cmd(
-    file: str = typer.Option(..., "--file", help="Drive file ID"),
-    chunk_mb: Optional[int] = typer.Option(None, "--chunk-mb", min=1, help="Chunk size in megabytes"),
-    out: Optional[str] = typer.Option(None, "--out", help="Path to output file or '-' for stdout"),
+    file: Optional[List[str]] = typer.Option(None, "--file", help="Drive file ID (repeat for several files)"),
+    folder: Optional[str] = typer.Option(None, "--folder", help="Pull every file of a Drive folder"),
+    pattern: Optional[str] = typer.Option(None, "--pattern", help="Glob filter for --folder e.g. '*.parquet'"),
+    ids_file: Optional[str] = typer.Option(None, "--ids-file", help="File with one Drive file ID per line ('-' for stdin)"),
+    chunk_mb: Optional[int] = typer.Option(None, "--chunk-mb", min=1, help="Max chunk size in megabytes"),
+    out: Optional[str] = typer.Option(
+        None, "--out", help="Output file or '-' for stdout; the output directory when pulling several files"
+    ),
+    workers: Optional[int] = typer.Option(None, "--workers", min=1, help="Files pulled concurrently (default: download.workers)"),
     config: Optional[str] = typer.Option("configs/config.yaml", "--config", help="Path to config file"),
 ):
     cfg = _load_config_or_exit(config)
-    chunk_size = _bytes_from_mb(chunk_mb, cfg.download.chunk_mb)
+    files = list(file or [])
+    if not files and not folder and not ids_file:
+        _print_error("Nothing to pull.", hint="Pass --file, --folder or --ids-file.")
+        raise typer.Exit(code=2)
+    bulk = len(files) > 1 or folder is not None or ids_file is not None
+    if bulk and out == "-":
+        _print_error("--out - only works for a single --file.")
+        raise typer.Exit(code=2)
+
     logger = _get_logger(cfg)
     service, gdrive = _build_service(cfg)
 
@@ -175,34 +574,60 @@ def pull_cmd(
         from .io import download as download_mod
     except Exception as exc:
         _handle_failure(exc)
+    workers = workers or cfg.download.workers
+    hedger = _hedger(cfg, service, workers=workers)
+
+    if bulk:
+        try:
+            directory = Path(out or ".")
+            directory.mkdir(parents=True, exist_ok=True)
+            # One connection for the listing index and the workers' progress.
+            with SharedManifest(cfg.runtime.state_db) as manifest:
+                sources: list[Iterable] = [files]
+                if ids_file is not None:
+                    sources.append(_read_ids(ids_file))
+                if folder is not None:
+                    sources.append(_iter_source(cfg, service, gdrive, folder, pattern, manifest=manifest))
+                failures = _pull_many(
+                    cfg,
+                    service,
+                    gdrive,
+                    download_mod,
+                    _unique_sources(sources),
+                    manifest=manifest,
+                    directory=directory,
+                    chunk_mb=chunk_mb,
+                    workers=workers,
+                    logger=logger,
+                    hedger=hedger,
+                )
+        except Exception as exc:
+            _handle_failure(exc)
+        finally:
+            _log_drive_stats(logger, gdrive, hedger)
+        if failures:
+            raise typer.Exit(code=1)
+        return
 
+    sizer = _chunk_sizer(cfg.download, chunk_mb)
     try:
-        meta = gdrive.stat(service, file)
-        cache_target = None
-        if cfg.runtime.cache_dir:
-            cache_target = os.fspath(Path(cfg.runtime.cache_dir) / f"{meta.id}.cache")
-
+        meta = gdrive.stat(service, files[0])
         with _manifest(cfg) as manifest:
-            stream = download_mod.download_iter(
-                service=service,
-                manifest=manifest,
-                file_meta=meta,
-                chunk_size=chunk_size,
-                logger=logger,
-                retries=cfg.runtime.retries,
-                cache_path=cache_target,
+            dest_label = _pull_file(
+                cfg, download_mod, service, manifest, meta, out=out, sizer=sizer, logger=logger, hedger=hedger
             )
-            dest_label = _write_stream(stream, destination=out, default_name=meta.name or meta.id)
         err_console.print(f"[green]Downloaded {meta.name or meta.id} → {dest_label}[/green]")
     except Exception as exc:
         _handle_failure(exc)
+    finally:
+        _log_drive_stats(logger, gdrive, hedger)
 
 
 @app.command("push", help="Upload stdin to Drive")
 def push_cmd(
     folder: Optional[str] = typer.Option(None, "--folder", help="Drive folder ID"),
     name: str = typer.Option("out.bin", "--name", help="Drive filename"),
-    chunk_mb: Optional[int] = typer.Option(None, "--chunk-mb", min=1, help="Chunk size in megabytes"),
+    chunk_mb: Optional[int] = typer.Option(None, "--chunk-mb", min=1, help="Max upload chunk size in megabytes"),
     config: Optional[str] = typer.Option("configs/config.yaml", "--config", help="Path to config file"),
 ):
     cfg = _load_config_or_exit(config)
@@ -211,9 +636,9 @@ def push_cmd(
         _print_error("Missing upload.folder_id (--folder flag or upload.folder_id in configs/config.yaml).")
         raise typer.Exit(code=2)
 
-    chunk_size = _bytes_from_mb(chunk_mb, cfg.download.chunk_mb)
+    sizer = _chunk_sizer(cfg.upload, chunk_mb, alignment=UPLOAD_ALIGNMENT)
     logger = _get_logger(cfg)
-    service, _ = _build_service(cfg)
+    service, gdrive = _build_service(cfg)
 
     try:
         from .io import upload as upload_mod
@@ -222,7 +647,7 @@ def push_cmd(
 
     def _stdin_chunks() -> Iterator[bytes]:
         while True:
-            chunk = sys.stdin.buffer.read(chunk_size)
+            chunk = sys.stdin.buffer.read(sizer.minimum)
             if not chunk:
                 break
             yield chunk
@@ -238,16 +663,90 @@ def push_cmd(
                 folder_id=folder_id,
                 logger=logger,
                 total=None,
-                retries=cfg.runtime.retries,
+                chunk_sizer=sizer,
             ):
                 pass
         err_console.print(f"[green]Uploaded {name} to {folder_id} ({uploaded} bytes).[/green]")
     except Exception as exc:
         _handle_failure(exc)
+    finally:
+        _log_drive_stats(logger, gdrive)
+
+
+def _dest_name(meta, suffix: str) -> str:
+    dest_name = meta.name or meta.id
+    if suffix:
+        if meta.name:
+            stem, ext = os.path.splitext(meta.name)
+            dest_name = f"{stem}{suffix}{ext}"
+        else:
+            dest_name = f"{meta.id}{suffix}"
+    return dest_name
+
+
+def _sync_file(cfg: Config, service, gdrive, meta, *, processor, logger: logging.Logger, hedger=None) -> None:
+    """Copy or stream one source file into ``upload.folder_id``."""
+
+    upload_folder = cfg.upload.folder_id
+    dest_name = _dest_name(meta, cfg.upload.name_suffix)
+
+    if cfg.process.kind == "identity" and cfg.upload.server_copy:
+        # No transform needed: let Drive copy the bytes server-side in a single call.
+        # Whatever the retry policy gives up with (an HTTP error, exhausted transient
+        # errors, an open breaker) falls back to streaming the bytes instead.
+        try:
+            copied = gdrive.copy_file(service, meta.id, name=dest_name, folder_id=upload_folder)
+        except (gdrive.HttpError, CircuitOpenError, ConnectionError, TimeoutError) as exc:
+            logger.warning("Server-side copy refused for %s (%s); falling back to streaming", meta.id, exc)
+        else:
+            err_console.print(
+                f"[green]Synced {meta.name or meta.id} → {copied.name or dest_name} "
+                f"({copied.size or meta.size or 0} bytes, server-side copy) in folder {upload_folder}[/green]"
+            )
+            return
+
+    from .io import download as download_mod
+    from .io import upload as upload_mod
+
+    download_sizer = _chunk_sizer(cfg.download)
+    cache_target = None
+    if cfg.runtime.cache_dir:
+        cache_target = os.fspath(Path(cfg.runtime.cache_dir) / f"{meta.id}.cache")
+
+    with _manifest(cfg) as manifest:
+        download_stream = download_mod.download_iter(
+            service=service,
+            manifest=manifest,
+            file_meta=meta,
+            chunk_size=download_sizer.maximum,
+            chunk_sizer=download_sizer,
+            logger=logger,
+            cache_path=cache_target,
+            hedger=hedger,
+        )
+        processed_stream = processor(download_stream)
+        uploaded = 0
+        for uploaded in upload_mod.upload_iter(
+            service=service,
+            manifest=manifest,
+            data_iter=processed_stream,
+            name=dest_name,
+            folder_id=upload_folder,
+            logger=logger,
+            # Record processors may shrink the payload, so only identity knows the final size.
+            total=meta.size if cfg.process.kind == "identity" else None,
+            chunk_sizer=_chunk_sizer(cfg.upload, alignment=UPLOAD_ALIGNMENT),
+        ):
+            pass
+    err_console.print(
+        f"[green]Synced {meta.name or meta.id} → {dest_name} ({uploaded} bytes) in folder {upload_folder}[/green]"
+    )
 
 
 @app.command("sync", help="Simple pipeline: list → pull → process → push")
 def sync_cmd(
+    follow: bool = typer.Option(False, "--follow", help="Keep running and sync new files via the Drive changes feed"),
+    interval: float = typer.Option(5.0, "--interval", min=0.5, help="Seconds between change-feed polls with --follow"),
     config: Optional[str] = typer.Option("configs/config.yaml", "--config", help="Path to config file"),
 ):
     cfg = _load_config_or_exit(config)
@@ -262,61 +761,72 @@ def sync_cmd(
         raise typer.Exit(code=2)
 
     logger = _get_logger(cfg)
-    chunk_size = _bytes_from_mb(None, cfg.download.chunk_mb)
-    processor = _processor(cfg.process.kind)
+    processor = _processor(cfg.process)
     service, gdrive = _build_service(cfg)
 
+    # Only the newest entry is kept while pages stream in (or a single indexed row is read).
+    with _manifest(cfg) as manifest:
+        newest = max(
+            _iter_source(cfg, service, gdrive, source_folder, pattern, manifest=manifest, newest_first=True, limit=1),
+            key=lambda f: f.modified or "",
+            default=None,
+        )
+    if newest is None and not follow:
+        err_console.print(f"[yellow]No files found in {source_folder} (pattern={pattern or '*'})[/yellow]")
+        return
+
+    hedger = _hedger(cfg, service)
     try:
-        from .io import download as download_mod
-        from .io import upload as upload_mod
+        if newest is not None:
+            _sync_file(cfg, service, gdrive, newest, processor=processor, logger=logger, hedger=hedger)
+        if follow:
+            from . import listing
+
+            err_console.print(f"[cyan]Following changes in {source_folder} (pattern={pattern or '*'})…[/cyan]")
+            with _manifest(cfg) as manifest:
+                for meta in listing.follow(
+                    service,
+                    manifest,
+                    source_folder,
+                    pattern=pattern,
+                    interval=interval,
+                    logger=logger,
+                    cursor="sync",
+                ):
+                    _sync_file(cfg, service, gdrive, meta, processor=processor, logger=logger, hedger=hedger)
+    except KeyboardInterrupt:
+        err_console.print("[yellow]Stopped following changes.[/yellow]")
     except Exception as exc:
         _handle_failure(exc)
+    finally:
+        _log_drive_stats(logger, gdrive, hedger)
 
-    files = gdrive.list_files(service, source_folder, pattern=pattern)
-    if not files:
-        err_console.print(f"[yellow]No files found in {source_folder} (pattern={pattern or '*'})[/yellow]")
-        return
-    files.sort(key=lambda f: f.modified or "", reverse=True)
-    meta = files[0]
-    dest_name = meta.name or meta.id
-    if cfg.upload.name_suffix:
-        if meta.name:
-            stem, ext = os.path.splitext(meta.name)
-            dest_name = f"{stem}{cfg.upload.name_suffix}{ext}"
-        else:
-            dest_name = f"{meta.id}{cfg.upload.name_suffix}"
 
-    cache_target = None
-    if cfg.runtime.cache_dir:
-        cache_target = os.fspath(Path(cfg.runtime.cache_dir) / f"{meta.id}.cache")
+@app.command("watch", help="Print new or modified files in a Drive folder using the changes feed")
+def watch_cmd(
+    folder: Optional[str] = typer.Option(None, "--folder", help="Drive folder ID"),
+    pattern: Optional[str] = typer.Option(None, "--pattern", help="Glob filter e.g. '*.zst'"),
+    interval: float = typer.Option(5.0, "--interval", min=0.5, help="Seconds between change-feed polls"),
+    config: Optional[str] = typer.Option("configs/config.yaml", "--config", help="Path to config file"),
+):
+    cfg = _load_config_or_exit(config)
+    folder_id = folder or cfg.source.folder_id
+    if not folder_id:
+        _print_error("Missing folder_id (--folder flag or source.folder_id in configs/config.yaml).")
+        raise typer.Exit(code=2)
+
+    logger = _get_logger(cfg)
+    service, _ = _build_service(cfg)
+    from . import listing
 
     try:
         with _manifest(cfg) as manifest:
-            download_stream = download_mod.download_iter(
-                service=service,
-                manifest=manifest,
-                file_meta=meta,
-                chunk_size=chunk_size,
-                logger=logger,
-                retries=cfg.runtime.retries,
-                cache_path=cache_target,
-            )
-            processed_stream = processor(download_stream)
-            uploaded = 0
-            for uploaded in upload_mod.upload_iter(
-                service=service,
-                manifest=manifest,
-                data_iter=processed_stream,
-                name=dest_name,
-                folder_id=upload_folder,
-                logger=logger,
-                total=meta.size,
-                retries=cfg.runtime.retries,
+            for meta in listing.follow(
+                service, manifest, folder_id, pattern=pattern, interval=interval, logger=logger, cursor="watch"
             ):
-                pass
-        err_console.print(
-            f"[green]Synced {meta.name or meta.id} → {dest_name} ({uploaded} bytes) in folder {upload_folder}[/green]"
-        )
+                console.print(f"{meta.id}\t{meta.name}\t{meta.size or '-'}\t{meta.modified or '-'}", markup=False, highlight=False)
+    except KeyboardInterrupt:
+        err_console.print("[yellow]Stopped watching.[/yellow]")
     except Exception as exc:
         _handle_failure(exc)
 
@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 import os
 import yaml
 
@@ -12,8 +12,18 @@ class RuntimeConfig:
     cache_dir: str = ".cache/loadpipe"
     state_db: str = ".state/manifest.sqlite"
     cache_limit_gb: int = 30
+    cache_policy: str = "lru"  # random-access chunk cache: "lru" | "2q" (scan-resistant)
+    cache_compression: Optional[str] = None  # compressed cold tier: "auto" | "zstd" | "lz4" | "zlib"
     retries: int = 5
     log_dir: str = ".logs"
+    retry_base_s: float = 1.0
+    retry_max_s: float = 30.0
+    retry_budget: Optional[int] = None
+    breaker_threshold: int = 10
+    breaker_cooldown_s: float = 30.0
+    concurrency_initial: int = 4
+    concurrency_min: int = 1
+    concurrency_max: int = 32
 
 @dataclass
 class AuthConfig:
@@ -25,19 +35,41 @@ class AuthConfig:
 class SourceConfig:
     folder_id: str = ""
     pattern: Optional[str] = None
+    mime: Optional[str] = None
+    recursive: bool = False
+    max_depth: Optional[int] = None
+    fan_out: int = 8
+    listing_refresh: Optional[str] = None  # None = always list live; "ttl" | "force" | "delta" = manifest index
+    listing_ttl_s: int = 300
 
 @dataclass
 class DownloadConfig:
-    chunk_mb: int = 64
+    chunk_mb: int = 64  # upper bound when adaptive
+    min_chunk_kb: int = 1024  # first (and smallest) range when adaptive
+    adaptive: bool = True
+    workers: int = 8  # files pulled concurrently by a multi-file `lp pull`
+    hedge: bool = False  # duplicate range requests slower than hedge_percentile
+    hedge_percentile: float = 0.95
+    hedge_budget: float = 0.05  # max extra requests as a fraction of range requests
+    prefetch_head_kb: int = 0  # random-access opens: fetch this much of the head alongside the stat
+    prefetch_tail_kb: int = 0  # ... and of the tail (Parquet footer, ZIP central directory)
+    prefetch_ranges: List[List[int]] = field(default_factory=list)  # extra [offset, length]; offset < 0 = from EOF
 
 @dataclass
 class ProcessConfig:
     kind: str = "identity"
+    workers: int = 0
+    columns: Optional[List[str]] = None
+    filters: List[Dict[str, Any]] = field(default_factory=list)
 
 @dataclass
 class UploadConfig:
     folder_id: str = ""
     name_suffix: str = ""
+    server_copy: bool = True
+    chunk_mb: int = 16  # upper bound when adaptive
+    min_chunk_kb: int = 256  # rounded up to Drive's 256 KiB upload granularity
+    adaptive: bool = True
 
 @dataclass
 class Config:
@@ -66,8 +98,49 @@ class Config:
             raise ConfigError(f"Invalid config schema: {e}")
 
         # Validation
+        if runtime.cache_policy not in ("lru", "2q"):
+            raise ConfigError("runtime.cache_policy must be one of lru, 2q")
+        if runtime.cache_compression not in (None, "auto", "zstd", "lz4", "zlib"):
+            raise ConfigError("runtime.cache_compression must be one of auto, zstd, lz4, zlib (or null)")
+        if runtime.retries < 0:
+            raise ConfigError("runtime.retries must be >= 0")
+        if runtime.retry_budget is not None and runtime.retry_budget < 0:
+            raise ConfigError("runtime.retry_budget must be >= 0")
+        if not 1 <= runtime.concurrency_min <= runtime.concurrency_max:
+            raise ConfigError("runtime.concurrency_min must be >= 1 and <= runtime.concurrency_max")
         if download.chunk_mb <= 0:
             raise ConfigError("download.chunk_mb must be > 0")
+        if download.workers <= 0:
+            raise ConfigError("download.workers must be > 0")
+        if not 0 < download.hedge_percentile < 1:
+            raise ConfigError("download.hedge_percentile must be between 0 and 1")
+        if download.hedge_budget < 0:
+            raise ConfigError("download.hedge_budget must be >= 0")
+        if download.prefetch_head_kb < 0 or download.prefetch_tail_kb < 0:
+            raise ConfigError("download.prefetch_head_kb and download.prefetch_tail_kb must be >= 0")
+        if not isinstance(download.prefetch_ranges, list) or any(
+            not isinstance(item, (list, tuple)) or len(item) != 2 or item[1] <= 0
+            for item in download.prefetch_ranges
+        ):
+            raise ConfigError("download.prefetch_ranges must be a list of [offset, length] pairs with length > 0")
+        if upload.chunk_mb <= 0:
+            raise ConfigError("upload.chunk_mb must be > 0")
+        if download.min_chunk_kb <= 0 or upload.min_chunk_kb <= 0:
+            raise ConfigError("download.min_chunk_kb and upload.min_chunk_kb must be > 0")
+        if source.fan_out <= 0:
+            raise ConfigError("source.fan_out must be > 0")
+        if source.max_depth is not None and source.max_depth < 0:
+            raise ConfigError("source.max_depth must be >= 0")
+        if source.listing_refresh not in (None, "ttl", "force", "delta"):
+            raise ConfigError("source.listing_refresh must be one of ttl, force, delta (or null)")
+        if source.listing_ttl_s < 0:
+            raise ConfigError("source.listing_ttl_s must be >= 0")
+        if process.workers < 0:
+            raise ConfigError("process.workers must be >= 0")
+        if process.columns is not None and not isinstance(process.columns, list):
+            raise ConfigError("process.columns must be a list of column names")
+        if not isinstance(process.filters, list):
+            raise ConfigError("process.filters must be a list of {column, op, value} entries")
         if source.folder_id == "":
             # allow empty for list/pull/push placeholders, but sync requires it
             pass
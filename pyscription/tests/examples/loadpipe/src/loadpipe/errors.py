@@ -118,3 +118,9 @@ class DrivePathError(LoadpipeError):
     """Raised when a Drive URL cannot be parsed."""
 
     default_message = "Drive URL is invalid."
+
+
+class CircuitOpenError(LoadpipeError):
+    """Raised when the retry circuit breaker rejects a call after repeated failures."""
+
+    default_message = "Drive calls are failing repeatedly; circuit breaker is open."
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import logging
 import os
+import threading
+import weakref
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Any, Callable, Iterable, Iterator, Mapping, MutableMapping, Optional, Union
 
+from fsspec.asyn import AsyncFileSystem, _run_coros_in_chunks, sync
+from fsspec.callbacks import DEFAULT_CALLBACK
 from fsspec.registry import register_implementation
-from fsspec.spec import AbstractFileSystem
 
+from .chunkcache import CACHE_POLICIES, ChunkCache, make_chunk_cache, resolve_codec
 from .errors import DrivePathError, LoadpipeError, StorageOptionsError
-from .state import Manifest
+from .hedging import Hedger
+from .retry import RetryPolicy
+from .state import Manifest, SharedManifest
 from .config import Config
 
 StrPath = Union[str, os.PathLike[str]]
@@ -38,6 +46,20 @@ class DriveStorageOptions:
     logger: logging.Logger
     retries: int
     random_cache_limit: int
+    retry_policy: RetryPolicy
+    cache_policy: Union[str, Callable[[int], ChunkCache]] = "lru"
+    cache_compression: Optional[str] = None
+    credentials_factory: Optional[Callable[[], Any]] = None
+    hedge: bool = False
+    hedge_percentile: float = 0.95
+    hedge_budget: float = 0.05
+    prefetch_head: int = 0
+    prefetch_tail: int = 0
+    prefetch_ranges: tuple[tuple[int, int], ...] = ()
+
+    @property
+    def prefetch(self) -> bool:
+        return bool(self.prefetch_head or self.prefetch_tail or self.prefetch_ranges)
 
 
 @dataclass
@@ -51,7 +73,7 @@ class DriveResource:
     chunk_size: int
 
     def close(self) -> None:
-        """Close manifest handles associated with the resource."""
+        """Release the resource's manifest handle (a no-op for the process-wide manifest)."""
         self.manifest.close()
 
     def __enter__(self) -> "DriveResource":
@@ -61,31 +83,32 @@ class DriveResource:
         self.close()
 
 
-class _LRUChunkCache:
-    def __init__(self, limit_bytes: int) -> None:
-        self._limit = max(1, limit_bytes)
-        self._entries: "OrderedDict[int, bytes]" = OrderedDict()
-        self._size = 0
-
-    def get(self, key: int) -> Optional[bytes]:
-        entry = self._entries.pop(key, None)
-        if entry is None:
-            return None
-        self._entries[key] = entry
-        return entry
+class _SingleFlight:
+    """Collapse concurrent calls for the same key into one; followers wait and share its result."""
 
-    def put(self, key: int, value: bytes) -> None:
-        existing = self._entries.pop(key, None)
-        if existing is not None:
-            self._size -= len(existing)
-        self._entries[key] = value
-        self._size += len(value)
-        self._evict()
-
-    def _evict(self) -> None:
-        while self._entries and self._size > self._limit:
-            _, value = self._entries.popitem(last=False)
-            self._size -= len(value)
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Any, Future] = {}
+
+    def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
 
 
 class _MemoryManifest:
@@ -220,6 +243,27 @@ def _normalize_storage_options(options: Mapping[str, Any]) -> DriveStorageOption
     if retries_int < 0:
         raise StorageOptionsError("retries must be >= 0.")
 
+    retry_policy = options.get("retry_policy")
+    if retry_policy is None:
+        retry_policy = RetryPolicy(max_retries=retries_int)
+    if not isinstance(retry_policy, RetryPolicy):
+        raise StorageOptionsError("retry_policy must be a loadpipe.retry.RetryPolicy instance.")
+
+    credentials_factory = options.get("credentials_factory")
+    if credentials_factory is not None and not callable(credentials_factory):
+        raise StorageOptionsError("credentials_factory must be callable.")
+
+    hedge = bool(options.get("hedge", False))
+    try:
+        hedge_percentile = float(options.get("hedge_percentile", 0.95))
+        hedge_budget = float(options.get("hedge_budget", 0.05))
+    except (TypeError, ValueError):
+        raise StorageOptionsError("hedge_percentile and hedge_budget must be numbers.")
+    if not 0 < hedge_percentile < 1:
+        raise StorageOptionsError("hedge_percentile must be between 0 and 1.")
+    if hedge_budget < 0:
+        raise StorageOptionsError("hedge_budget must be >= 0.")
+
     cache_limit = options.get("random_cache_limit")
     if cache_limit is None:
         cache_limit = max(chunk_size * 4, 1)
@@ -230,6 +274,38 @@ def _normalize_storage_options(options: Mapping[str, Any]) -> DriveStorageOption
     if cache_limit_int <= 0:
         raise StorageOptionsError("random_cache_limit must be greater than zero.")
 
+    cache_policy = options.get("cache_policy", "lru")
+    if not callable(cache_policy) and cache_policy not in CACHE_POLICIES:
+        raise StorageOptionsError(
+            f"cache_policy must be one of {', '.join(sorted(CACHE_POLICIES))} or a factory(limit_bytes).",
+            context={"cache_policy": cache_policy},
+        )
+
+    cache_compression = options.get("cache_compression") or None
+    if cache_compression is not None:
+        try:
+            resolve_codec(cache_compression)
+        except ValueError as exc:
+            raise StorageOptionsError(str(exc), context={"cache_compression": cache_compression}) from exc
+
+    try:
+        prefetch_head = int(options.get("prefetch_head") or 0)
+        prefetch_tail = int(options.get("prefetch_tail") or 0)
+        prefetch_ranges = tuple(
+            (int(offset), int(length)) for offset, length in options.get("prefetch_ranges") or ()
+        )
+    except (TypeError, ValueError):
+        raise StorageOptionsError(
+            "prefetch_head and prefetch_tail must be byte counts and prefetch_ranges (offset, length) pairs."
+        )
+    if prefetch_head < 0 or prefetch_tail < 0:
+        raise StorageOptionsError("prefetch_head and prefetch_tail must be >= 0.")
+    if any(length <= 0 for _, length in prefetch_ranges):
+        raise StorageOptionsError(
+            "prefetch_ranges lengths must be greater than zero.",
+            context={"prefetch_ranges": prefetch_ranges},
+        )
+
     return DriveStorageOptions(
         service_factory=service_factory,
         manifest_path=manifest_path,
@@ -238,6 +314,16 @@ def _normalize_storage_options(options: Mapping[str, Any]) -> DriveStorageOption
         logger=logger,
         retries=retries_int,
         random_cache_limit=cache_limit_int,
+        retry_policy=retry_policy,
+        cache_policy=cache_policy,
+        cache_compression=cache_compression,
+        credentials_factory=credentials_factory,
+        hedge=hedge,
+        hedge_percentile=hedge_percentile,
+        hedge_budget=hedge_budget,
+        prefetch_head=prefetch_head,
+        prefetch_tail=prefetch_tail,
+        prefetch_ranges=prefetch_ranges,
     )
 
 
@@ -252,6 +338,16 @@ def _load_gdrive():
     return gdrive
 
 
+@lru_cache(maxsize=1)
+def _load_gdrive_async():
+    """Return the aiohttp adapter, or ``None`` when the 'async' extra is not installed."""
+    try:
+        from .adapters import gdrive_async
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return gdrive_async if gdrive_async.aiohttp is not None else None
+
+
 @lru_cache(maxsize=1)
 def _load_download_module():
     from .io import download as download_mod
@@ -259,6 +355,13 @@ def _load_download_module():
     return download_mod
 
 
+@lru_cache(maxsize=1)
+def _load_upload_module():
+    from .io import upload as upload_mod
+
+    return upload_mod
+
+
 @lru_cache(maxsize=1)
 def _load_oauth():
     from .auth import oauth
@@ -266,33 +369,401 @@ def _load_oauth():
     return oauth
 
 
-def _config_service_factory(cfg: Config) -> Callable[[], Any]:
-    def _factory() -> Any:
-        oauth = _load_oauth()
-        gdrive = _load_gdrive()
-        creds = oauth.credentials(cfg.auth)
-        return gdrive.build_service(creds)
+# Credentials loaded by ConfigCredentials, per process and auth config.
+_CREDENTIALS: dict[tuple[int, str, str], Any] = {}
+_CREDENTIALS_LOCK = threading.Lock()
 
-    return _factory
 
+class ConfigCredentials:
+    """
+    Picklable ``credentials_factory`` reading OAuth credentials from ``cfg.auth``.
 
-def _build_manifest(path: StrPath, logger: logging.Logger) -> Manifest:
-    try:
-        return Manifest(path)
-    except Exception as exc:
-        logger.warning("Manifest disabled (%s); resume support unavailable.", exc)
-        return _MemoryManifest()
+    Credentials are loaded once per process (and again after a fork), so tasks
+    unpickled on the same worker share them instead of re-reading the token file.
+    """
+
+    def __init__(self, cfg: Config) -> None:
+        self.cfg = cfg
+
+    def __call__(self) -> Any:
+        auth = self.cfg.auth
+        key = (os.getpid(), auth.client_secrets_path, auth.token_path)
+        with _CREDENTIALS_LOCK:
+            creds = _CREDENTIALS.get(key)
+            if creds is None:
+                creds = _CREDENTIALS[key] = _load_oauth().credentials(auth)
+        return creds
+
+    def __repr__(self) -> str:
+        # fsspec derives its instance-cache token from repr(), so keep it stable across pickling.
+        return f"{type(self).__name__}({self.cfg.auth!r})"
+
+
+class ConfigServiceFactory:
+    """
+    Picklable ``service_factory`` for configs: a fresh Drive client per call on top
+    of the per-process ``ConfigCredentials``.
+    """
+
+    def __init__(self, cfg: Config) -> None:
+        self.credentials = ConfigCredentials(cfg)
+
+    def __call__(self) -> Any:
+        return _load_gdrive().build_service(self.credentials())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.credentials.cfg.auth!r})"
+
+
+class _ProcessManifest(SharedManifest):
+    """``SharedManifest`` kept open for the life of the process; resources and writers may ``close`` it freely."""
+
+    def close(self) -> None:
+        pass
+
+
+# Manifests opened by _process_manifest, per process and database path.
+_MANIFESTS: dict[tuple[int, str], Any] = {}
+_MANIFESTS_LOCK = threading.Lock()
+
+
+def _process_manifest(path: StrPath, logger: logging.Logger) -> Any:
+    """
+    The manifest for ``path`` shared by every reader and writer of this process.
 
+    Opened on first use and again after a fork (the key includes the pid), so an
+    ``open`` costs no schema setup and no new SQLite connection.
+    """
 
-class DriveFileSystem(AbstractFileSystem):
-    """Thin wrapper around Drive helpers to expose fsspec-compatible storage hooks."""
+    key = (os.getpid(), os.fspath(path))
+    with _MANIFESTS_LOCK:
+        manifest = _MANIFESTS.get(key)
+        if manifest is None:
+            try:
+                manifest = _ProcessManifest(path)
+            except Exception as exc:
+                logger.warning("Manifest disabled (%s); resume support unavailable.", exc)
+                manifest = _MemoryManifest()
+            _MANIFESTS[key] = manifest
+        return manifest
+
+
+class DriveFileSystem(AsyncFileSystem):
+    """
+    Thin wrapper around Drive helpers to expose fsspec-compatible storage hooks.
+
+    ``open`` returns the blocking sequential/random-access readers. Metadata and
+    whole-range reads (``_info``, ``_ls``, ``_cat_file``, ``_cat_ranges``,
+    ``_get_file``) are coroutines, so fsspec's bulk helpers (``cat``, ``get``,
+    ``cat_ranges``) run them concurrently on its event loop. They use the aiohttp
+    client when the 'async' extra is installed and a ``credentials_factory`` is
+    given, and otherwise run the blocking adapter on worker threads.
+
+    Paths are ``gdrive://<file_id>``; ``ls("gdrive://<folder_id>")`` lists children
+    by id, with the Drive name under ``"filename"``. ``open("gdrive://<folder_id>/<name>",
+    "wb")`` returns a ``DriveUploadWriter`` that creates ``name`` in the folder.
+
+    With ``prefetch_head``/``prefetch_tail`` (bytes) or ``prefetch_ranges``
+    (``(offset, length)`` pairs, negative offsets counting from EOF) set,
+    ``open(..., random_access=True)`` fetches those ranges concurrently with the
+    ``stat`` call, so the footer/header reads of Parquet or ZIP readers cost no
+    extra round trips.
+
+    Instances and open readers pickle as their storage options (plus URL and
+    position for readers); with ``ConfigServiceFactory`` those are just the config,
+    so Dask or process-pool workers rebuild services and manifests on first use.
+    """
 
     protocol = "gdrive"
+    # Concurrent range requests per file in ``_get_file``.
+    get_window = 4
 
-    def __init__(self, storage_options: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        storage_options: Optional[Mapping[str, Any]] = None,
+        *,
+        asynchronous: bool = False,
+        loop: Any = None,
+        batch_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(asynchronous=asynchronous, loop=loop, batch_size=batch_size)
         merged = _merge_storage_options(storage_options, kwargs)
         self._options = _normalize_storage_options(merged)
+        self._hedger: Optional[Hedger] = None
+        self._lock = threading.Lock()
+        self._pool: Any = None
+        self._pool_pid = 0
+        self._client: Any = None
+        self._client_lock: Optional[asyncio.Lock] = None
+
+    def _service_pool(self) -> Any:
+        with self._lock:
+            # A forked child must not reuse the parent's HTTP connections.
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool = _load_gdrive().ServicePool(self._options.service_factory)
+                self._pool_pid = os.getpid()
+            return self._pool
+
+    def hedger(self) -> Optional[Hedger]:
+        """Hedger shared by every reader of this filesystem (``None`` unless ``hedge`` is set)."""
+        if not self._options.hedge:
+            return None
+        pool = self._service_pool()
+        with self._lock:
+            if self._hedger is None:
+                self._hedger = Hedger(
+                    pool,
+                    percentile=self._options.hedge_percentile,
+                    budget=self._options.hedge_budget,
+                    # Range requests run on asyncio.to_thread's default executor; match its size.
+                    concurrency=min(32, (os.cpu_count() or 1) + 4),
+                )
+            return self._hedger
+
+    async def _async_client(self) -> Any:
+        """The aiohttp client for this filesystem's loop, or ``None`` to fall back to threads."""
+        if self._options.credentials_factory is None or _load_gdrive_async() is None:
+            return None
+        if self._client_lock is None:
+            self._client_lock = asyncio.Lock()
+        async with self._client_lock:
+            if self._client is None:
+                creds = await asyncio.to_thread(self._options.credentials_factory)
+                self._client = _load_gdrive_async().AsyncDriveClient(creds)
+                weakref.finalize(self, _close_client, self._client, asyncio.get_running_loop())
+        return self._client
+
+    async def _in_thread(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        pool = self._service_pool()
+        return await asyncio.to_thread(lambda: fn(pool.get(), *args, **kwargs))
+
+    def _file_id(self, path: str) -> str:
+        file_id = self._strip_protocol(path).rstrip("/").rpartition("/")[2]
+        if not file_id:
+            raise DrivePathError("Drive path must include a file id.", context={"path": path})
+        return file_id
+
+    async def _stat(self, file_id: str) -> Any:
+        policy = self._options.retry_policy
+        client = await self._async_client()
+        if client is not None:
+            return await _load_gdrive_async().astat(client, file_id, policy=policy)
+        return await self._in_thread(_load_gdrive().stat, file_id, policy=policy)
+
+    async def _read_range(self, file_id: str, start: int, end: int, *, clipped: bool = False) -> bytes:
+        """
+        Fetch ``[start, end)``, split into ``chunk_size`` requests that run concurrently.
+
+        Unless ``clipped`` (``end`` already within the file), a range that needs
+        more than one request is first clipped to the file size, so no request
+        starts past EOF (Drive answers those with 416). A single request is sent
+        as is; Drive trims its end to EOF, and a 416 for a start past EOF reads
+        as ``b""``, like a clipped multi-request range.
+        """
+        step = self._options.chunk_size
+        if not clipped and end - start > step:
+            size = (await self._stat(file_id)).size
+            if size is not None:
+                end = min(end, size)
+        if end <= start:
+            return b""
+        if end - start <= step:
+            try:
+                return await self._fetch(file_id, start, end - 1)
+            except _load_gdrive().HttpError as exc:
+                if _status(exc) != 416:
+                    raise
+                return b""
+        parts = await asyncio.gather(
+            *(self._fetch(file_id, offset, min(offset + step, end) - 1) for offset in range(start, end, step))
+        )
+        return b"".join(parts)
+
+    async def _fetch(self, file_id: str, start: int, end: int) -> bytes:
+        policy = self._options.retry_policy
+        client = await self._async_client()
+        if client is not None:
+            return await _load_gdrive_async().adownload_range(client, file_id, start, end, policy=policy)
+        gdrive = _load_gdrive()
+        hedger = self.hedger()
+        if hedger is not None:
+            return await asyncio.to_thread(
+                hedger.call, gdrive.download_range, file_id, start, end, size=end - start + 1, policy=policy
+            )
+        return await self._in_thread(gdrive.download_range, file_id, start, end, policy=policy)
+
+    async def _fetch_tail(self, file_id: str, length: int) -> bytes:
+        policy = self._options.retry_policy
+        client = await self._async_client()
+        if client is not None:
+            return await _load_gdrive_async().adownload_tail(client, file_id, length, policy=policy)
+        return await self._in_thread(_load_gdrive().download_tail, file_id, length, policy=policy)
+
+    async def _stat_and_prefetch(self, file_id: str) -> tuple[Any, list[tuple[int, bytes]]]:
+        """
+        ``stat`` ``file_id`` while fetching the configured prefetch ranges.
+
+        Head, tail and absolute ranges start together with the stat; ranges
+        relative to EOF start once the size is known. Prefetching is best-effort:
+        a failed or empty range is logged and left to the reader. Returns
+        ``(meta, [(offset, data), ...])``.
+        """
+
+        options = self._options
+        logger = options.logger
+
+        async def _guard(what: Any, coro: Any) -> Optional[bytes]:
+            try:
+                return await coro
+            except Exception as exc:
+                logger.debug("prefetch of %s %s failed: %s", file_id, what, exc)
+                return None
+
+        absolute = [(offset, length) for offset, length in options.prefetch_ranges if offset >= 0]
+        if options.prefetch_head:
+            absolute.append((0, options.prefetch_head))
+        early = [
+            _guard((offset, length), self._fetch(file_id, offset, offset + length - 1))
+            for offset, length in absolute
+        ]
+        if options.prefetch_tail:
+            early.append(_guard("tail", self._fetch_tail(file_id, options.prefetch_tail)))
+        tasks = [asyncio.ensure_future(coro) for coro in early]
+        try:
+            meta = await self._stat(file_id)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        size = meta.size
+        relative = []
+        if size:
+            for offset, length in options.prefetch_ranges:
+                if offset < 0:
+                    start = max(0, size + offset)
+                    relative.append((start, min(length, size - start)))
+        late = await asyncio.gather(
+            *(_guard((start, length), self._fetch(file_id, start, start + length - 1)) for start, length in relative)
+        )
+        early_data = await asyncio.gather(*tasks)
+
+        extents = [(offset, data) for (offset, _), data in zip(absolute, early_data) if data]
+        if options.prefetch_tail and early_data[-1] and size is not None:
+            extents.append((size - len(early_data[-1]), early_data[-1]))
+        extents.extend((start, data) for (start, _), data in zip(relative, late) if data)
+        return meta, extents
+
+    async def _info(self, path: str, **kwargs: Any) -> dict[str, Any]:
+        return _meta_info(await self._stat(self._file_id(path)))
+
+    async def _ls(self, path: str, detail: bool = True, **kwargs: Any) -> list[Any]:
+        folder_id = self._file_id(path)
+        entries = None if kwargs.get("refresh") else self.dircache.get(folder_id)
+        if entries is None:
+            client = await self._async_client()
+            if client is not None:
+                metas = [meta async for meta in _load_gdrive_async().alist_files(client, folder_id, include_folders=True)]
+            else:
+                gdrive = _load_gdrive()
+                metas = await self._in_thread(
+                    lambda service: list(gdrive.list_files(service, folder_id, include_folders=True))
+                )
+            entries = [_meta_info(meta) for meta in metas]
+            self.dircache[folder_id] = entries
+        return entries if detail else [entry["name"] for entry in entries]
+
+    async def _byte_range(
+        self, path: str, start: Optional[int], end: Optional[int]
+    ) -> tuple[str, int, int, bool]:
+        """``(file_id, start, end, clipped)``; only ranges relative to EOF need a ``stat`` here."""
+        file_id = self._file_id(path)
+        if (start or 0) >= 0 and end is not None and end >= 0:
+            return file_id, start or 0, end, False
+        meta = await self._stat(file_id)
+        return (file_id, *_absolute_range(file_id, start, end, meta.size), True)
+
+    async def _cat_file(
+        self, path: str, start: Optional[int] = None, end: Optional[int] = None, **kwargs: Any
+    ) -> bytes:
+        file_id, start, end, clipped = await self._byte_range(path, start, end)
+        return await self._read_range(file_id, start, end, clipped=clipped)
+
+    async def _cat_ranges(
+        self,
+        paths: list[str],
+        starts: Any,
+        ends: Any,
+        max_gap: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        on_error: str = "return",
+        **kwargs: Any,
+    ) -> list[Any]:
+        if not isinstance(paths, list):
+            raise TypeError("paths must be a list")
+        if not isinstance(starts, Iterable):
+            starts = [starts] * len(paths)
+        if not isinstance(ends, Iterable):
+            ends = [ends] * len(paths)
+        starts, ends = list(starts), list(ends)
+        if len(starts) != len(paths) or len(ends) != len(paths):
+            raise ValueError("paths, starts and ends must have the same length")
+
+        # Stat each file once, however many of its ranges are relative to EOF.
+        relative = {
+            path
+            for path, start, end in zip(paths, starts, ends)
+            if (start or 0) < 0 or end is None or end < 0
+        }
+        sizes: dict[str, Any] = {}
+        if relative:
+            infos = await _run_coros_in_chunks(
+                [self._info(path) for path in relative],
+                batch_size=batch_size or self.batch_size,
+                nofiles=True,
+                return_exceptions=True,
+            )
+            sizes = dict(zip(relative, infos))
+
+        async def _one(path: str, start: Optional[int], end: Optional[int]) -> bytes:
+            file_id = self._file_id(path)
+            if path not in sizes:
+                return await self._read_range(file_id, start or 0, end)
+            info = sizes[path]
+            if isinstance(info, BaseException):
+                raise info
+            return await self._read_range(
+                file_id, *_absolute_range(file_id, start, end, info["size"]), clipped=True
+            )
+
+        out = await _run_coros_in_chunks(
+            [_one(path, start, end) for path, start, end in zip(paths, starts, ends)],
+            batch_size=batch_size or self.batch_size,
+            nofiles=True,
+            return_exceptions=True,
+        )
+        if on_error != "return":
+            error = next((item for item in out if isinstance(item, BaseException)), None)
+            if error is not None:
+                raise error
+        return out
+
+    async def _get_file(self, rpath: str, lpath: str, callback: Any = DEFAULT_CALLBACK, **kwargs: Any) -> None:
+        file_id = self._file_id(rpath)
+        meta = await self._stat(file_id)
+        if meta.mime == _load_gdrive().FOLDER_MIME:
+            os.makedirs(lpath, exist_ok=True)
+            return
+        start, end = _absolute_range(file_id, 0, None, meta.size)
+        callback.set_size(end)
+        span = self._options.chunk_size * self.get_window
+        with open(lpath, "wb") as handle:
+            for offset in range(start, end, span):
+                data = await self._read_range(file_id, offset, min(offset + span, end), clipped=True)
+                handle.write(data)
+                callback.relative_update(len(data))
 
     def _parse_url(self, url: str) -> DriveURL:
         if not url:
@@ -322,14 +793,24 @@ class DriveFileSystem(AbstractFileSystem):
             )
             return None
 
-    def prepare_resource(self, url: str) -> DriveResource:
-        parsed = self._parse_url(url)
-        service = self._options.service_factory()
+    def _service(self) -> Any:
+        service = self._service_pool().get()
         if service is None:
             raise LoadpipeError("service_factory returned None; cannot talk to Drive.")
-        gdrive = _load_gdrive()
-        meta = gdrive.stat(service, parsed.file_id)
-        manifest = _build_manifest(self._options.manifest_path, self._options.logger)
+        return service
+
+    def prepare_resource(self, url: str, meta: Any = None) -> DriveResource:
+        """
+        Resolve ``url`` into a resource; ``meta`` skips the ``stat`` when already known.
+
+        The service is this thread's client from the filesystem's ``ServicePool``
+        and the manifest is the process-wide one, so opening a file builds neither.
+        """
+        parsed = self._parse_url(url)
+        service = self._service()
+        if meta is None:
+            meta = _load_gdrive().stat(service, parsed.file_id, policy=self._options.retry_policy)
+        manifest = _process_manifest(self._options.manifest_path, self._options.logger)
         cache_path = self._cache_path(meta.id)
         return DriveResource(
             filesystem=self,
@@ -346,42 +827,100 @@ class DriveFileSystem(AbstractFileSystem):
         path: str,
         mode: str = "rb",
         **kwargs: Any,
-    ) -> "DriveSequentialReader | DriveRandomAccessReader":
+    ) -> "DriveSequentialReader | DriveRandomAccessReader | DriveUploadWriter":
+        # fsspec.open() hands over protocol-stripped paths.
+        path = self.unstrip_protocol(path)
+        if mode == "wb":
+            return self._open_writer(path, mime=kwargs.pop("mime", "application/octet-stream"))
         if mode not in {"rb", "r", "rt"} or "b" not in mode:
-            raise ValueError("DriveFileSystem only supports read-only binary mode.")
+            raise ValueError("DriveFileSystem only supports 'rb' and 'wb' modes.")
         random_access = bool(kwargs.pop("random_access", False))
-        resource = self.prepare_resource(path)
+        meta: Any = None
+        prefetched: list[tuple[int, bytes]] = []
+        if random_access and self._options.prefetch and not self.asynchronous:
+            meta, prefetched = sync(self.loop, self._stat_and_prefetch, self._parse_url(path).file_id)
+        resource = self.prepare_resource(path, meta)
         try:
             if random_access:
                 return DriveRandomAccessReader(
                     resource=resource,
                     logger=self._options.logger,
                     cache_limit=self._options.random_cache_limit,
+                    cache_policy=self._options.cache_policy,
+                    cache_compression=self._options.cache_compression,
+                    retry_policy=self._options.retry_policy,
+                    hedger=self.hedger(),
+                    prefetched=prefetched,
                 )
             return DriveSequentialReader(
                 resource=resource,
                 logger=self._options.logger,
-                retries=self._options.retries,
+                retry_policy=self._options.retry_policy,
+                hedger=self.hedger(),
             )
         except Exception:
             resource.close()
             raise
 
+    def _open_writer(self, path: str, *, mime: str) -> "DriveUploadWriter":
+        parsed = self._parse_url(path)
+        if not parsed.subpath or "/" in parsed.subpath:
+            raise DrivePathError(
+                "Write paths must be 'gdrive://<folder_id>/<name>'.", context={"path": path}
+            )
+        return DriveUploadWriter(
+            service=self._service(),
+            manifest=_process_manifest(self._options.manifest_path, self._options.logger),
+            name=parsed.subpath,
+            folder_id=parsed.file_id,
+            mime=mime,
+            block_size=self._options.chunk_size,
+            logger=self._options.logger,
+            retry_policy=self._options.retry_policy,
+        )
+
+
+class DriveSequentialReader(io.RawIOBase):
+    """
+    Streaming reader backed by download_iter.
+
+    It opens at the manifest resume point (0 for a file not read before). Seeks
+    within the current chunk, or at most one chunk ahead, keep consuming the
+    stream; seeks backward or further ahead restart ``download_iter`` at the
+    target offset, so mostly-linear readers keep streaming throughput, cache
+    population and manifest progress.
 
-class DriveSequentialReader:
-    """Streaming, forward-only reader backed by download_iter."""
+    ``readinto`` copies downloaded chunks straight into the caller's buffer;
+    ``read`` returns whole chunks without copying when the request lines up with
+    them. Iterating yields the download chunks themselves.
+    """
 
-    def __init__(self, *, resource: DriveResource, logger: logging.Logger, retries: int) -> None:
+    def __init__(
+        self,
+        *,
+        resource: DriveResource,
+        logger: logging.Logger,
+        retry_policy: RetryPolicy,
+        hedger: Optional[Hedger] = None,
+    ) -> None:
+        super().__init__()
         self._resource = resource
         self._logger = logger
-        self._retries = retries
+        self._retry_policy = retry_policy
+        self._hedger = hedger
         self._iterator: Optional[Iterator[bytes]] = None
-        self._buffer = bytearray()
-        self._closed = False
+        # Unread tail of the current chunk (a view, so consuming it never copies).
+        self._pending = memoryview(b"")
         self._exhausted = False
+        self._size: Optional[int] = resource.meta.size
+        # Offset the next stream starts at; None resumes from the manifest.
+        self._start: Optional[int] = None
+        # File offset just past ``_pending``.
+        record = resource.manifest.get_download(resource.meta.id)
+        self._offset = int(record.get("bytes_done") or 0) if record else 0
 
     def _ensure_open(self) -> None:
-        if self._closed:
+        if self.closed:
             raise ValueError("DriveSequentialReader is closed.")
 
     def _ensure_iterator(self) -> Iterator[bytes]:
@@ -395,184 +934,552 @@ class DriveSequentialReader:
                     file_meta=self._resource.meta,
                     chunk_size=self._resource.chunk_size,
                     logger=self._logger,
-                    retries=self._retries,
+                    retry_policy=self._retry_policy,
                     cache_path=cache_path,
+                    hedger=self._hedger,
+                    start=self._start,
                 )
             )
         return self._iterator
 
-    def read(self, size: Optional[int] = -1) -> bytes:
-        self._ensure_open()
-        if size is not None and size < 0:
-            size = None
-
-        chunks: list[bytes] = []
-        if size is None:
-            if self._buffer:
-                chunks.append(bytes(self._buffer))
-                self._buffer.clear()
-            iterator = self._ensure_iterator()
-            for chunk in iterator:
-                chunks.append(chunk)
-            self._exhausted = True
-            return b"".join(chunks)
-
-        remaining = size
-        if self._buffer:
-            take = min(remaining, len(self._buffer))
-            chunks.append(bytes(self._buffer[:take]))
-            del self._buffer[:take]
-            remaining -= take
-
-        iterator = self._ensure_iterator()
-        while remaining > 0 and not self._exhausted:
+    def _next_chunk(self) -> bool:
+        """Refill ``_pending`` from the download; False at end of file."""
+        while not self._pending and not self._exhausted:
             try:
-                chunk = next(iterator)
+                self._pending = memoryview(next(self._ensure_iterator()))
             except StopIteration:
                 self._exhausted = True
-                break
-            if len(chunk) <= remaining:
-                chunks.append(chunk)
-                remaining -= len(chunk)
             else:
-                chunks.append(chunk[:remaining])
-                self._buffer.extend(chunk[remaining:])
-                remaining = 0
+                self._offset += len(self._pending)
+        return bool(self._pending)
 
-        return b"".join(chunks)
+    def _close_iterator(self) -> None:
+        iterator, self._iterator = self._iterator, None
+        if iterator is not None and hasattr(iterator, "close"):
+            try:
+                iterator.close()  # type: ignore[call-arg]
+            except Exception:  # pragma: no cover - best effort
+                pass
 
-    def close(self) -> None:
-        if self._closed:
-            return
-        try:
-            iterator = self._iterator
-            if iterator and hasattr(iterator, "close"):
-                try:
-                    iterator.close()  # type: ignore[call-arg]
-                except Exception:  # pragma: no cover - best effort
-                    pass
-        finally:
-            self._resource.close()
-            self._closed = True
+    def _take(self, size: int) -> "bytes | memoryview":
+        if not self._pending and not self._next_chunk():
+            return b""
+        piece = self._pending[:size]
+        self._pending = self._pending[size:]
+        return piece
 
-    @property
-    def closed(self) -> bool:
-        return self._closed
+    def readable(self) -> bool:
+        return True
 
-    def __enter__(self) -> "DriveSequentialReader":
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
         self._ensure_open()
-        return self
+        return self._offset - len(self._pending)
 
-    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
-        self.close()
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        position = self.tell()
+        if whence == os.SEEK_SET:
+            target = offset
+        elif whence == os.SEEK_CUR:
+            target = position + offset
+        elif whence == os.SEEK_END:
+            if self._size is None:
+                raise io.UnsupportedOperation("Drive file size is unknown; cannot seek from the end.")
+            target = self._size + offset
+        else:
+            raise ValueError(f"Unsupported whence: {whence}")
+        if target < 0:
+            raise ValueError("Cannot seek to a negative position.")
 
-    def __iter__(self) -> Iterable[bytes]:
+        ahead = target - position
+        if 0 <= ahead <= len(self._pending):
+            self._pending = self._pending[ahead:]
+            return target
+        if 0 < ahead <= self._resource.chunk_size and self._iterator is not None:
+            # Cheaper to read through than to pay for a new ranged request.
+            while ahead > 0:
+                piece = self._take(ahead)
+                if not piece:
+                    break
+                ahead -= len(piece)
+            if ahead == 0:
+                return target
+
+        self._close_iterator()
+        self._pending = memoryview(b"")
+        self._start = self._offset = target
+        self._exhausted = self._size is not None and target >= self._size
+        return target
+
+    def readinto(self, buffer: Any) -> int:
         self._ensure_open()
-        iterator = self._ensure_iterator()
-        if self._buffer:
-            yield bytes(self._buffer)
-            self._buffer.clear()
-        for chunk in iterator:
-            yield chunk
-        self._exhausted = True
+        view = memoryview(buffer).cast("B")
+        filled = 0
+        while filled < len(view):
+            piece = self._take(len(view) - filled)
+            if not piece:
+                break
+            view[filled : filled + len(piece)] = piece
+            filled += len(piece)
+        return filled
 
+    def read(self, size: Optional[int] = -1) -> bytes:
+        self._ensure_open()
+        if size is None or size < 0:
+            return self.readall()
+        parts: list[Any] = []
+        remaining = size
+        while remaining > 0:
+            piece = self._take(remaining)
+            if not piece:
+                break
+            parts.append(piece.obj if len(piece) == len(piece.obj) else piece)
+            remaining -= len(piece)
+        return _join(parts)
+
+    def readall(self) -> bytes:
+        self._ensure_open()
+        parts: list[Any] = []
+        while self._pending or self._next_chunk():
+            piece, self._pending = self._pending, memoryview(b"")
+            parts.append(piece.obj if len(piece) == len(piece.obj) else piece)
+        return _join(parts)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._close_iterator()
+        finally:
+            self._pending = memoryview(b"")
+            self._resource.close()
+            super().close()
 
-class DriveRandomAccessReader:
-    """Random-access reader that caches Drive byte ranges."""
+    def __reduce__(self) -> tuple[Any, tuple]:
+        return _reopen, (self._resource.filesystem, self._resource.url.raw, False, self.tell())
 
-    def __init__(self, *, resource: DriveResource, logger: logging.Logger, cache_limit: int) -> None:
+    def __iter__(self) -> Iterator[bytes]:  # type: ignore[override]
+        self._ensure_open()
+        while self._pending or self._next_chunk():
+            piece, self._pending = self._pending, memoryview(b"")
+            yield piece.obj if len(piece) == len(piece.obj) else bytes(piece)
+
+
+class DriveRandomAccessReader(io.RawIOBase):
+    """
+    Random-access reader that caches Drive byte ranges.
+
+    Safe to share between threads: ``pread(offset, size)`` never touches the
+    cursor, ``read``/``readinto``/``seek``/``tell`` serialize on it, each thread
+    talks to Drive through its own client, and threads missing the same chunk
+    wait for a single ``download_range`` call instead of issuing their own.
+    Cached chunks are copied once, into the caller's buffer for ``readinto``.
+
+    ``prefetched`` ``(offset, data)`` extents (see the ``prefetch_*`` storage
+    options) are kept for the reader's lifetime and serve reads inside them
+    without touching the chunk cache; ``cache_stats()`` counts them as
+    ``prefetch_hits``. Their bytes count against ``cache_limit``: the chunk cache
+    gets what is left, and extents that would leave it less than one chunk are
+    dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        resource: DriveResource,
+        logger: logging.Logger,
+        cache_limit: int,
+        retry_policy: RetryPolicy,
+        hedger: Optional[Hedger] = None,
+        cache_policy: Union[str, Callable[[int], ChunkCache]] = "lru",
+        cache_compression: Optional[str] = None,
+        prefetched: Iterable[tuple[int, bytes]] = (),
+    ) -> None:
+        super().__init__()
+        self._resource = resource
         if resource.meta.size is None:
             resource.close()
+            super().close()
             raise LoadpipeError("Drive file size is required for random-access reads.")
-        self._resource = resource
         self._logger = logger
         self._size = int(resource.meta.size)
         self._chunk_size = max(1, resource.chunk_size)
-        self._cache = _LRUChunkCache(cache_limit)
+        self._extents: list[tuple[int, int, memoryview]] = []
+        budget = cache_limit - self._chunk_size
+        for offset, data in prefetched:
+            if not data:
+                continue
+            if len(data) > budget:
+                logger.debug("dropping prefetched range at %s (%s bytes): over random_cache_limit", offset, len(data))
+                continue
+            budget -= len(data)
+            self._extents.append((offset, offset + len(data), memoryview(data)))
+        self._extents.sort(key=lambda extent: extent[0])
+        self._cache = make_chunk_cache(cache_policy, budget + self._chunk_size, compression=cache_compression)
+        self._inflight = _SingleFlight()
         self._pos = 0
-        self._closed = False
+        self._pos_lock = threading.Lock()
         self._gdrive = _load_gdrive()
+        self._services = self._gdrive.ServicePool(
+            resource.filesystem._options.service_factory, primary=resource.service
+        )
+        self._retry_policy = retry_policy
+        self._hedger = hedger
+        self._prefetch_hits = 0
+        self._hits_lock = threading.Lock()
 
     def _ensure_open(self) -> None:
-        if self._closed:
+        if self.closed:
             raise ValueError("DriveRandomAccessReader is closed.")
 
+    def cache_stats(self) -> dict[str, Any]:
+        """Hit/miss/eviction counters of this reader's chunk cache, plus ``prefetch_hits``."""
+        stats = self._cache.snapshot()
+        with self._hits_lock:
+            stats["prefetch_hits"] = self._prefetch_hits
+        return stats
+
+    def _prefetched(self, offset: int) -> Optional[memoryview]:
+        """The prefetched bytes from ``offset`` to the end of the extent holding it, if any."""
+        for start, end, view in self._extents:
+            if start <= offset < end:
+                return view[offset - start :]
+        return None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
     def tell(self) -> int:
         self._ensure_open()
-        return self._pos
+        with self._pos_lock:
+            return self._pos
 
     def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
         self._ensure_open()
-        if whence == os.SEEK_SET:
-            target = offset
-        elif whence == os.SEEK_CUR:
-            target = self._pos + offset
-        elif whence == os.SEEK_END:
-            target = self._size + offset
-        else:
-            raise ValueError(f"Unsupported whence: {whence}")
-        if target < 0:
-            raise ValueError("Cannot seek to a negative position.")
-        self._pos = target
-        return self._pos
+        with self._pos_lock:
+            if whence == os.SEEK_SET:
+                target = offset
+            elif whence == os.SEEK_CUR:
+                target = self._pos + offset
+            elif whence == os.SEEK_END:
+                target = self._size + offset
+            else:
+                raise ValueError(f"Unsupported whence: {whence}")
+            if target < 0:
+                raise ValueError("Cannot seek to a negative position.")
+            self._pos = target
+            return self._pos
 
     def read(self, size: Optional[int] = -1) -> bytes:
         self._ensure_open()
+        with self._pos_lock:
+            data = self.pread(self._pos, size)
+            self._pos = min(self._pos, self._size) + len(data)
+            return data
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer: Any) -> int:
+        self._ensure_open()
+        view = memoryview(buffer).cast("B")
+        with self._pos_lock:
+            filled = 0
+            for piece in self._slices(self._pos, len(view)):
+                view[filled : filled + len(piece)] = piece
+                filled += len(piece)
+            self._pos = min(self._pos, self._size) + filled
+            return filled
+
+    def pread(self, offset: int, size: Optional[int] = -1) -> bytes:
+        """Read ``size`` bytes at ``offset`` (to EOF when negative) without moving the cursor."""
+        self._ensure_open()
+        parts = [
+            piece.obj if len(piece) == len(piece.obj) else piece
+            for piece in self._slices(offset, size)
+        ]
+        return _join(parts)
+
+    def _slices(self, offset: int, size: Optional[int]) -> Iterator[memoryview]:
+        """Views of cached chunks covering ``size`` bytes at ``offset``, clipped to EOF."""
+        if offset < 0:
+            raise ValueError("Cannot read at a negative offset.")
         if size is None or size < 0:
-            size = self._size - self._pos
-        if self._pos >= self._size or size == 0:
-            self._pos = min(self._pos, self._size)
-            return b""
-        remaining = min(size, self._size - self._pos)
-        chunks: list[bytes] = []
-        while remaining > 0 and self._pos < self._size:
-            chunk_index = self._pos // self._chunk_size
-            chunk = self._get_chunk(chunk_index)
-            chunk_offset = self._pos - chunk_index * self._chunk_size
+            size = self._size - offset
+        remaining = min(size, self._size - offset)
+        while remaining > 0:
+            extent = self._prefetched(offset) if self._extents else None
+            if extent is not None:
+                take = min(remaining, len(extent))
+                with self._hits_lock:
+                    self._prefetch_hits += 1
+                yield extent[:take]
+                offset += take
+                remaining -= take
+                continue
+            chunk_index = offset // self._chunk_size
+            chunk = memoryview(self._get_chunk(chunk_index))
+            chunk_offset = offset - chunk_index * self._chunk_size
             if chunk_offset >= len(chunk):
                 # Should not happen; guard to avoid infinite loop.
                 break
             take = min(remaining, len(chunk) - chunk_offset)
-            chunks.append(chunk[chunk_offset : chunk_offset + take])
-            self._pos += take
+            yield chunk[chunk_offset : chunk_offset + take]
+            offset += take
             remaining -= take
-        return b"".join(chunks)
 
     def _get_chunk(self, chunk_index: int) -> bytes:
         cached = self._cache.get(chunk_index)
+        if cached is not None:
+            return cached
+        return self._inflight.do(chunk_index, lambda: self._load_chunk(chunk_index))
+
+    def _load_chunk(self, chunk_index: int) -> bytes:
+        # A previous leader may have filled the cache between our miss and taking the lead.
+        cached = self._cache.get(chunk_index, count=False)
         if cached is not None:
             return cached
         start = chunk_index * self._chunk_size
         if start >= self._size:
             return b""
         end = min(start + self._chunk_size - 1, self._size - 1)
-        data = self._gdrive.download_range(
-            self._resource.service,
-            self._resource.meta.id,
-            start,
-            end,
-        )
-        if not isinstance(data, (bytes, bytearray)):
+        if self._hedger is not None:
+            data = self._hedger.call(
+                self._gdrive.download_range,
+                self._resource.meta.id,
+                start,
+                end,
+                size=end - start + 1,
+                policy=self._retry_policy,
+            )
+        else:
+            data = self._gdrive.download_range(
+                self._services.get(),
+                self._resource.meta.id,
+                start,
+                end,
+                policy=self._retry_policy,
+            )
+        if not isinstance(data, bytes):
             data = bytes(data)
-        self._cache.put(chunk_index, bytes(data))
-        return bytes(data)
+        self._cache.put(chunk_index, data)
+        return data
 
     def close(self) -> None:
-        if self._closed:
+        if self.closed:
             return
-        self._resource.close()
-        self._closed = True
+        try:
+            self._logger.debug("chunk cache stats %s", self.cache_stats())
+            self._resource.close()
+        finally:
+            super().close()
 
-    @property
-    def closed(self) -> bool:
-        return self._closed
+    def __reduce__(self) -> tuple[Any, tuple]:
+        self._ensure_open()
+        return _reopen, (self._resource.filesystem, self._resource.url.raw, True, self.tell())
+
+
+class DriveUploadWriter(io.RawIOBase):
+    """
+    Write-only handle that streams into a new Drive file through a resumable upload.
+
+    Writes are buffered into ``block_size`` blocks (rounded down to a multiple of
+    256 KiB, as Drive requires for every chunk but the last). One block is held
+    back so the final chunk can declare the total size. The session starts with
+    the first full block and every uploaded chunk is recorded in the manifest's
+    upload table. ``close()`` sends the rest and commits the file. Leaving a
+    ``with`` block on an exception (or calling ``discard()``) drops the session,
+    so no partial file appears in Drive. Only an explicit ``close()`` commits: a
+    writer that is garbage collected while still open is discarded.
+    """
+
+    def __init__(
+        self,
+        *,
+        service: Any,
+        manifest: Manifest,
+        name: str,
+        folder_id: str,
+        block_size: int,
+        logger: logging.Logger,
+        retry_policy: RetryPolicy,
+        mime: str = "application/octet-stream",
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.folder_id = folder_id
+        self.mime = mime
+        self._service = service
+        self._manifest = manifest
+        self._logger = logger
+        self._retry_policy = retry_policy
+        self._gdrive = _load_gdrive()
+        self._upload = _load_upload_module()
+        alignment = self._upload.UPLOAD_ALIGNMENT
+        size = max(alignment, block_size - block_size % alignment)
+        self._blocker = self._upload._Reblocker(alignment, lambda: size)
+        self._session: Any = None
+        self._offset = 0
+
+    def _ensure_open(self) -> None:
+        if self.closed:
+            raise ValueError("DriveUploadWriter is closed.")
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        """Bytes accepted so far (uploaded or buffered)."""
+        self._ensure_open()
+        return self._offset + self._blocker.buffered
 
-    def __enter__(self) -> "DriveRandomAccessReader":
+    def write(self, data: Any) -> int:
         self._ensure_open()
-        return self
+        view = memoryview(data).cast("B")
+        for block in self._blocker.feed(view):
+            self._send(block, last=False)
+        return len(view)
+
+    def _begin(self, total: Optional[int]) -> None:
+        self._session = self._gdrive.begin_resumable_upload(
+            self._service,
+            name=self.name,
+            folder_id=self.folder_id,
+            size=total,
+            mime=self.mime,
+            policy=self._retry_policy,
+        )
+        self._upload._record(self._manifest, self._session, 0, total)
+
+    def _send(self, block: bytes, *, last: bool) -> None:
+        total = self._offset + len(block) if last else None
+        if self._session is None:
+            self._begin(total)
+        sent = 0
+        while sent < len(block):
+            start = self._offset
+            end = start + len(block) - sent - 1
+            offset = self._gdrive.upload_chunk(
+                self._service,
+                self._session,
+                block[sent:] if sent else block,
+                start,
+                end,
+                total=total,
+                policy=self._retry_policy,
+            )
+            if offset <= start:
+                raise LoadpipeError(
+                    "Drive did not accept any bytes of the upload chunk.",
+                    context={"name": self.name, "offset": start},
+                )
+            # Drive may persist only part of a chunk (in 256 KiB steps); resend the rest.
+            sent += offset - start
+            self._offset = offset
+            self._upload._record(self._manifest, self._session, self._offset, total)
+
+    def close(self) -> None:
+        """Upload the buffered tail and commit the file."""
+        if self.closed:
+            return
+        try:
+            blocks = self._blocker.finish()
+            for block, last in blocks:
+                self._send(block, last=last)
+            if not blocks:
+                # Nothing written: create an empty file.
+                self._begin(0)
+                self._gdrive.query_upload_status(self._service, self._session, total=0, policy=self._retry_policy)
+                self._upload._record(self._manifest, self._session, 0, 0)
+            self._logger.info("Uploaded %s bytes to %s/%s", self._offset, self.folder_id, self.name)
+        finally:
+            self._manifest.close()
+            super().close()
+
+    def discard(self) -> None:
+        """Close without committing; the resumable session is left to expire."""
+        if self.closed:
+            return
+        self._logger.warning(
+            "Discarding upload of %s/%s after %s bytes", self.folder_id, self.name, self._offset
+        )
+        try:
+            self._manifest.close()
+        finally:
+            super().close()
 
     def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
-        self.close()
+        if exc_type is not None:
+            self.discard()
+        else:
+            self.close()
+
+    def __del__(self) -> None:
+        # IOBase.__del__ would call close() and commit a truncated file.
+        if not self.closed:
+            self.discard()
+
+
+def _status(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None) or getattr(getattr(exc, "resp", None), "status", None)
+    return int(status) if status is not None else None
+
+
+def _join(parts: list[Any]) -> bytes:
+    # A single whole chunk is returned as-is; anything else is copied exactly once.
+    if len(parts) == 1 and isinstance(parts[0], bytes):
+        return parts[0]
+    return b"".join(parts)
+
+
+def _reopen(
+    filesystem: DriveFileSystem, url: str, random_access: bool, position: int
+) -> "DriveSequentialReader | DriveRandomAccessReader":
+    """Unpickle a reader: open ``url`` again on the receiving side and restore its position."""
+    reader = filesystem.open(url, random_access=random_access)
+    reader.seek(position)
+    return reader
+
+
+def _absolute_range(file_id: str, start: Optional[int], end: Optional[int], size: Optional[int]) -> tuple[int, int]:
+    """Resolve fsspec ``start``/``end`` (``None`` or negative = relative to EOF) to ``[start, end)``."""
+    if size is None:
+        raise DrivePathError(f"{file_id} has no binary content to read.", context={"file_id": file_id})
+    start = start or 0
+    if start < 0:
+        start = max(0, size + start)
+    if end is None:
+        end = size
+    elif end < 0:
+        end = size + end
+    return start, min(end, size)
+
+
+def _meta_info(meta: Any) -> dict[str, Any]:
+    is_dir = meta.mime == _load_gdrive().FOLDER_MIME
+    return {
+        "name": meta.id,
+        "size": 0 if is_dir else meta.size,
+        "type": "directory" if is_dir else "file",
+        "filename": meta.name,
+        "mimetype": meta.mime,
+        "md5": meta.md5,
+        "modified": meta.modified,
+    }
+
+
+def _close_client(client: Any, loop: Any) -> None:
+    # Finalizer for the aiohttp session; the loop may already be gone at exit.
+    try:
+        if loop.is_running() and not loop.is_closed():
+            sync(loop, client.close, timeout=1)
+    except Exception:  # pragma: no cover - best effort at interpreter shutdown
+        pass
 
 
 register_implementation(DriveFileSystem.protocol, DriveFileSystem)
@@ -602,7 +1509,7 @@ def filesystem_from_config(
     if not fs_logger.handlers:
         fs_logger.addHandler(logging.NullHandler())
 
-    factory = service_factory or _config_service_factory(cfg)
+    factory = service_factory or ConfigServiceFactory(cfg)
 
     return DriveFileSystem(
         service_factory=factory,
@@ -612,13 +1519,26 @@ def filesystem_from_config(
         logger=fs_logger,
         retries=retries,
         random_cache_limit=rand_limit,
+        cache_policy=cfg.runtime.cache_policy,
+        cache_compression=cfg.runtime.cache_compression,
+        retry_policy=RetryPolicy.from_config(cfg.runtime),
+        credentials_factory=None if service_factory else ConfigCredentials(cfg),
+        hedge=cfg.download.hedge,
+        hedge_percentile=cfg.download.hedge_percentile,
+        hedge_budget=cfg.download.hedge_budget,
+        prefetch_head=cfg.download.prefetch_head_kb * 1024,
+        prefetch_tail=cfg.download.prefetch_tail_kb * 1024,
+        prefetch_ranges=cfg.download.prefetch_ranges,
     )
 
 __all__ = [
+    "ConfigCredentials",
+    "ConfigServiceFactory",
     "DriveFileSystem",
     "DriveResource",
     "DriveURL",
     "DriveSequentialReader",
     "DriveRandomAccessReader",
+    "DriveUploadWriter",
     "filesystem_from_config",
 ]
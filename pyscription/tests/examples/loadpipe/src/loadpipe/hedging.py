@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Optional, TypeVar
+
+T = TypeVar("T")
+
+_MB = 1024 * 1024
+
+
+class Hedger:
+    """
+    Hedge slow Drive requests with a duplicate and keep the first response.
+
+    ``call(fn, *args, size=n)`` runs ``fn(service, *args)`` on a worker thread. If
+    it has not finished after the ``percentile`` latency of the last ``window``
+    attempts, a second copy is started on another worker and whichever succeeds
+    first wins; the loser finishes in the background and is discarded. Workers
+    take their Drive client from ``pool.get()`` (a ``gdrive.ServicePool``), so the
+    two copies never share an httplib2 connection.
+
+    Latencies are kept in seconds per MB of ``size`` (requests under 1 MB count
+    as 1 MB), so chunks of different sizes share one threshold. Each attempt is
+    timed from when it starts running, not from when it was queued, and every
+    successful attempt is recorded, including a slow loser. The executor has two
+    workers per expected caller (``concurrency``): one for the primary and one for
+    its hedge or a loser that is still running.
+
+    Each attempt runs in a copy of the caller's context, and the winner's context
+    variables are copied back, so e.g. ``RetryPolicy.last_retries()`` reports the
+    retries of the attempt whose result was returned.
+
+    Hedges are paid for from a token bucket that earns ``budget`` tokens per call
+    (0.05 = at most ~5% extra requests), capped at ``burst`` tokens.
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        *,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        burst: float = 5.0,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        concurrency: int = 4,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if budget < 0:
+            raise ValueError("budget must be >= 0")
+        self._pool = pool
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._tokens = burst
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=2 * max(1, concurrency), thread_name_prefix="loadpipe-hedge"
+        )
+        self._calls = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._denied = 0
+
+    def threshold(self, size: Optional[int] = None) -> Optional[float]:
+        """Hedge delay in seconds for a ``size``-byte request, or ``None`` until enough latencies are known."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index] * _units(size))
+
+    def snapshot(self) -> dict[str, Any]:
+        threshold = self.threshold()
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+                "budget_denied": self._denied,
+                "threshold_s": round(threshold, 4) if threshold is not None else None,
+            }
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._hedged += 1
+                return True
+            self._denied += 1
+            return False
+
+    def _run(
+        self,
+        fn: Callable[..., T],
+        args: tuple,
+        kwargs: dict,
+        units: float,
+        context: contextvars.Context,
+        running: Optional[threading.Event] = None,
+    ) -> tuple[T, contextvars.Context]:
+        if running is not None:
+            running.set()
+        started = time.monotonic()
+        result = context.run(fn, self._pool.get(), *args, **kwargs)
+        self._observe((time.monotonic() - started) / units)
+        return result, context
+
+    @staticmethod
+    def _adopt(future: Future) -> T:
+        result, context = future.result()
+        for var, value in context.items():
+            var.set(value)
+        return result
+
+    def call(self, fn: Callable[..., T], *args: Any, size: Optional[int] = None, **kwargs: Any) -> T:
+        with self._lock:
+            self._calls += 1
+            self._tokens = min(self.burst, self._tokens + self.budget)
+        units = _units(size)
+        delay = self.threshold(size)
+        # Captured here, on the caller's thread: a worker's own context is not the caller's.
+        context = contextvars.copy_context()
+
+        running = threading.Event()
+        primary: Future = self._executor.submit(self._run, fn, args, kwargs, units, context.copy(), running)
+        if delay is None:
+            return self._adopt(primary)
+
+        # The delay counts from when the primary starts, so time spent queued never triggers a hedge.
+        running.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_token():
+            return self._adopt(primary)
+
+        hedge: Future = self._executor.submit(self._run, fn, args, kwargs, units, context.copy())
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is not None:
+                    first_error = first_error or error
+                    continue
+                if future is hedge:
+                    with self._lock:
+                        self._hedge_wins += 1
+                return self._adopt(future)
+        assert first_error is not None
+        raise first_error
+
+    def _observe(self, seconds_per_mb: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds_per_mb)
+
+    def close(self) -> None:
+        # Losing requests may still be running; let them finish on their own.
+        self._executor.shutdown(wait=False)
+
+
+def _units(size: Optional[int]) -> float:
+    return max(1.0, size / _MB) if size else 1.0
+
+
+__all__ = ["Hedger"]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+import tempfile
+import time
+from typing import Any, BinaryIO, Iterator, Optional
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+_FOLLOW_BLOCK = 2 ** 20  # 1 MiB reads when streaming from a cache entry
+
+
+def _modified_ts(modified: Optional[str]) -> Optional[float]:
+    if not modified:
+        return None
+    try:
+        return dt.datetime.fromisoformat(modified.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    return True
+
+
+class CacheEntry:
+    """
+    One ``<cache_dir>/<file_id>.cache`` entry shared by every process on the host.
+
+    The process holding an exclusive ``flock`` on ``<path>.lock`` is the writer:
+    it records its pid in the lock file, appends to ``<path>.part`` as chunks
+    arrive and renames it over ``<path>`` once complete. Everyone else ``follow``s: a complete entry is read straight
+    from disk, an in-progress one is tailed as the writer flushes, so a hot file
+    is fetched from Drive once per host. Without ``fcntl`` (Windows) there is no
+    coordination; each writer spools to its own temp file as before.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, poll_interval: float = 0.05) -> None:
+        self.path = os.fspath(path)
+        self.part_path = f"{self.path}.part"
+        self.lock_path = f"{self.path}.lock"
+        self.poll_interval = poll_interval
+        self._lock_fd: Optional[int] = None
+        self._part: Optional[BinaryIO] = None
+        self._part_name: Optional[str] = None
+
+    def complete(self, meta: Any) -> bool:
+        """True when ``path`` holds the full payload of the current Drive revision."""
+        if meta.size is None:
+            return False
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        if st.st_size != meta.size:
+            return False
+        modified = _modified_ts(meta.modified)
+        return modified is None or st.st_mtime >= modified
+
+    def _open_lock(self) -> int:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        return os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def try_lock(self) -> bool:
+        """Become the writer unless another process (or handle) already is."""
+        if fcntl is None:
+            return True
+        fd = self._open_lock()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, str(os.getpid()).encode("ascii"), 0)
+        self._lock_fd = fd
+        return True
+
+    def writer_active(self) -> bool:
+        """
+        True while a writer holds the entry lock.
+
+        The pid in the lock file answers the common cases without locking: no pid
+        (idle entry) or a dead pid (crashed writer) means no writer. Only a live pid
+        is confirmed with a shared, non-blocking ``flock`` probe (the pid may have
+        been reused), so followers polling an idle entry never hold a lock that
+        would make a would-be writer's ``try_lock`` fail.
+        """
+        if fcntl is None:
+            return False
+        try:
+            with open(self.lock_path, "rb") as handle:
+                pid = int(handle.read(32) or 0)
+        except (OSError, ValueError):
+            return False
+        if pid <= 0 or not _alive(pid):
+            return False
+        fd = self._open_lock()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except OSError:
+            return True
+        finally:
+            os.close(fd)  # closing drops the probe lock if we got it
+        return False
+
+    def write(self, chunk: bytes) -> None:
+        """Append to the in-progress entry and make it visible to followers."""
+        if self._part is None:
+            if fcntl is None:
+                fd, self._part_name = tempfile.mkstemp(prefix=".tmp.", dir=os.path.dirname(self.path) or ".")
+                self._part = os.fdopen(fd, "wb")
+            else:
+                # Truncate in place: followers of a crashed writer keep tailing the same inode.
+                self._part_name = self.part_path
+                self._part = open(self.part_path, "wb")
+        self._part.write(chunk)
+        self._part.flush()
+
+    def publish(self) -> None:
+        """Move the finished entry into place and release the writer lock."""
+        try:
+            if self._part is None:
+                self.write(b"")
+            assert self._part is not None and self._part_name is not None
+            self._part.close()
+            os.replace(self._part_name, self.path)
+        finally:
+            self._part = None
+            self.release()
+
+    def abandon(self) -> None:
+        """Drop a partial entry (download failed or stopped early) and release the lock."""
+        try:
+            if self._part is not None:
+                self._part.close()
+            if self._part_name and os.path.exists(self._part_name):
+                os.remove(self._part_name)
+        except OSError:
+            pass
+        finally:
+            self._part = None
+            self.release()
+
+    def release(self) -> None:
+        if self._lock_fd is not None:
+            try:
+                os.ftruncate(self._lock_fd, 0)
+            except OSError:
+                pass
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def _open_source(self, meta: Any) -> Optional[BinaryIO]:
+        if self.complete(meta):
+            return open(self.path, "rb")
+        if fcntl is not None and self.writer_active():
+            try:
+                return open(self.part_path, "rb")
+            except FileNotFoundError:
+                # Writer has not created it yet, or just renamed it into place.
+                return None
+        return None
+
+    def follow(self, meta: Any, offset: int, block_size: int = _FOLLOW_BLOCK) -> Iterator[bytes]:
+        """
+        Yield the payload from ``offset`` as far as the cache can provide it.
+
+        Stops at ``meta.size``, or early when no writer is left to extend the
+        entry; the caller then fetches the remainder itself.
+        """
+
+        total = meta.size
+        if total is None:
+            return
+        handle: Optional[BinaryIO] = None
+        try:
+            while offset < total:
+                if handle is None:
+                    handle = self._open_source(meta)
+                    if handle is None:
+                        if not self.writer_active() and not self.complete(meta):
+                            return
+                        time.sleep(self.poll_interval)
+                        continue
+                    handle.seek(offset)
+                data = handle.read(min(block_size, total - offset))
+                if not data:
+                    active = self.writer_active()
+                    # Re-read after probing: the writer flushes before it lets go of the lock.
+                    data = handle.read(min(block_size, total - offset))
+                    if not data:
+                        if not active:
+                            return
+                        time.sleep(self.poll_interval)
+                        continue
+                offset += len(data)
+                yield data
+        finally:
+            if handle is not None:
+                handle.close()
+
+
+__all__ = ["CacheEntry"]
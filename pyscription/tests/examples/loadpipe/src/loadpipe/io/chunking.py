@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Optional
+
+UPLOAD_ALIGNMENT = 256 * 1024  # Drive requires non-final upload chunks in multiples of 256 KiB
+_GROWTH_THRESHOLD = 1.1  # grow again only while throughput improves by >= 10%
+
+
+class ChunkSizer:
+    """
+    Pick the next transfer chunk size from observed throughput.
+
+    Starts at ``minimum`` so the first bytes arrive quickly, doubles while a
+    full-size chunk is noticeably faster (bytes/s) than the previous size, holds
+    once throughput plateaus, and halves after any chunk that needed retries.
+    Sizes stay within ``[minimum, maximum]`` and are multiples of ``alignment``
+    (256 KiB for resumable uploads).
+    """
+
+    def __init__(self, *, minimum: int, maximum: int, alignment: int = 1) -> None:
+        if alignment <= 0:
+            raise ValueError("alignment must be positive")
+        self.alignment = alignment
+        self.minimum = self._align(max(minimum, alignment))
+        self.maximum = max(self.minimum, self._align(maximum))
+        self._size = self.minimum
+        self._best_rate: Optional[float] = None
+
+    @classmethod
+    def fixed(cls, size: int, *, alignment: int = 1) -> "ChunkSizer":
+        return cls(minimum=size, maximum=size, alignment=alignment)
+
+    def _align(self, value: int) -> int:
+        return max(self.alignment, value - value % self.alignment)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def record(self, nbytes: int, elapsed: float, *, retried: bool = False) -> None:
+        """Feed back one transfer of ``nbytes`` that took ``elapsed`` seconds."""
+
+        if retried:
+            self._size = max(self.minimum, self._align(self._size // 2))
+            self._best_rate = None
+            return
+        if nbytes < self._size or elapsed <= 0:
+            return  # short final chunk: says nothing about this size
+        rate = nbytes / elapsed
+        if self._best_rate is None or rate >= self._best_rate * _GROWTH_THRESHOLD:
+            self._best_rate = rate
+            self._size = min(self.maximum, self._size * 2)
+        else:
+            self._best_rate = max(self._best_rate, rate)
+
+
+__all__ = ["ChunkSizer", "UPLOAD_ALIGNMENT"]
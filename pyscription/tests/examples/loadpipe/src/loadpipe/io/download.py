@@ -3,17 +3,57 @@ from __future__ import annotations
 import datetime as dt
 import logging
 import os
-import tempfile
 import time
 from typing import Any, Iterator, Optional
 
 from ..adapters import gdrive
+from ..hedging import Hedger
 from ..log import log_progress
+from ..retry import RetryPolicy
 from ..state import Manifest
-from .fs import atomic_write
+from .cachefile import CacheEntry
+from .chunking import ChunkSizer
 
 _LOG_STAGE = "download"
-_CACHE_READ_CHUNK = 2 ** 20  # 1 MiB blocks when copying into cache
+
+
+def _record(manifest: Manifest, file_meta: gdrive.FileMeta, bytes_done: int) -> None:
+    manifest.upsert_download(
+        file_id=file_meta.id,
+        name=file_meta.name,
+        etag=file_meta.md5,
+        modified=file_meta.modified,
+        bytes_done=bytes_done,
+        updated_at=dt.datetime.utcnow().isoformat(),
+    )
+
+
+def _resume_point(
+    manifest: Manifest,
+    file_meta: gdrive.FileMeta,
+    cache_path: Optional[str | os.PathLike[str]],
+    start: Optional[int] = None,
+) -> tuple[int, Optional[str]]:
+    """
+    Return ``(resume_from, cache_target)`` and register the download in the manifest.
+
+    ``start`` overrides the recorded progress (a reader that seeked elsewhere).
+    """
+
+    cache_target = os.fspath(cache_path) if cache_path is not None else None
+
+    if start is not None:
+        resume_from = start
+    else:
+        existing = manifest.get_download(file_meta.id)
+        resume_from = int(existing.get("bytes_done", 0)) if existing else 0
+
+    # We can only populate cache when we download from scratch.
+    if cache_target is not None and resume_from > 0:
+        cache_target = None
+
+    _record(manifest, file_meta, resume_from)
+    return resume_from, cache_target
 
 
 def download_iter(
@@ -23,41 +63,38 @@ def download_iter(
     file_meta: gdrive.FileMeta,
     chunk_size: int,
     logger: logging.Logger,
-    retries: int = 5,
+    retry_policy: Optional[RetryPolicy] = None,
     cache_path: Optional[str | os.PathLike[str]] = None,
+    chunk_sizer: Optional[ChunkSizer] = None,
+    hedger: Optional[Hedger] = None,
+    start: Optional[int] = None,
 ) -> Iterator[bytes]:
     """
     Stream file content from Google Drive by ranges with resume support.
 
     The function:
       * reads previous progress from the manifest and resumes downloads
-      * yields chunks of raw bytes to the caller
+        (or starts at ``start`` when given, e.g. after a reader seeked)
+      * yields chunks of raw bytes to the caller; range sizes come from
+        ``chunk_sizer`` when given (adaptive), otherwise a fixed ``chunk_size``
       * updates progress in the manifest after every successful chunk
+      * leaves retries to ``retry_policy`` (default: the gdrive process-wide policy)
+      * optionally hedges slow range requests through ``hedger``
       * logs progress via log_progress()
-      * optionally persists the fully downloaded payload into a cache file
-        using fs.atomic_write (only if we start from byte 0)
+      * with ``cache_path``, coordinates with other processes through a
+        ``CacheEntry``: a complete entry (or one another process is still
+        writing) is streamed from disk, and only the remainder comes from Drive;
+        a download from byte 0 that wins the entry lock populates it
     """
 
     if chunk_size <= 0:
         raise ValueError("chunk_size must be positive")
 
-    cache_target = os.fspath(cache_path) if cache_path is not None else None
+    policy = retry_policy or gdrive.get_retry_policy()
+    sizer = chunk_sizer or ChunkSizer.fixed(chunk_size)
 
-    existing = manifest.get_download(file_meta.id)
-    resume_from = int(existing.get("bytes_done", 0)) if existing else 0
-
-    # We can only populate cache when we download from scratch.
-    if cache_target is not None and resume_from > 0:
-        cache_target = None
-
-    manifest.upsert_download(
-        file_id=file_meta.id,
-        name=file_meta.name,
-        etag=file_meta.md5,
-        modified=file_meta.modified,
-        bytes_done=resume_from,
-        updated_at=dt.datetime.utcnow().isoformat(),
-    )
+    resume_from, cache_target = _resume_point(manifest, file_meta, cache_path, start)
+    entry = CacheEntry(cache_path) if cache_path is not None else None
 
     total = file_meta.size
 
@@ -66,38 +103,59 @@ def download_iter(
 
         offset = resume_from
         bytes_done = resume_from
-        cache_tmp: Optional[tempfile.NamedTemporaryFile] = None
-        cache_tmp_path: Optional[str] = None
+        writing = False
         completed = False
 
-        if cache_target is not None:
-            cache_tmp = tempfile.NamedTemporaryFile(mode="wb", delete=False)
-            cache_tmp_path = cache_tmp.name
+        if entry is not None and not entry.complete(file_meta):
+            # Only a download from byte 0 can populate the cache.
+            writing = cache_target is not None and entry.try_lock()
+            if writing and entry.complete(file_meta):
+                entry.release()
+                writing = False
 
         last_log_at = time.monotonic()
         last_logged_bytes = bytes_done
 
+        def _progress(attempt: int, chunk_size: int) -> None:
+            nonlocal last_log_at, last_logged_bytes
+            _record(manifest, file_meta, bytes_done)
+            now = time.monotonic()
+            elapsed = now - last_log_at
+            rate = None
+            if elapsed > 0:
+                rate = (bytes_done - last_logged_bytes) / elapsed / (1024 * 1024)
+            log_progress(logger, _LOG_STAGE, bytes_done, total, attempt, rate, chunk_size=chunk_size)
+            last_log_at = now
+            last_logged_bytes = bytes_done
+
         try:
             if total is not None and bytes_done >= total:
                 completed = True
                 log_progress(logger, _LOG_STAGE, bytes_done, total, 0, None)
                 return
 
+            if entry is not None and not writing:
+                for chunk in entry.follow(file_meta, offset):
+                    offset += len(chunk)
+                    bytes_done += len(chunk)
+                    _progress(0, len(chunk))
+                    yield chunk
+
             while total is None or offset < total:
-                end = offset + chunk_size - 1
+                requested = sizer.size
+                end = offset + requested - 1
                 if total is not None:
                     end = min(end, total - 1)
 
-                attempt = 0
-                while True:
-                    try:
-                        chunk = gdrive.download_range(service, file_meta.id, offset, end)
-                        break
-                    except Exception:  # pragma: no cover - delegated retry logic
-                        attempt += 1
-                        if attempt > retries:
-                            raise
-                        time.sleep(min(2 ** attempt, 10))
+                started = time.monotonic()
+                if hedger is not None:
+                    chunk = hedger.call(
+                        gdrive.download_range, file_meta.id, offset, end, size=end - offset + 1, policy=policy
+                    )
+                else:
+                    chunk = gdrive.download_range(service, file_meta.id, offset, end, policy=policy)
+                attempt = policy.last_retries()
+                sizer.record(len(chunk), time.monotonic() - started, retried=attempt > 0)
 
                 if not chunk:
                     # No data returned, treat as end of stream when total unknown.
@@ -112,56 +170,23 @@ def download_iter(
                 offset += chunk_len
                 bytes_done += chunk_len
 
-                if cache_tmp is not None:
-                    cache_tmp.write(chunk)
-
-                manifest.upsert_download(
-                    file_id=file_meta.id,
-                    name=file_meta.name,
-                    etag=file_meta.md5,
-                    modified=file_meta.modified,
-                    bytes_done=bytes_done,
-                    updated_at=dt.datetime.utcnow().isoformat(),
-                )
-
-                now = time.monotonic()
-                elapsed = now - last_log_at
-                rate = None
-                if elapsed > 0:
-                    rate = (bytes_done - last_logged_bytes) / elapsed / (1024 * 1024)
-                log_progress(logger, _LOG_STAGE, bytes_done, total, attempt, rate)
-                last_log_at = now
-                last_logged_bytes = bytes_done
+                if writing:
+                    entry.write(chunk)
+
+                _progress(attempt, requested)
 
                 yield chunk
 
                 if total is not None and bytes_done >= total:
-                    completed = True
                     break
 
-            if total is None:
-                completed = True
+            completed = total is None or bytes_done >= total
         finally:
-            if cache_tmp is not None:
-                cache_tmp.flush()
-                cache_tmp.close()
-
-            if cache_tmp_path and cache_target and completed:
-                def _cache_reader() -> Iterator[bytes]:
-                    with open(cache_tmp_path, "rb") as cached:
-                        while True:
-                            chunk = cached.read(_CACHE_READ_CHUNK)
-                            if not chunk:
-                                break
-                            yield chunk
-
-                atomic_write(cache_target, _cache_reader())
-
-            if cache_tmp_path and os.path.exists(cache_tmp_path):
-                try:
-                    os.remove(cache_tmp_path)
-                except OSError:
-                    pass
+            if writing:
+                if completed:
+                    entry.publish()
+                else:
+                    entry.abandon()
 
         resume_from = bytes_done
 
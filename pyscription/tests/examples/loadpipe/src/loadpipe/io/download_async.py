@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import AsyncIterator, Optional
+
+from ..adapters import gdrive, gdrive_async
+from ..log import log_progress
+from ..retry import RetryPolicy
+from ..state import Manifest
+from .cachefile import CacheEntry
+from .chunking import ChunkSizer
+from .download import _LOG_STAGE, _record, _resume_point
+
+
+async def adownload_iter(
+    client: gdrive_async.AsyncDriveClient,
+    manifest: Manifest,
+    *,
+    file_meta: gdrive.FileMeta,
+    chunk_size: int,
+    logger: logging.Logger,
+    retry_policy: Optional[RetryPolicy] = None,
+    cache_path: Optional[str | os.PathLike[str]] = None,
+    chunk_sizer: Optional[ChunkSizer] = None,
+    start: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Async ``download_iter``: ``async for chunk in adownload_iter(client, manifest, ...)``.
+
+    Resume point (or ``start``), per-chunk manifest updates, adaptive chunk sizes,
+    progress logs and the shared ``CacheEntry`` (follow another writer, or
+    populate the entry from byte 0) behave like the blocking version. Range
+    requests go through ``client``; manifest writes and cache file I/O run in
+    worker threads, so ``manifest`` must allow that (a ``SharedManifest``, or a
+    ``Manifest`` opened with ``check_same_thread=False``).
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    policy = retry_policy or gdrive.get_retry_policy()
+    sizer = chunk_sizer or ChunkSizer.fixed(chunk_size)
+
+    resume_from, cache_target = await asyncio.to_thread(_resume_point, manifest, file_meta, cache_path, start)
+    entry = CacheEntry(cache_path) if cache_path is not None else None
+    total = file_meta.size
+
+    offset = resume_from
+    bytes_done = resume_from
+    writing = False
+    completed = False
+
+    if entry is not None and not await asyncio.to_thread(entry.complete, file_meta):
+        # Only a download from byte 0 can populate the cache.
+        writing = cache_target is not None and await asyncio.to_thread(entry.try_lock)
+        if writing and await asyncio.to_thread(entry.complete, file_meta):
+            entry.release()
+            writing = False
+
+    last_log_at = time.monotonic()
+    last_logged_bytes = bytes_done
+
+    async def _progress(attempt: int, chunk_size: int) -> None:
+        nonlocal last_log_at, last_logged_bytes
+        await asyncio.to_thread(_record, manifest, file_meta, bytes_done)
+        now = time.monotonic()
+        elapsed = now - last_log_at
+        rate = None
+        if elapsed > 0:
+            rate = (bytes_done - last_logged_bytes) / elapsed / (1024 * 1024)
+        log_progress(logger, _LOG_STAGE, bytes_done, total, attempt, rate, chunk_size=chunk_size)
+        last_log_at = now
+        last_logged_bytes = bytes_done
+
+    try:
+        if total is not None and bytes_done >= total:
+            completed = True
+            log_progress(logger, _LOG_STAGE, bytes_done, total, 0, None)
+            return
+
+        if entry is not None and not writing:
+            # ``follow`` reads files and polls with sleeps; step it from a worker thread.
+            cached = entry.follow(file_meta, offset)
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(next, cached, None)
+                    if chunk is None:
+                        break
+                    offset += len(chunk)
+                    bytes_done += len(chunk)
+                    await _progress(0, len(chunk))
+                    yield chunk
+            finally:
+                cached.close()
+
+        while total is None or offset < total:
+            requested = sizer.size
+            end = offset + requested - 1
+            if total is not None:
+                end = min(end, total - 1)
+
+            started = time.monotonic()
+            chunk = await gdrive_async.adownload_range(client, file_meta.id, offset, end, policy=policy)
+            # Concurrent transfers share policy.stats, so count this task's retries only.
+            attempt = policy.last_retries()
+            sizer.record(len(chunk), time.monotonic() - started, retried=attempt > 0)
+
+            if not chunk:
+                if total is None:
+                    break
+                if bytes_done >= (total or 0):
+                    break
+                raise RuntimeError(f"Unexpected empty chunk while downloading {file_meta.id}")
+
+            chunk_len = len(chunk)
+            offset += chunk_len
+            bytes_done += chunk_len
+
+            if writing:
+                await asyncio.to_thread(entry.write, chunk)
+
+            await _progress(attempt, requested)
+
+            yield chunk
+
+            if total is not None and bytes_done >= total:
+                break
+
+        completed = total is None or bytes_done >= total
+    finally:
+        if writing:
+            await asyncio.to_thread(entry.publish if completed else entry.abandon)
+
+
+__all__ = ["adownload_iter"]
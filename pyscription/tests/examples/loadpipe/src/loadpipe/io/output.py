@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+_NO_FALLOCATE = {errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL}
+_HASH_BLOCK = 2 ** 20  # 1 MiB reads when checksumming a finished output
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve ``size`` bytes up front (so a full disk fails now), or at least set the length."""
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError as exc:
+            if exc.errno not in _NO_FALLOCATE:
+                raise
+    os.ftruncate(fd, size)
+
+
+class OffsetFile:
+    """
+    Local output of known size, preallocated and written at explicit offsets.
+
+    Opening never truncates, so a partial output from an earlier run keeps its
+    bytes and can be continued in place. ``pwrite`` does not share a cursor, so
+    several range writers may fill one ``OffsetFile`` concurrently.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], size: int) -> None:
+        self.path = os.fspath(path)
+        self.size = size
+        self._fd: Optional[int] = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(self._fd).st_size != size:
+                _preallocate(self._fd, size)
+        except BaseException:
+            self.close()
+            raise
+
+    def pwrite(self, data: Any, offset: int) -> None:
+        if self._fd is None:
+            raise ValueError("OffsetFile is closed.")
+        view = memoryview(data).cast("B")
+        if offset < 0 or offset + len(view) > self.size:
+            raise ValueError(f"Write of {len(view)} bytes at {offset} exceeds the output size {self.size}")
+        while view:
+            if hasattr(os, "pwrite"):
+                written = os.pwrite(self._fd, view, offset)
+            else:  # pragma: no cover - Windows
+                os.lseek(self._fd, offset, os.SEEK_SET)
+                written = os.write(self._fd, view)
+            view = view[written:]
+            offset += written
+
+    def sync(self) -> None:
+        if self._fd is not None:
+            os.fsync(self._fd)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "OffsetFile":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def partial_path(target: str | os.PathLike[str], file_id: str) -> Path:
+    """Where the output for ``target`` lives until it is complete; tied to the Drive file id."""
+    target = Path(target)
+    return target.with_name(f".{target.name}.{file_id}.part")
+
+
+def progress_path(part: str | os.PathLike[str]) -> Path:
+    """Sidecar recording how much of the partial output ``part`` has been written."""
+    return Path(f"{os.fspath(part)}.progress")
+
+
+def _revision(meta: Any) -> dict[str, Any]:
+    return {"etag": meta.md5, "modified": meta.modified, "size": meta.size}
+
+
+def record_progress(part: str | os.PathLike[str], meta: Any, bytes_written: int) -> None:
+    """
+    Record that the first ``bytes_written`` bytes of ``part`` hold ``meta``'s revision.
+
+    Called after the bytes are written, and replaced atomically, so the sidecar
+    never claims more than the partial holds.
+    """
+    sidecar = progress_path(part)
+    tmp = sidecar.with_name(f"{sidecar.name}.tmp")
+    tmp.write_text(json.dumps({**_revision(meta), "bytes_written": bytes_written}), encoding="utf-8")
+    os.replace(tmp, sidecar)
+
+
+def clear_progress(part: str | os.PathLike[str]) -> None:
+    try:
+        os.remove(progress_path(part))
+    except FileNotFoundError:
+        pass
+
+
+def resume_offset(part: str | os.PathLike[str], meta: Any) -> int:
+    """
+    Offset a partial output can be continued from, or 0 when it cannot be trusted.
+
+    Progress is read from the partial's own sidecar (``progress_path``), not the
+    per-file manifest record, so another output path of the same file never
+    vouches for this one. The partial must have the preallocated size, and the
+    sidecar must describe the current Drive revision (``etag``/``modified``/size).
+    """
+
+    if meta.size is None:
+        return 0
+    try:
+        size = os.stat(part).st_size
+        record = json.loads(progress_path(part).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0
+    if size != meta.size or not isinstance(record, dict):
+        return 0
+    if any(record.get(key) != value for key, value in _revision(meta).items()):
+        return 0
+    done = record.get("bytes_written")
+    if not isinstance(done, int) or not 0 <= done <= meta.size:
+        return 0
+    return done
+
+
+def file_md5(path: str | os.PathLike[str]) -> str:
+    digest = hashlib.md5()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+__all__ = [
+    "OffsetFile",
+    "clear_progress",
+    "file_md5",
+    "partial_path",
+    "progress_path",
+    "record_progress",
+    "resume_offset",
+]
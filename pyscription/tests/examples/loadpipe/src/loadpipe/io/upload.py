@@ -3,16 +3,182 @@ from __future__ import annotations
 import datetime as dt
 import logging
 import time
-from typing import Any, Iterable, Iterator, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from ..adapters import gdrive
 from ..errors import ResumeMismatchError
 from ..log import log_progress
+from ..retry import RetryPolicy
 from ..state import Manifest
+from .chunking import UPLOAD_ALIGNMENT, ChunkSizer
 
 _LOG_STAGE = "upload"
 
 
+class _Reblocker:
+    """
+    Incremental re-blocking shared by ``_reblock`` and its async twin.
+
+    ``feed`` lazily yields blocks that are known not to be the last one (one
+    block is held back as lookahead); ``finish`` returns the remaining
+    ``(block, is_last)`` pairs once the input is exhausted.
+    """
+
+    def __init__(self, alignment: int, block_size: Optional[Callable[[], int]]) -> None:
+        self._alignment = alignment
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._pending: Optional[bytes] = None
+
+    @property
+    def buffered(self) -> int:
+        """Bytes fed but not yet returned as blocks."""
+        return len(self._buffer) + (len(self._pending) if self._pending is not None else 0)
+
+    def _push(self, block: bytes) -> Iterator[bytes]:
+        if self._pending is not None:
+            yield self._pending
+        self._pending = block
+
+    def feed(self, chunk: bytes) -> Iterator[bytes]:
+        if not chunk:
+            return
+        if self._block_size is None and not self._buffer and len(chunk) % self._alignment == 0:
+            yield from self._push(chunk)
+            return
+        self._buffer += chunk
+        while True:
+            if self._block_size is not None:
+                target = self._block_size()
+            else:
+                target = len(self._buffer) - len(self._buffer) % self._alignment
+            if not target or len(self._buffer) < target:
+                return
+            block = bytes(self._buffer[:target])
+            del self._buffer[:target]
+            yield from self._push(block)
+
+    def finish(self) -> list[tuple[bytes, bool]]:
+        out: list[tuple[bytes, bool]] = []
+        if self._buffer:
+            out.extend((block, False) for block in self._push(bytes(self._buffer)))
+            self._buffer.clear()
+        if self._pending is not None:
+            out.append((self._pending, True))
+            self._pending = None
+        return out
+
+
+def _reblock(
+    chunks: Iterable[bytes],
+    alignment: int = UPLOAD_ALIGNMENT,
+    block_size: Optional[Callable[[], int]] = None,
+) -> Iterator[tuple[bytes, bool]]:
+    """
+    Yield ``(block, is_last)`` pairs where every non-final block is a multiple of ``alignment``.
+
+    Without ``block_size`` blocks follow the input chunking; with it, every
+    non-final block is cut to exactly ``block_size()`` bytes (asked again for
+    each block, so an adaptive sizer takes effect as the upload progresses).
+    """
+
+    blocker = _Reblocker(alignment, block_size)
+    for chunk in chunks:
+        for block in blocker.feed(chunk):
+            yield block, False
+    yield from blocker.finish()
+
+
+def _record(
+    manifest: Manifest,
+    session: gdrive.UploadSession,
+    bytes_done: int,
+    total: Optional[int],
+) -> None:
+    manifest.upsert_upload(
+        session_id=session.session_url,
+        file_id=None,
+        name=session.name,
+        folder_id=session.folder_id,
+        bytes_done=bytes_done,
+        total=total,
+        updated_at=dt.datetime.utcnow().isoformat(),
+    )
+
+
+def _recorded_session(
+    manifest: Manifest,
+    *,
+    session_url: Optional[str],
+    name: str,
+    folder_id: str,
+    total: Optional[int],
+) -> tuple[Optional[gdrive.UploadSession], Optional[int], int]:
+    """
+    Look up a resumable session in the manifest.
+
+    Returns ``(session, known_total, bytes_done)``; ``session`` is ``None`` when a
+    new session has to be started.
+    """
+
+    record = manifest.get_upload(session_url) if session_url else None
+    known_total = total if total is not None else (record.get("total") if record else None)
+    if not record:
+        return None, known_total, 0
+
+    recorded_total = record.get("total")
+    if known_total is None and recorded_total is not None:
+        known_total = recorded_total
+    elif known_total is not None and recorded_total is not None and int(known_total) != int(recorded_total):
+        raise ResumeMismatchError("Upload total size mismatch for resumable session")
+
+    session_url = session_url or record.get("session_id")
+    if not session_url:
+        raise ResumeMismatchError("Manifest entry for upload is missing session_id")
+
+    session = gdrive.UploadSession(
+        session_url=session_url,
+        name=record.get("name") or name,
+        folder_id=record.get("folder_id") or folder_id or "",
+        total=known_total,
+    )
+    return session, known_total, int(record.get("bytes_done") or 0)
+
+
+def _check_remote_offset(remote_offset: int, known_total: Optional[int]) -> None:
+    if remote_offset < 0:
+        raise ResumeMismatchError("Remote upload offset cannot be negative")
+    if known_total is not None and remote_offset > known_total:
+        raise ResumeMismatchError("Remote upload offset exceeds expected total size")
+
+
+def _skip_uploaded(data_iterator: Iterator[bytes], resume_skip: int) -> Iterator[bytes]:
+    """Drop the first ``resume_skip`` bytes of the local stream (already on Drive)."""
+
+    skipped = 0
+    while skipped < resume_skip:
+        try:
+            chunk = next(data_iterator)
+        except StopIteration as exc:
+            raise ResumeMismatchError(
+                "Local data stream shorter than recorded upload offset"
+            ) from exc
+        if not chunk:
+            continue
+
+        chunk_len = len(chunk)
+        remaining = resume_skip - skipped
+        if chunk_len <= remaining:
+            skipped += chunk_len
+            continue
+
+        yield chunk[remaining:]
+        skipped = resume_skip
+        break
+
+    yield from data_iterator
+
+
 def upload_iter(
     service: Any,
     manifest: Manifest,
@@ -22,8 +188,9 @@ def upload_iter(
     folder_id: str,
     logger: logging.Logger,
     total: Optional[int] = None,
-    retries: int = 5,
+    retry_policy: Optional[RetryPolicy] = None,
     session_url: Optional[str] = None,
+    chunk_sizer: Optional[ChunkSizer] = None,
 ) -> Iterator[int]:
     """
     Upload the provided byte stream to Google Drive using resumable upload.
@@ -31,83 +198,46 @@ def upload_iter(
     Responsibilities:
       * create a new resumable session or resume an existing one
       * use the manifest to track progress and survive restarts
-      * send chunks with proper Content-Range
-      * log progress after each successful chunk
+      * re-block the stream into 256 KiB-aligned chunks with proper Content-Range
+        (sized by ``chunk_sizer`` when given, otherwise following the input chunks)
+      * log progress after each successful chunk (retries are left to ``retry_policy``)
       * perform basic completion validation
 
     Yields the cumulative number of bytes uploaded after every chunk.
     """
 
-    record = manifest.get_upload(session_url) if session_url else None
-    known_total = total if total is not None else (record.get("total") if record else None)
+    policy = retry_policy or gdrive.get_retry_policy()
+    if chunk_sizer is not None and chunk_sizer.alignment % UPLOAD_ALIGNMENT:
+        raise ValueError("chunk_sizer alignment must be a multiple of 256 KiB for uploads")
 
-    if record:
-        recorded_total = record.get("total")
-        if known_total is None and recorded_total is not None:
-            known_total = recorded_total
-        elif known_total is not None and recorded_total is not None and int(known_total) != int(recorded_total):
-            raise ResumeMismatchError("Upload total size mismatch for resumable session")
-
-        session_name = record.get("name") or name
-        session_folder = record.get("folder_id") or folder_id
-        session_url = session_url or record.get("session_id")
-        if not session_url:
-            raise ResumeMismatchError("Manifest entry for upload is missing session_id")
-
-        session = gdrive.UploadSession(
-            session_url=session_url,
-            name=session_name,
-            folder_id=session_folder or "",
-            total=known_total,
-        )
-        bytes_done = int(record.get("bytes_done") or 0)
-    else:
+    session, known_total, bytes_done = _recorded_session(
+        manifest, session_url=session_url, name=name, folder_id=folder_id, total=total
+    )
+    if session is None:
         session = gdrive.begin_resumable_upload(
             service,
             name=name,
             folder_id=folder_id,
             size=known_total,
+            policy=policy,
         )
-        session_url = session.session_url
-        bytes_done = 0
-        now_iso = dt.datetime.utcnow().isoformat()
-        manifest.upsert_upload(
-            session_id=session_url,
-            file_id=None,
-            name=name,
-            folder_id=folder_id,
-            bytes_done=bytes_done,
-            total=known_total,
-            updated_at=now_iso,
-        )
+        _record(manifest, session, bytes_done, known_total)
 
     resume_skip = bytes_done
     if resume_skip:
         try:
-            remote_offset = gdrive.query_upload_status(service, session, total=known_total)
+            remote_offset = gdrive.query_upload_status(service, session, total=known_total, policy=policy)
         except Exception as exc:  # pragma: no cover - defensive safety net
             raise ResumeMismatchError("Unable to determine remote upload offset") from exc
 
-        if remote_offset < 0:
-            raise ResumeMismatchError("Remote upload offset cannot be negative")
-        if known_total is not None and remote_offset > known_total:
-            raise ResumeMismatchError("Remote upload offset exceeds expected total size")
-
+        _check_remote_offset(remote_offset, known_total)
         if remote_offset != resume_skip:
             logger.warning(
                 "Adjusting resumable upload offset from %s to %s", resume_skip, remote_offset
             )
             bytes_done = remote_offset
             resume_skip = remote_offset
-            manifest.upsert_upload(
-                session_id=session_url or session.session_url,
-                file_id=None,
-                name=session.name,
-                folder_id=session.folder_id,
-                bytes_done=bytes_done,
-                total=known_total,
-                updated_at=dt.datetime.utcnow().isoformat(),
-            )
+            _record(manifest, session, bytes_done, known_total)
 
     offset = bytes_done
     last_log_at = time.monotonic()
@@ -118,92 +248,48 @@ def upload_iter(
         nonlocal offset, bytes_done, known_total, last_log_at, last_logged_bytes
 
         # Update manifest with resume metadata in case run restarted with new params.
-        manifest.upsert_upload(
-            session_id=session_url or session.session_url,
-            file_id=None,
-            name=session.name,
-            folder_id=session.folder_id,
-            bytes_done=bytes_done,
-            total=known_total,
-            updated_at=dt.datetime.utcnow().isoformat(),
-        )
+        _record(manifest, session, bytes_done, known_total)
 
         if known_total is not None and bytes_done >= known_total:
             log_progress(logger, _LOG_STAGE, bytes_done, known_total, 0, None)
             return
 
-        def _aligned_chunks() -> Iterator[bytes]:
-            if resume_skip <= 0:
-                yield from data_iterator
-                return
-
-            skipped = 0
-            while skipped < resume_skip:
-                try:
-                    chunk = next(data_iterator)
-                except StopIteration as exc:
-                    raise ResumeMismatchError(
-                        "Local data stream shorter than recorded upload offset"
-                    ) from exc
-                if not chunk:
-                    continue
-
-                chunk_len = len(chunk)
-                remaining = resume_skip - skipped
-                if chunk_len <= remaining:
-                    skipped += chunk_len
-                    continue
-
-                yield chunk[remaining:]
-                skipped = resume_skip
-                break
-
-            yield from data_iterator
-
-        for chunk in _aligned_chunks():
-            if not chunk:
-                continue
+        block_size: Optional[Callable[[], int]] = None
+        if chunk_sizer is not None:
+            block_size = lambda: chunk_sizer.size
 
+        source = _skip_uploaded(data_iterator, resume_skip) if resume_skip > 0 else data_iterator
+        for chunk, is_last in _reblock(source, block_size=block_size):
             start = offset
             end = start + len(chunk) - 1
-
-            attempt = 0
-            while True:
-                try:
-                    next_offset = gdrive.upload_chunk(
-                        service,
-                        session,
-                        chunk,
-                        start,
-                        end,
-                        total=known_total,
-                    )
-                    break
-                except Exception:  # pragma: no cover - delegated retry logic
-                    attempt += 1
-                    if attempt > retries:
-                        raise
-                    time.sleep(min(2 ** attempt, 10))
+            # Unknown totals are declared on the final chunk so Drive can finalize the file.
+            chunk_total = known_total if known_total is not None else (end + 1 if is_last else None)
+
+            started = time.monotonic()
+            next_offset = gdrive.upload_chunk(
+                service,
+                session,
+                chunk,
+                start,
+                end,
+                total=chunk_total,
+                policy=policy,
+            )
+            attempt = policy.last_retries()
+            if chunk_sizer is not None:
+                chunk_sizer.record(len(chunk), time.monotonic() - started, retried=attempt > 0)
 
             offset = next_offset
             bytes_done = offset
 
-            manifest.upsert_upload(
-                session_id=session_url or session.session_url,
-                file_id=None,
-                name=session.name,
-                folder_id=session.folder_id,
-                bytes_done=bytes_done,
-                total=known_total,
-                updated_at=dt.datetime.utcnow().isoformat(),
-            )
+            _record(manifest, session, bytes_done, known_total)
 
             now = time.monotonic()
             elapsed = now - last_log_at
             rate = None
             if elapsed > 0:
                 rate = (bytes_done - last_logged_bytes) / elapsed / (1024 * 1024)
-            log_progress(logger, _LOG_STAGE, bytes_done, known_total, attempt, rate)
+            log_progress(logger, _LOG_STAGE, bytes_done, known_total, attempt, rate, chunk_size=len(chunk))
             last_log_at = now
             last_logged_bytes = bytes_done
 
@@ -217,15 +303,7 @@ def upload_iter(
         else:
             known_total = bytes_done
 
-        manifest.upsert_upload(
-            session_id=session_url or session.session_url,
-            file_id=None,
-            name=session.name,
-            folder_id=session.folder_id,
-            bytes_done=bytes_done,
-            total=known_total,
-            updated_at=dt.datetime.utcnow().isoformat(),
-        )
+        _record(manifest, session, bytes_done, known_total)
         log_progress(logger, _LOG_STAGE, bytes_done, known_total, 0, None)
 
     return _emit()
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Optional, Union
+
+from ..adapters import gdrive, gdrive_async
+from ..errors import ResumeMismatchError
+from ..log import log_progress
+from ..retry import RetryPolicy
+from ..state import Manifest
+from .chunking import UPLOAD_ALIGNMENT, ChunkSizer
+from .upload import _LOG_STAGE, _check_remote_offset, _record, _recorded_session, _Reblocker
+
+ByteSource = Union[AsyncIterable[bytes], Iterable[bytes]]
+
+
+async def _aiter(data: ByteSource) -> AsyncIterator[bytes]:
+    if hasattr(data, "__aiter__"):
+        async for chunk in data:  # type: ignore[union-attr]
+            yield chunk
+    else:
+        for chunk in data:  # type: ignore[union-attr]
+            yield chunk
+
+
+async def _askip_uploaded(chunks: AsyncIterator[bytes], resume_skip: int) -> AsyncIterator[bytes]:
+    """Async ``_skip_uploaded``: drop the first ``resume_skip`` bytes of the local stream."""
+
+    skipped = 0
+    while skipped < resume_skip:
+        try:
+            chunk = await chunks.__anext__()
+        except StopAsyncIteration as exc:
+            raise ResumeMismatchError(
+                "Local data stream shorter than recorded upload offset"
+            ) from exc
+        if not chunk:
+            continue
+
+        chunk_len = len(chunk)
+        remaining = resume_skip - skipped
+        if chunk_len <= remaining:
+            skipped += chunk_len
+            continue
+
+        yield chunk[remaining:]
+        skipped = resume_skip
+        break
+
+    async for chunk in chunks:
+        yield chunk
+
+
+async def _areblock(
+    chunks: AsyncIterable[bytes],
+    alignment: int = UPLOAD_ALIGNMENT,
+    block_size: Optional[Callable[[], int]] = None,
+) -> AsyncIterator[tuple[bytes, bool]]:
+    blocker = _Reblocker(alignment, block_size)
+    async for chunk in chunks:
+        for block in blocker.feed(chunk):
+            yield block, False
+    for pair in blocker.finish():
+        yield pair
+
+
+async def aupload_iter(
+    client: gdrive_async.AsyncDriveClient,
+    manifest: Manifest,
+    *,
+    data_iter: ByteSource,
+    name: str,
+    folder_id: str,
+    logger: logging.Logger,
+    total: Optional[int] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    session_url: Optional[str] = None,
+    chunk_sizer: Optional[ChunkSizer] = None,
+) -> AsyncIterator[int]:
+    """
+    Async ``upload_iter`` over an async (or plain) byte iterable.
+
+    Session reuse, remote offset reconciliation, 256 KiB re-blocking, manifest
+    updates and completion checks are shared with the blocking version.
+    Yields the cumulative number of bytes uploaded after every chunk.
+    """
+
+    policy = retry_policy or gdrive.get_retry_policy()
+    if chunk_sizer is not None and chunk_sizer.alignment % UPLOAD_ALIGNMENT:
+        raise ValueError("chunk_sizer alignment must be a multiple of 256 KiB for uploads")
+
+    session, known_total, bytes_done = _recorded_session(
+        manifest, session_url=session_url, name=name, folder_id=folder_id, total=total
+    )
+    if session is None:
+        session = await gdrive_async.abegin_resumable_upload(
+            client,
+            name=name,
+            folder_id=folder_id,
+            size=known_total,
+            policy=policy,
+        )
+        _record(manifest, session, bytes_done, known_total)
+
+    resume_skip = bytes_done
+    if resume_skip:
+        try:
+            remote_offset = await gdrive_async.aquery_upload_status(
+                client, session, total=known_total, policy=policy
+            )
+        except Exception as exc:  # pragma: no cover - defensive safety net
+            raise ResumeMismatchError("Unable to determine remote upload offset") from exc
+
+        _check_remote_offset(remote_offset, known_total)
+        if remote_offset != resume_skip:
+            logger.warning(
+                "Adjusting resumable upload offset from %s to %s", resume_skip, remote_offset
+            )
+            bytes_done = remote_offset
+            resume_skip = remote_offset
+            _record(manifest, session, bytes_done, known_total)
+
+    _record(manifest, session, bytes_done, known_total)
+    if known_total is not None and bytes_done >= known_total:
+        log_progress(logger, _LOG_STAGE, bytes_done, known_total, 0, None)
+        return
+
+    block_size: Optional[Callable[[], int]] = None
+    if chunk_sizer is not None:
+        block_size = lambda: chunk_sizer.size
+
+    source = _aiter(data_iter)
+    if resume_skip > 0:
+        source = _askip_uploaded(source, resume_skip)
+
+    offset = bytes_done
+    last_log_at = time.monotonic()
+    last_logged_bytes = bytes_done
+    async for chunk, is_last in _areblock(source, block_size=block_size):
+        start = offset
+        end = start + len(chunk) - 1
+        chunk_total = known_total if known_total is not None else (end + 1 if is_last else None)
+
+        started = time.monotonic()
+        offset = await gdrive_async.aupload_chunk(
+            client,
+            session,
+            chunk,
+            start,
+            end,
+            total=chunk_total,
+            policy=policy,
+        )
+        attempt = policy.last_retries()
+        if chunk_sizer is not None:
+            chunk_sizer.record(len(chunk), time.monotonic() - started, retried=attempt > 0)
+        bytes_done = offset
+
+        _record(manifest, session, bytes_done, known_total)
+
+        now = time.monotonic()
+        elapsed = now - last_log_at
+        rate = None
+        if elapsed > 0:
+            rate = (bytes_done - last_logged_bytes) / elapsed / (1024 * 1024)
+        log_progress(logger, _LOG_STAGE, bytes_done, known_total, attempt, rate, chunk_size=len(chunk))
+        last_log_at = now
+        last_logged_bytes = bytes_done
+
+        yield bytes_done
+
+    if known_total is not None:
+        if bytes_done != known_total:
+            raise RuntimeError(
+                f"Upload incomplete: expected {known_total} bytes, uploaded {bytes_done}"
+            )
+    else:
+        known_total = bytes_done
+
+    _record(manifest, session, bytes_done, known_total)
+    log_progress(logger, _LOG_STAGE, bytes_done, known_total, 0, None)
+
+
+__all__ = ["aupload_iter"]
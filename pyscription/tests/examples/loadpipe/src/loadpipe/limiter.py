@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+# overloaded(exc) -> True when the failure means "slow down" (429/503 and friends)
+OverloadCheck = Callable[[BaseException], bool]
+
+HISTORY_SIZE = 256
+_EWMA_ALPHA = 0.1
+_BASELINE_SAMPLES = 5
+_MB = 1024 * 1024
+# Kinds whose latency says nothing about load (a server-side copy takes as long as
+# the file is big): they hold a slot and react to 429/503, but never count as a spike.
+UNTIMED_KINDS = frozenset({"copy"})
+
+
+@dataclass(frozen=True)
+class LimitChange:
+    at: float  # time.time() of the change
+    limit: int
+    reason: str  # "initial" | "increase" | "throttled" | "latency"
+
+
+class AdaptiveLimiter:
+    """
+    AIMD limit on the number of in-flight Drive requests, shared process-wide.
+
+    * every fast success while the limiter is saturated adds ``1 / limit``
+      (about +1 per round of ``limit`` requests), up to ``max_limit``
+    * a throttling response (429/503) or a latency spike (``spike_factor`` times
+      the moving average for that kind of call) multiplies the limit by
+      ``decrease_factor``, at most once per ``cooldown`` seconds so one burst of
+      rejections does not collapse it to ``min_limit``
+    * calls that pass ``size`` (media transfers) are compared in seconds per MB
+      (at least 1 MB), so a growing chunk size is not mistaken for a spike;
+      ``UNTIMED_KINDS`` are not timed at all
+    * the current limit is ``limit``; every change is kept in ``history()``
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        decrease_factor: float = 0.5,
+        spike_factor: float = 3.0,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.spike_factor = spike_factor
+        self.cooldown = cooldown
+        self._clock = clock
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._increases = 0
+        self._decreases = 0
+        self._last_decrease = float("-inf")
+        self._latency: Dict[str, float] = {}
+        self._samples: Dict[str, int] = {}
+        self._history: Deque[LimitChange] = deque(maxlen=HISTORY_SIZE)
+        self._cond = threading.Condition()
+        # coroutines waiting for a slot; woken from any thread via call_soon_threadsafe
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = deque()
+        self._record(int(self._limit), "initial")
+
+    @classmethod
+    def from_config(cls, runtime: Any) -> "AdaptiveLimiter":
+        """Build a limiter from ``RuntimeConfig`` concurrency fields."""
+        return cls(
+            initial=runtime.concurrency_initial,
+            min_limit=runtime.concurrency_min,
+            max_limit=runtime.concurrency_max,
+        )
+
+    @property
+    def limit(self) -> int:
+        with self._cond:
+            return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        with self._cond:
+            return self._in_flight
+
+    def history(self) -> List[LimitChange]:
+        with self._cond:
+            return list(self._history)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._cond:
+            changes = list(self._history)
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "increases": self._increases,
+                "decreases": self._decreases,
+                "history": [(round(c.at, 3), c.limit, c.reason) for c in changes[-20:]],
+            }
+
+    def _record(self, limit: int, reason: str) -> None:
+        if reason == "increase":
+            self._increases += 1
+        elif reason != "initial":
+            self._decreases += 1
+        self._history.append(LimitChange(at=time.time(), limit=limit, reason=reason))
+
+    def _admit_locked(self) -> bool:
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        return self._in_flight >= int(self._limit)
+
+    def _wake_async_locked(self, count: int) -> None:
+        while count > 0 and self._async_waiters:
+            loop, future = self._async_waiters.popleft()
+            if future.done():
+                continue
+            loop.call_soon_threadsafe(_resolve, future)
+            count -= 1
+
+    def _acquire(self) -> bool:
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            return self._admit_locked()
+
+    async def _aacquire(self) -> bool:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < int(self._limit):
+                    return self._admit_locked()
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+            try:
+                await waiter[1]
+            except asyncio.CancelledError:
+                with self._cond:
+                    try:
+                        self._async_waiters.remove(waiter)
+                    except ValueError:
+                        self._wake_async_locked(1)  # already woken: hand the slot on
+                raise
+
+    def _release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+            self._wake_async_locked(1)
+
+    def _decrease(self, reason: str) -> None:
+        # caller holds self._cond
+        now = self._clock()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._record(int(self._limit), reason)
+
+    def _on_success(self, kind: str, latency: float, saturated: bool) -> None:
+        with self._cond:
+            spike = False
+            if kind not in UNTIMED_KINDS:
+                baseline = self._latency.get(kind)
+                samples = self._samples.get(kind, 0)
+                spike = (
+                    baseline is not None
+                    and samples >= _BASELINE_SAMPLES
+                    and latency > baseline * self.spike_factor
+                )
+                self._latency[kind] = latency if baseline is None else baseline + _EWMA_ALPHA * (latency - baseline)
+                self._samples[kind] = samples + 1
+            if spike:
+                self._decrease("latency")
+            elif saturated and self._limit < self.max_limit:
+                before = int(self._limit)
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+                if int(self._limit) > before:
+                    self._record(int(self._limit), "increase")
+                    self._cond.notify_all()
+                    self._wake_async_locked(int(self._limit) - before)
+
+    def _on_overload(self) -> None:
+        with self._cond:
+            self._decrease("throttled")
+
+    def call(
+        self,
+        action: Callable[[], Any],
+        overloaded: OverloadCheck,
+        *,
+        kind: str = "api",
+        size: Optional[int] = None,
+    ) -> Any:
+        """Run ``action`` inside a slot and adjust the limit from its outcome."""
+
+        saturated = self._acquire()
+        started = self._clock()
+        try:
+            result = action()
+        except Exception as exc:
+            if overloaded(exc):
+                self._on_overload()
+            raise
+        finally:
+            self._release()
+        self._on_success(kind, (self._clock() - started) / _units(size), saturated)
+        return result
+
+    async def acall(
+        self,
+        action: Callable[[], Awaitable[Any]],
+        overloaded: OverloadCheck,
+        *,
+        kind: str = "api",
+        size: Optional[int] = None,
+    ) -> Any:
+        """``call`` for coroutines; waiting for a slot does not block the event loop."""
+
+        saturated = await self._aacquire()
+        started = self._clock()
+        try:
+            result = await action()
+        except Exception as exc:
+            if overloaded(exc):
+                self._on_overload()
+            raise
+        finally:
+            self._release()
+        self._on_success(kind, (self._clock() - started) / _units(size), saturated)
+        return result
+
+
+def _units(size: Optional[int]) -> float:
+    return max(1.0, size / _MB) if size else 1.0
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+__all__ = ["AdaptiveLimiter", "LimitChange", "OverloadCheck", "HISTORY_SIZE", "UNTIMED_KINDS"]
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from .adapters import gdrive
+from .state import Manifest
+
+def _index(manifest: Manifest, folder_id: str, meta: gdrive.FileMeta) -> None:
+    manifest.upsert_listing(
+        file_id=meta.id,
+        folder_id=folder_id,
+        name=meta.name,
+        size=meta.size,
+        md5=meta.md5,
+        mime=meta.mime,
+        modified=meta.modified,
+    )
+
+
+def meta_from_row(row: Dict[str, Any]) -> gdrive.FileMeta:
+    return gdrive.FileMeta(
+        id=row["file_id"],
+        name=row.get("name") or "",
+        size=row.get("size"),
+        md5=row.get("md5"),
+        mime=row.get("mime"),
+        modified=row.get("modified"),
+    )
+
+
+def seed_index(service: Any, manifest: Manifest, folder_id: str, *, scope: Optional[str] = None) -> int:
+    """
+    Fully list ``folder_id`` into the manifest listing index; returns the entry count.
+
+    The index and its change token are stored under ``scope`` (default: the
+    folder id, the index the refresh policies serve listings from).
+
+    The changes cursor is taken *before* listing so nothing modified while the
+    listing runs is missed by the next ``apply_changes`` call. Listing pages are
+    staged in batches and swapped in at the end (``Manifest.replace_listing``),
+    so memory stays bounded for huge folders and no write transaction spans the
+    Drive requests.
+    """
+
+    scope = scope or folder_id
+    token = gdrive.get_start_page_token(service)
+    count = manifest.replace_listing(
+        scope,
+        (
+            {
+                "file_id": meta.id,
+                "name": meta.name,
+                "size": meta.size,
+                "md5": meta.md5,
+                "mime": meta.mime,
+                "modified": meta.modified,
+            }
+            for meta in gdrive.list_files(service, folder_id)
+        ),
+    )
+    manifest.set_change_token(scope, token)
+    return count
+
+
+def apply_changes(
+    service: Any,
+    manifest: Manifest,
+    folder_id: str,
+    *,
+    pattern: Optional[str] = None,
+    scope: Optional[str] = None,
+) -> List[gdrive.FileMeta]:
+    """
+    Bring the listing index of ``folder_id`` up to date via ``changes.list``.
+
+    Returns files that are new or modified since the stored page token and match
+    ``pattern``. Files that were removed, trashed or moved out of the folder are
+    dropped from the index. Without a stored token the index is seeded instead.
+    ``scope`` selects which index and token are used (see ``seed_index``).
+    """
+
+    scope = scope or folder_id
+    token = manifest.get_change_token(scope)
+    if token is None:
+        seed_index(service, manifest, folder_id, scope=scope)
+        return []
+
+    changes, next_token = gdrive.list_changes(service, token)
+    fresh: List[gdrive.FileMeta] = []
+    for change in changes:
+        meta = change.meta
+        known = manifest.get_listing(scope, change.file_id)
+        inside = (
+            meta is not None
+            and not change.removed
+            and not change.trashed
+            and folder_id in change.parents
+        )
+        if not inside:
+            if known:
+                manifest.delete_listing(scope, change.file_id)
+            continue
+        if known and known.get("modified") == meta.modified and known.get("name") == meta.name:
+            continue
+        _index(manifest, scope, meta)
+        if meta.mime != gdrive.FOLDER_MIME and gdrive.name_matches(meta.name, pattern):
+            fresh.append(meta)
+
+    manifest.set_change_token(scope, next_token)
+    manifest.mark_listing_refreshed(scope)
+    return fresh
+
+
+def refresh_index(
+    service: Any,
+    manifest: Manifest,
+    folder_id: str,
+    *,
+    policy: str = "ttl",
+    ttl_s: float = 300.0,
+) -> None:
+    """
+    Make sure the listing index of ``folder_id`` satisfies a refresh policy.
+
+    ``ttl`` re-lists only when the index is older than ``ttl_s`` seconds,
+    ``force`` always re-lists, and ``delta`` applies the changes feed
+    (seeding the index on first use).
+    """
+
+    if policy == "force":
+        seed_index(service, manifest, folder_id)
+    elif policy == "ttl":
+        refreshed = manifest.get_listing_refreshed(folder_id)
+        age = None
+        if refreshed:
+            age = (dt.datetime.utcnow() - dt.datetime.fromisoformat(refreshed)).total_seconds()
+        if age is None or age > ttl_s:
+            seed_index(service, manifest, folder_id)
+    elif policy == "delta":
+        apply_changes(service, manifest, folder_id)
+    else:
+        raise ValueError(f"Unknown listing refresh policy: {policy}")
+
+
+def cached_files(
+    service: Any,
+    manifest: Manifest,
+    folder_id: str,
+    pattern: Optional[str] = None,
+    *,
+    mime: Optional[str] = None,
+    policy: str = "ttl",
+    ttl_s: float = 300.0,
+    newest_first: bool = False,
+    limit: Optional[int] = None,
+) -> Iterator[gdrive.FileMeta]:
+    """
+    Serve a folder listing from the manifest index after applying ``policy``.
+
+    Filtering, ordering by ``modified`` and limiting run as SQL against the
+    indexed ``listings`` table. Globs with ``[...]`` classes (whose negation
+    syntax differs from SQLite GLOB) are matched in Python instead.
+    """
+
+    refresh_index(service, manifest, folder_id, policy=policy, ttl_s=ttl_s)
+
+    sql_glob = pattern if pattern and "[" not in pattern else None
+    local_match = bool(pattern) and sql_glob is None
+    rows = manifest.query_listing(
+        folder_id,
+        name_glob=sql_glob,
+        mime=mime,
+        exclude_mime=gdrive.FOLDER_MIME,
+        newest_first=newest_first,
+        limit=None if local_match else limit,
+    )
+    emitted = 0
+    for row in rows:
+        meta = meta_from_row(row)
+        if local_match and not gdrive.name_matches(meta.name, pattern):
+            continue
+        yield meta
+        emitted += 1
+        if limit is not None and emitted >= limit:
+            return
+
+
+def follower_scope(folder_id: str, cursor: str) -> str:
+    """Index/token scope of a follower; never equal to a folder id, so refreshes leave it alone."""
+    return f"{cursor}:{folder_id}"
+
+
+def follow(
+    service: Any,
+    manifest: Manifest,
+    folder_id: str,
+    *,
+    pattern: Optional[str] = None,
+    interval: float = 5.0,
+    logger: Optional[logging.Logger] = None,
+    cursor: str = "follow",
+) -> Iterator[gdrive.FileMeta]:
+    """
+    Poll the change feed forever, yielding new or modified files in ``folder_id``.
+
+    The follower owns its index and change token (scope ``follower_scope(folder_id,
+    cursor)``), so a ``delta`` refresh or a reseed of the folder's shared index
+    (``lp list --refresh``, ``source.listing_refresh``) never consumes or resets
+    the changes it has not seen yet. Followers with different ``cursor`` names
+    (``lp watch`` and ``lp sync --follow``) do not steal each other's changes.
+    """
+
+    scope = follower_scope(folder_id, cursor)
+    if manifest.get_change_token(scope) is None:
+        count = seed_index(service, manifest, folder_id, scope=scope)
+        if logger is not None:
+            logger.info("Seeded listing index for %s (%s) with %s entries", folder_id, cursor, count)
+
+    while True:
+        for meta in apply_changes(service, manifest, folder_id, pattern=pattern, scope=scope):
+            yield meta
+        time.sleep(interval)
+
+
+__all__ = [
+    "meta_from_row",
+    "seed_index",
+    "apply_changes",
+    "refresh_index",
+    "cached_files",
+    "follower_scope",
+    "follow",
+]
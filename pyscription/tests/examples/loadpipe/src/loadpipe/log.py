@@ -17,7 +17,7 @@ class JsonFormatter(logging.Formatter):
         if record.args and isinstance(record.args, dict):
             payload.update(record.args)
         # Attach extra dict if present
-        for key in ("ctx", "stage", "rate_mb_s", "bytes_done", "total", "retries"):
+        for key in ("ctx", "stage", "rate_mb_s", "bytes_done", "total", "retries", "chunk_size"):
             if hasattr(record, key):
                 payload[key] = getattr(record, key)
         return json.dumps(payload, ensure_ascii=False)
@@ -43,7 +43,15 @@ def get_logger(name: str = "loadpipe", log_dir: str = ".logs") -> logging.Logger
         pass
     return logger
 
-def log_progress(logger: logging.Logger, stage: str, bytes_done: int, total: int | None, retries: int, rate_mb_s: float | None):
+def log_progress(
+    logger: logging.Logger,
+    stage: str,
+    bytes_done: int,
+    total: int | None,
+    retries: int,
+    rate_mb_s: float | None,
+    chunk_size: int | None = None,
+):
     extra = {
         "stage": stage,
         "bytes_done": bytes_done,
@@ -51,4 +59,6 @@ def log_progress(logger: logging.Logger, stage: str, bytes_done: int, total: int
         "retries": retries,
         "rate_mb_s": rate_mb_s,
     }
+    if chunk_size is not None:
+        extra["chunk_size"] = chunk_size
     logger.info(f"progress", extra=extra)
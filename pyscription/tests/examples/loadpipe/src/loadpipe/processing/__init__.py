@@ -1,6 +1,49 @@
+import logging
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence
+
+Processor = Callable[[Iterable[bytes]], Iterator[bytes]]
 
-from typing import Iterable, Iterator
 
 def identity(stream: Iterable[bytes]) -> Iterator[bytes]:
     for chunk in stream:
         yield chunk
+
+
+STREAM_PROCESSORS = {
+    "identity": identity,
+}
+
+RECORD_PROCESSORS = ("ndjson", "csv")
+
+
+def get_processor(
+    kind: str,
+    *,
+    workers: int = 0,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Iterable[Mapping[str, Any]]] = None,
+) -> Processor:
+    """
+    Resolve ``process.kind`` into a stream processor.
+
+    Record kinds (``ndjson``/``csv``) apply the ``columns`` projection and
+    ``filters`` from ``ProcessConfig``; with ``workers > 0`` their record-aligned
+    batches run in a process pool (see ``processing.pool.pool_map``). Stream
+    kinds such as ``identity`` always run inline (``workers`` is ignored with a
+    log line).
+    """
+
+    if kind in RECORD_PROCESSORS:
+        from . import records
+
+        compiled = records.compile_filters(filters)
+        func = records.ndjson_processor if kind == "ndjson" else records.csv_processor
+        return partial(func, columns=list(columns) if columns else None, filters=compiled, workers=workers)
+    if kind in STREAM_PROCESSORS:
+        if workers > 0:
+            logging.getLogger(__name__).info(
+                "process.workers=%s ignored for kind %r: nothing to parallelize", workers, kind
+            )
+        return STREAM_PROCESSORS[kind]
+    raise ValueError(f"Unknown processor kind: {kind}")
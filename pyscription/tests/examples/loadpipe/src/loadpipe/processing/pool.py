@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+ChunkFn = Callable[[memoryview], bytes]
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    return shared_memory.SharedMemory(name=name)
+
+
+def _run_chunk(func: ChunkFn, in_name: str, size: int) -> Tuple[Optional[str], int]:
+    """Worker entry point: apply ``func`` to a shared-memory chunk.
+
+    The result is written into a fresh segment owned by the parent from then on;
+    ``None`` is returned instead of a name when the processor dropped the chunk.
+    """
+
+    source = _attach(in_name)
+    view = source.buf[:size]
+    try:
+        result = func(view)
+        out_len = len(result)
+        if out_len == 0:
+            return None, 0
+        target = shared_memory.SharedMemory(create=True, size=out_len)
+        try:
+            target.buf[:out_len] = result
+        finally:
+            target.close()
+        return target.name, out_len
+    finally:
+        result = None  # drop any view derived from ``view`` before releasing it
+        view.release()
+        source.close()
+
+
+def _collect(future: "Future[Tuple[Optional[str], int]]", segment: shared_memory.SharedMemory) -> bytes:
+    try:
+        out_name, out_len = future.result()
+    finally:
+        segment.close()
+        segment.unlink()
+    if out_name is None:
+        return b""
+    out = _attach(out_name)
+    try:
+        return bytes(out.buf[:out_len])
+    finally:
+        out.close()
+        out.unlink()
+
+
+def pool_map(
+    func: ChunkFn,
+    stream: Iterable[bytes],
+    *,
+    workers: int,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Run ``func`` over every chunk of ``stream`` in a ProcessPoolExecutor.
+
+    Chunks travel to the workers through ``multiprocessing.shared_memory`` segments
+    instead of pickled ``bytes``; only the segment name and length cross the pipe.
+    Results are yielded in input order, and at most ``max_in_flight`` chunks
+    (default ``2 * workers``) are held in shared memory at any time.
+
+    ``func`` must be picklable (a module-level function or ``functools.partial``)
+    and must not keep references to the memoryview it receives.
+    """
+
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    limit = max_in_flight if max_in_flight is not None else workers * 2
+    if limit <= 0:
+        raise ValueError("max_in_flight must be positive")
+
+    pending: Deque[Tuple["Future[Tuple[Optional[str], int]]", shared_memory.SharedMemory]] = deque()
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for chunk in stream:
+            if not chunk:
+                continue
+            segment = shared_memory.SharedMemory(create=True, size=len(chunk))
+            try:
+                segment.buf[: len(chunk)] = chunk
+                future = executor.submit(_run_chunk, func, segment.name, len(chunk))
+            except BaseException:
+                segment.close()
+                segment.unlink()
+                raise
+            pending.append((future, segment))
+
+            while len(pending) >= limit:
+                out = _collect(*pending.popleft())
+                if out:
+                    yield out
+
+        while pending:
+            out = _collect(*pending.popleft())
+            if out:
+                yield out
+    finally:
+        for future, segment in pending:
+            future.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
+        for future, segment in pending:
+            # Completed-but-unread results still own an output segment.
+            if future.done() and not future.cancelled() and future.exception() is None:
+                out_name, _ = future.result()
+                if out_name is not None:
+                    leftover = _attach(out_name)
+                    leftover.close()
+                    leftover.unlink()
+            segment.close()
+            segment.unlink()
+
+
+__all__ = ["ChunkFn", "pool_map"]
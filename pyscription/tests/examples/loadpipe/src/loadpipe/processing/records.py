@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import csv
+import datetime as dt
+import io
+import json
+import operator
+import re
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence
+
+try:  # pragma: no cover - optional dependency
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.json as pa_json
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda left, right: left in right,
+    "not in": lambda left, right: left not in right,
+}
+
+_ARROW_OPERATORS = {
+    "==": "equal",
+    "!=": "not_equal",
+    "<": "less",
+    "<=": "less_equal",
+    ">": "greater",
+    ">=": "greater_equal",
+}
+
+
+class RecordFilter(NamedTuple):
+    column: str
+    op: str
+    value: Any
+
+
+def compile_filters(specs: Optional[Iterable[Mapping[str, Any]]]) -> tuple[RecordFilter, ...]:
+    """Validate ``process.filters`` entries (``{column, op, value}`` mappings)."""
+
+    result: list[RecordFilter] = []
+    for spec in specs or ():
+        if not isinstance(spec, Mapping) or "column" not in spec:
+            raise ValueError(f"Invalid record filter: {spec!r}")
+        op = str(spec.get("op", "=="))
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        value = spec.get("value")
+        if op in {"in", "not in"}:
+            if not isinstance(value, (list, tuple)):
+                raise ValueError(f"Filter operator '{op}' expects a list value")
+            value = tuple(value)
+        result.append(RecordFilter(column=str(spec["column"]), op=op, value=value))
+    return tuple(result)
+
+
+def split_records(stream: Iterable[bytes], *, quote: Optional[bytes] = None) -> Iterator[bytes]:
+    """
+    Re-split byte chunks so every yielded batch ends on a record boundary.
+
+    Records are newline-terminated. When ``quote`` is set (CSV), a newline only
+    counts as a boundary if it is preceded by an even number of quote characters,
+    so quoted fields may contain line breaks.
+    """
+
+    carry = bytearray()
+    inside = False  # quote parity at the end of ``carry`` (CSV only)
+    for chunk in stream:
+        if not chunk:
+            continue
+        scanned = len(carry)
+        carry += chunk
+        if quote is None:
+            cut = carry.rfind(b"\n", scanned)
+        else:
+            cut, inside = _scan_quoted(carry, scanned, quote, inside)
+        if cut < 0:
+            continue
+        yield bytes(carry[: cut + 1])
+        del carry[: cut + 1]
+    if carry:
+        yield bytes(carry)
+
+
+def _scan_quoted(buf: bytearray, start: int, quote: bytes, inside: bool) -> tuple[int, bool]:
+    """
+    Scan ``buf[start:]`` once, flipping quote parity at each quote.
+
+    Returns the last newline outside quotes (or -1) and the parity at the end,
+    so every byte is looked at once however long a quoted field runs.
+    """
+    found = -1
+    pos = start
+    end = len(buf)
+    next_newline = -1
+    while pos < end:
+        if next_newline < pos:
+            next_newline = buf.find(b"\n", pos)
+            if next_newline < 0:
+                next_newline = end  # none left; found once, not per quote
+        next_quote = buf.find(quote, pos, next_newline)
+        if next_quote >= 0:
+            inside = not inside
+            pos = next_quote + 1
+            continue
+        if next_newline == end:
+            break
+        if not inside:
+            found = next_newline
+        pos = next_newline + 1
+    return found, inside
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (dt.datetime, dt.date, dt.time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Numeric CSV cells (both paths compare them as float64); anything else never matches a numeric filter.
+_NUMERIC_CELL = r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$"
+_NUMERIC_RE = re.compile(_NUMERIC_CELL)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float, Decimal)) and not isinstance(value, bool)
+
+
+def _coerce(raw: Any, like: Any) -> Any:
+    """Parse a CSV cell as a float when the filter value is numeric, so ``1.50 > 1`` holds."""
+    if _is_number(like) and isinstance(raw, str):
+        return float(raw) if _NUMERIC_RE.match(raw) else None
+    return raw
+
+
+def _matches(row: Mapping[str, Any], filters: Sequence[RecordFilter], *, coerce: bool = False) -> bool:
+    for flt in filters:
+        if flt.column not in row:
+            return False
+        cell = row[flt.column]
+        if coerce:
+            sample = flt.value[0] if isinstance(flt.value, tuple) and flt.value else flt.value
+            cell = _coerce(cell, sample)
+            if cell is None:
+                return False
+        try:
+            if not _OPERATORS[flt.op](cell, flt.value):
+                return False
+        except TypeError:
+            return False
+    return True
+
+
+def _numeric(column: "pa.ChunkedArray") -> "pa.ChunkedArray":
+    """String cells as float64, with non-numeric cells null (``_arrow_mask`` fails them)."""
+    valid = pc.match_substring_regex(column, _NUMERIC_CELL)
+    return pc.cast(pc.if_else(valid, pc.utf8_trim_whitespace(column), None), pa.float64())
+
+
+def _arrow_operands(
+    column: "pa.ChunkedArray", flt: RecordFilter, *, coerce: bool
+) -> Optional[tuple["pa.ChunkedArray", Any, bool]]:
+    """
+    ``(column, value, numeric)`` to compare in Arrow with the stdlib semantics of
+    ``_matches``, or ``None`` when the types do not line up (the caller then
+    evaluates the batch with ``_matches``; nothing is compared as text).
+    """
+    values = flt.value if isinstance(flt.value, tuple) else (flt.value,)
+    if not values or any(value is None for value in values):
+        return None
+    kind = column.type
+    if all(_is_number(value) for value in values):
+        if coerce and pa.types.is_string(kind):
+            column = _numeric(column)
+        elif pa.types.is_integer(kind) or pa.types.is_floating(kind) or pa.types.is_decimal(kind):
+            column = column.cast(pa.float64())
+        else:
+            return None
+        cast = [float(value) for value in values]
+        return column, tuple(cast) if isinstance(flt.value, tuple) else cast[0], True
+    if all(isinstance(value, str) for value in values) and pa.types.is_string(kind):
+        return column, flt.value, False
+    if all(isinstance(value, bool) for value in values) and pa.types.is_boolean(kind):
+        return column, flt.value, False
+    return None
+
+
+def _arrow_mask(
+    table: "pa.Table", filters: Sequence[RecordFilter], *, coerce: bool = False
+) -> Optional["pa.ChunkedArray"]:
+    """
+    Row mask for ``filters`` that agrees with ``_matches``, or ``None`` when some
+    filter cannot be evaluated the same way in Arrow. With ``coerce`` (CSV read as
+    strings), numeric filter values compare cells as floats like ``_coerce``.
+    """
+    mask = None
+    for flt in filters:
+        if flt.column not in table.column_names:
+            return pa.chunked_array([pa.array([False] * table.num_rows, type=pa.bool_())])
+        operands = _arrow_operands(table.column(flt.column), flt, coerce=coerce)
+        if operands is None:
+            return None
+        column, value, numeric = operands
+        if flt.op in {"!=", "not in"} and column.null_count and not (coerce and numeric):
+            # A JSON null passes ``!=`` in Python; Arrow cannot tell it from a missing key.
+            return None
+        if flt.op in {"in", "not in"}:
+            part = pc.is_in(column, value_set=pa.array(value, type=column.type))
+            if flt.op == "not in":
+                part = pc.invert(part)
+        else:
+            part = getattr(pc, _ARROW_OPERATORS[flt.op])(column, pa.scalar(value, type=column.type))
+        # Null cells (missing keys, non-numeric CSV cells) fail every filter, as in ``_matches``.
+        part = pc.and_(pc.fill_null(part, False), pc.is_valid(column))
+        mask = part if mask is None else pc.and_(mask, part)
+    return mask
+
+
+def _project(record: Any, columns: Sequence[str]) -> bytes:
+    if isinstance(record, Mapping):
+        record = {name: record[name] for name in columns if name in record}
+    return json.dumps(record, ensure_ascii=False, default=_json_default).encode("utf-8") + b"\n"
+
+
+def ndjson_batch(
+    data: memoryview,
+    *,
+    columns: Optional[Sequence[str]] = None,
+    filters: Sequence[RecordFilter] = (),
+) -> bytes:
+    """Filter and project one newline-aligned batch of NDJSON records."""
+
+    raw = bytes(data)
+    if not columns and not filters:
+        return raw
+    lines = [line for line in raw.split(b"\n") if line.strip()]
+    if not lines:
+        return b""
+
+    if pa is not None:
+        try:
+            table = pa_json.read_json(pa.BufferReader(raw))
+        except pa.ArrowInvalid:
+            table = None
+        if table is not None and table.num_rows == len(lines):
+            # Arrow only picks the rows; survivors keep (or are projected from) their
+            # original JSON, so output does not depend on pyarrow's type inference.
+            mask = _arrow_mask(table, filters) if filters else None
+            if mask is not None or not filters:
+                if mask is not None:
+                    lines = [line for line, ok in zip(lines, mask.to_pylist()) if ok]
+                if not columns:
+                    return b"".join(line + b"\n" for line in lines)
+                return b"".join(_project(json.loads(line), columns) for line in lines)
+
+    out: list[bytes] = []
+    for line in lines:
+        record = json.loads(line)
+        if filters and (not isinstance(record, Mapping) or not _matches(record, filters)):
+            continue
+        if columns:
+            out.append(_project(record, columns))
+        else:
+            out.append(line + b"\n")
+    return b"".join(out)
+
+
+def csv_batch(
+    data: memoryview,
+    *,
+    header: Sequence[str],
+    columns: Optional[Sequence[str]] = None,
+    filters: Sequence[RecordFilter] = (),
+) -> bytes:
+    """Filter and project one record-aligned batch of CSV rows (header excluded)."""
+
+    raw = bytes(data)
+    if not columns and not filters:
+        return raw
+    if not raw.strip():
+        return b""
+    selected = [name for name in columns if name in header] if columns else list(header)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    if pa is not None:
+        try:
+            # Every column stays a string: cells are written back exactly as read
+            # (``02134``, ``1.50``), and filters do not depend on per-batch inference.
+            table = pa_csv.read_csv(
+                pa.BufferReader(raw),
+                read_options=pa_csv.ReadOptions(column_names=list(header)),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+        except pa.ArrowInvalid:
+            table = None
+        mask = _arrow_mask(table, filters, coerce=True) if table is not None and filters else None
+        if table is not None and (mask is not None or not filters):
+            if mask is not None:
+                table = table.filter(mask)
+            # Written with the same ``csv.writer`` as the fallback, so quoting matches.
+            writer.writerows(zip(*(table.column(name).to_pylist() for name in selected)))
+            return buffer.getvalue().encode("utf-8")
+
+    reader = csv.DictReader(io.StringIO(raw.decode("utf-8")), fieldnames=list(header))
+    for row in reader:
+        if filters and not _matches(row, filters, coerce=True):
+            continue
+        writer.writerow([row.get(name) for name in selected])
+    return buffer.getvalue().encode("utf-8")
+
+
+def _map_batches(
+    func: Callable[[memoryview], bytes],
+    batches: Iterable[bytes],
+    workers: int,
+) -> Iterator[bytes]:
+    if workers > 0:
+        from .pool import pool_map
+
+        yield from pool_map(func, batches, workers=workers)
+        return
+    for batch in batches:
+        out = func(memoryview(batch))
+        if out:
+            yield out
+
+
+def ndjson_processor(
+    stream: Iterable[bytes],
+    *,
+    columns: Optional[Sequence[str]] = None,
+    filters: Sequence[RecordFilter] = (),
+    workers: int = 0,
+) -> Iterator[bytes]:
+    func = partial(ndjson_batch, columns=columns, filters=tuple(filters))
+    yield from _map_batches(func, split_records(stream), workers)
+
+
+def csv_processor(
+    stream: Iterable[bytes],
+    *,
+    columns: Optional[Sequence[str]] = None,
+    filters: Sequence[RecordFilter] = (),
+    workers: int = 0,
+) -> Iterator[bytes]:
+    batches = split_records(stream, quote=b'"')
+    first = next(batches, b"")
+    if not first:
+        return
+
+    # The header is the first record; peel it off the first batch.
+    cut = first.find(b"\n")
+    while cut >= 0 and first.count(b'"', 0, cut) % 2:
+        cut = first.find(b"\n", cut + 1)
+    header_end = cut + 1 if cut >= 0 else len(first)
+    header_line, rest = first[:header_end], first[header_end:]
+    header = next(csv.reader([header_line.decode("utf-8")]), [])
+
+    if columns:
+        out_header = io.StringIO()
+        csv.writer(out_header, lineterminator="\n").writerow([name for name in columns if name in header])
+        yield out_header.getvalue().encode("utf-8")
+    else:
+        yield header_line
+
+    def _remaining() -> Iterator[bytes]:
+        if rest:
+            yield rest
+        yield from batches
+
+    func = partial(csv_batch, header=tuple(header), columns=columns, filters=tuple(filters))
+    yield from _map_batches(func, _remaining(), workers)
+
+
+__all__ = [
+    "RecordFilter",
+    "compile_filters",
+    "split_records",
+    "ndjson_batch",
+    "csv_batch",
+    "ndjson_processor",
+    "csv_processor",
+]
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from .errors import CircuitOpenError
+
+# classify(exc) -> (retryable, retry_after_seconds)
+Classifier = Callable[[BaseException], Tuple[bool, Optional[float]]]
+
+# Retries spent by the latest call()/acall() in the current context (thread or task).
+_last_retries: ContextVar[int] = ContextVar("loadpipe_last_retries", default=0)
+
+
+@dataclass
+class RetryStats:
+    calls: int = 0
+    retries: int = 0
+    sleep_s: float = 0.0
+    budget_denied: int = 0
+    breaker_trips: int = 0
+    breaker_rejected: int = 0
+
+
+class RetryPolicy:
+    """
+    Single retry policy shared by every Drive call of a run.
+
+    * full-jitter exponential backoff (``uniform(0, min(max_delay, base * 2**n))``)
+    * ``Retry-After`` from the classifier overrides the computed delay
+    * ``budget`` caps the total number of retries across all calls of the run
+    * a circuit breaker opens after ``breaker_threshold`` consecutive retryable
+      failures and rejects calls for ``breaker_cooldown`` seconds, then lets a
+      single probe through
+    * retry counts and time spent sleeping are kept in ``stats`` for metrics
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        budget: Optional[int] = None,
+        breaker_threshold: int = 10,
+        breaker_cooldown: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.stats = RetryStats()
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._probing: Optional[object] = None
+
+    @classmethod
+    def from_config(cls, runtime: Any) -> "RetryPolicy":
+        """Build a policy from ``RuntimeConfig`` retry fields."""
+        return cls(
+            max_retries=runtime.retries,
+            base_delay=runtime.retry_base_s,
+            max_delay=runtime.retry_max_s,
+            budget=runtime.retry_budget,
+            breaker_threshold=runtime.breaker_threshold,
+            breaker_cooldown=runtime.breaker_cooldown_s,
+        )
+
+    def _settings(self) -> dict[str, Any]:
+        return {
+            "max_retries": self.max_retries,
+            "base_delay": self.base_delay,
+            "max_delay": self.max_delay,
+            "budget": self.budget,
+            "breaker_threshold": self.breaker_threshold,
+            "breaker_cooldown": self.breaker_cooldown,
+        }
+
+    def __reduce__(self) -> tuple[Any, tuple]:
+        # Only the settings travel; each process starts with fresh stats and breaker state.
+        return functools.partial(type(self), **self._settings()), ()
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{key}={value!r}" for key, value in self._settings().items())
+        return f"{type(self).__name__}({args})"
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            data = asdict(self.stats)
+        data["sleep_s"] = round(data["sleep_s"], 3)
+        return data
+
+    def last_retries(self) -> int:
+        """Retries used by the most recent call made from the current thread or task."""
+        return _last_retries.get()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (0-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return self._rng.uniform(0, ceiling)
+
+    def _admit(self) -> Optional[object]:
+        """Admit a call; returns the probe token when it is the half-open probe."""
+        with self._lock:
+            self.stats.calls += 1
+            if self._open_until == 0.0:
+                return None
+            now = time.monotonic()
+            if now < self._open_until or self._probing is not None:
+                self.stats.breaker_rejected += 1
+                raise CircuitOpenError(
+                    context={"retry_in_s": round(max(0.0, self._open_until - now), 3)},
+                )
+            self._probing = probe = object()  # half-open: let exactly one call through
+            return probe
+
+    def _release(self, probe: Optional[object]) -> None:
+        """
+        Let the next call probe if ``probe`` ended without an outcome (cancelled,
+        interrupted); the breaker stays open until a probe succeeds.
+        """
+        if probe is None:
+            return
+        with self._lock:
+            if self._probing is probe:
+                self._probing = None
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._open_until = 0.0
+            self._probing = None
+
+    def _record_failure(self) -> bool:
+        """Register a retryable failure; returns False when the breaker just opened."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._probing is not None or (
+                self.breaker_threshold > 0 and self._consecutive_failures >= self.breaker_threshold
+            ):
+                self._open_until = time.monotonic() + self.breaker_cooldown
+                self._probing = None
+                self.stats.breaker_trips += 1
+                return False
+            return True
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self.budget is not None and self.stats.retries >= self.budget:
+                self.stats.budget_denied += 1
+                return False
+            self.stats.retries += 1
+            return True
+
+    def _next_delay(self, exc: BaseException, classify: Classifier, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying after ``exc``, or ``None`` to give up."""
+        retryable, retry_after = classify(exc)
+        if not retryable:
+            self._record_success()  # the service answered; not a health signal
+            return None
+        if not self._record_failure() or attempt >= self.max_retries or not self._take_budget():
+            return None
+        delay = retry_after if retry_after is not None else self.backoff(attempt)
+        delay = max(0.0, delay)
+        with self._lock:
+            self.stats.sleep_s += delay
+        return delay
+
+    def call(self, action: Callable[[], Any], classify: Classifier) -> Any:
+        probe = self._admit()
+        try:
+            return self._call(action, classify)
+        finally:
+            self._release(probe)
+
+    def _call(self, action: Callable[[], Any], classify: Classifier) -> Any:
+        attempt = 0
+        while True:
+            try:
+                result = action()
+            except Exception as exc:
+                delay = self._next_delay(exc, classify, attempt)
+                if delay is None:
+                    _last_retries.set(attempt)
+                    raise
+                self._sleep(delay)
+                attempt += 1
+                continue
+            self._record_success()
+            _last_retries.set(attempt)
+            return result
+
+    async def acall(self, action: Callable[[], Awaitable[Any]], classify: Classifier) -> Any:
+        """``call`` for coroutines: backoff waits with ``asyncio.sleep`` instead of blocking."""
+        probe = self._admit()
+        try:
+            return await self._acall(action, classify)
+        finally:
+            self._release(probe)
+
+    async def _acall(self, action: Callable[[], Awaitable[Any]], classify: Classifier) -> Any:
+        attempt = 0
+        while True:
+            try:
+                result = await action()
+            except Exception as exc:
+                delay = self._next_delay(exc, classify, attempt)
+                if delay is None:
+                    _last_retries.set(attempt)
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self._record_success()
+            _last_retries.set(attempt)
+            return result
+
+
+__all__ = ["Classifier", "RetryPolicy", "RetryStats"]
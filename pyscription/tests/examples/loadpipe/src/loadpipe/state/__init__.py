@@ -1,4 +1,3 @@
+from .manifest import Manifest, SharedManifest
 
-from .manifest import Manifest
-
-__all__ = ["Manifest"]
\ No newline at end of file
+__all__ = ["Manifest", "SharedManifest"]
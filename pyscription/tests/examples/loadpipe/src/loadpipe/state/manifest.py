@@ -1,32 +1,62 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any,  Dict, Optional
+from typing import Any,  Dict, Iterable, Iterator, List, Optional
 
 from loadpipe.errors import ResumeMismatchError
 
+_LISTING_BATCH = 1000  # staged listing rows committed per transaction
+
 class Manifest:
     """
     SQLite manifest DB wrapper
 
     """
 
-    def __init__ (self, db_path: str | Path) -> None:
+    def __init__ (self, db_path: str | Path, *, check_same_thread: bool = True) -> None:
         self._db_path = Path(db_path)
         if str(self._db_path) != ":memory:":
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._conn = sqlite3.connect(str(self._db_path))
+        self._conn = sqlite3.connect(str(self._db_path), check_same_thread=check_same_thread)
         self._conn.row_factory = sqlite3.Row
 
         schema_path = Path(__file__).with_name("schema.sql")
         schema = schema_path.read_text(encoding="utf-8")
+        self._drop_legacy_listings()
         self._conn.executescript(schema)
         # Ensure WAL mode is active even if the schema script was executed previously without it.
         self._conn.execute("PRAGMA journal_mode=WAL;")
 
+    def _drop_legacy_listings(self) -> None:
+        """
+        Drop a ``listings`` table keyed on ``file_id`` alone (one row per file
+        across all folders). It is only an index: the folders it covered, and their
+        change tokens, are forgotten so the next refresh re-lists them.
+        """
+
+        key = [row["name"] for row in self._conn.execute("PRAGMA table_info(listings)") if row["pk"]]
+        if key != ["file_id"]:
+            return
+        # Databases from before listing_folders existed only know their folders
+        # through the rows themselves.
+        has_folders = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'listing_folders'"
+        ).fetchone()
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM change_tokens WHERE scope IN (SELECT DISTINCT folder_id FROM listings)"
+            )
+            if has_folders:
+                self._conn.execute(
+                    "DELETE FROM change_tokens WHERE scope IN (SELECT folder_id FROM listing_folders)"
+                )
+                self._conn.execute("DELETE FROM listing_folders")
+            self._conn.execute("DROP TABLE listings")
+
     def close(self) -> None:
         """Close the underlying SQLite connection."""
         conn = getattr(self, "_conn", None)
@@ -204,4 +234,257 @@ class Manifest:
         row = cur.fetchone()
         return dict(row) if row else None
 
-__all__ = ["Manifest"]
+    # ------------------------------------------------------------------
+    # Change feed & listing index
+    # ------------------------------------------------------------------
+    def get_change_token(self, scope: str) -> Optional[str]:
+        """Return the stored Drive changes page token for a scope (folder id)."""
+
+        cur = self._conn.execute(
+            "SELECT page_token FROM change_tokens WHERE scope = ?",
+            (scope,),
+        )
+        row = cur.fetchone()
+        return row["page_token"] if row else None
+
+    def set_change_token(self, scope: str, page_token: str, updated_at: Optional[str] = None) -> None:
+        """Persist the Drive changes page token for a scope."""
+
+        if updated_at is None:
+            updated_at = datetime.utcnow().isoformat()
+
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO change_tokens (scope, page_token, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(scope) DO UPDATE SET
+                    page_token = excluded.page_token,
+                    updated_at = excluded.updated_at
+                """,
+                (scope, page_token, updated_at),
+            )
+
+    def get_listing(self, folder_id: str, file_id: str) -> Optional[Dict[str, Any]]:
+        """Return the listing index entry of ``file_id`` in ``folder_id`` if it exists."""
+
+        cur = self._conn.execute(
+            "SELECT file_id, folder_id, name, size, md5, mime, modified, updated_at"
+            " FROM listings WHERE folder_id = ? AND file_id = ?",
+            (folder_id, file_id),
+        )
+        row = cur.fetchone()
+        return dict(row) if row else None
+
+    def list_listing(self, folder_id: str) -> List[Dict[str, Any]]:
+        """Return every indexed entry of a folder."""
+
+        cur = self._conn.execute(
+            "SELECT file_id, folder_id, name, size, md5, mime, modified, updated_at"
+            " FROM listings WHERE folder_id = ?",
+            (folder_id,),
+        )
+        return [dict(row) for row in cur.fetchall()]
+
+    def upsert_listing(
+        self,
+        *,
+        file_id: str,
+        folder_id: str,
+        name: Optional[str] = None,
+        size: Optional[int] = None,
+        md5: Optional[str] = None,
+        mime: Optional[str] = None,
+        modified: Optional[str] = None,
+        updated_at: Optional[str] = None,
+    ) -> None:
+        """Insert or update a listing index entry."""
+
+        if updated_at is None:
+            updated_at = datetime.utcnow().isoformat()
+
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO listings (file_id, folder_id, name, size, md5, mime, modified, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(folder_id, file_id) DO UPDATE SET
+                    name = excluded.name,
+                    size = excluded.size,
+                    md5 = excluded.md5,
+                    mime = excluded.mime,
+                    modified = excluded.modified,
+                    updated_at = excluded.updated_at
+                """,
+                (file_id, folder_id, name, size, md5, mime, modified, updated_at),
+            )
+
+    def replace_listing(self, folder_id: str, entries: Iterable[Dict[str, Any]], updated_at: Optional[str] = None) -> int:
+        """
+        Swap the indexed entries of a folder for ``entries``; returns the count.
+
+        ``entries`` (typically a paged Drive listing) is staged in
+        ``listing_staging`` with a commit every ``_LISTING_BATCH`` rows, so no
+        write transaction stays open while pages are fetched. The folder's rows in
+        ``listings`` are then replaced in one short transaction; readers see the
+        old listing or the new one, never a mix. A listing that fails part-way
+        leaves ``listings`` untouched.
+        """
+
+        if updated_at is None:
+            updated_at = datetime.utcnow().isoformat()
+
+        insert = """
+            INSERT OR REPLACE INTO listing_staging (file_id, folder_id, name, size, md5, mime, modified, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        with self._conn:
+            self._conn.execute("DELETE FROM listing_staging WHERE folder_id = ?", (folder_id,))
+
+        count = 0
+        batch: List[tuple] = []
+        for entry in entries:
+            count += 1
+            batch.append(
+                (
+                    entry["file_id"],
+                    folder_id,
+                    entry.get("name"),
+                    entry.get("size"),
+                    entry.get("md5"),
+                    entry.get("mime"),
+                    entry.get("modified"),
+                    updated_at,
+                )
+            )
+            if len(batch) >= _LISTING_BATCH:
+                with self._conn:
+                    self._conn.executemany(insert, batch)
+                batch.clear()
+
+        with self._conn:
+            if batch:
+                self._conn.executemany(insert, batch)
+            self._conn.execute("DELETE FROM listings WHERE folder_id = ?", (folder_id,))
+            self._conn.execute(
+                """
+                INSERT INTO listings (file_id, folder_id, name, size, md5, mime, modified, updated_at)
+                SELECT file_id, folder_id, name, size, md5, mime, modified, updated_at
+                FROM listing_staging WHERE folder_id = ?
+                """,
+                (folder_id,),
+            )
+            self._conn.execute("DELETE FROM listing_staging WHERE folder_id = ?", (folder_id,))
+            self._mark_listing_refreshed(folder_id, updated_at)
+        return count
+
+    def query_listing(
+        self,
+        folder_id: str,
+        *,
+        name_glob: Optional[str] = None,
+        mime: Optional[str] = None,
+        exclude_mime: Optional[str] = None,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Indexed entries of a folder, filtered and ordered in SQL (``name_glob`` uses SQLite GLOB)."""
+
+        clauses = ["folder_id = ?"]
+        params: List[Any] = [folder_id]
+        if name_glob:
+            clauses.append("name GLOB ?")
+            params.append(name_glob)
+        if mime:
+            clauses.append("mime = ?")
+            params.append(mime)
+        if exclude_mime:
+            clauses.append("(mime IS NULL OR mime != ?)")
+            params.append(exclude_mime)
+        sql = (
+            "SELECT file_id, folder_id, name, size, md5, mime, modified, updated_at"
+            f" FROM listings WHERE {' AND '.join(clauses)}"
+        )
+        if newest_first:
+            sql += " ORDER BY modified DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        # Fetched eagerly: no read cursor stays open on the connection while the
+        # caller writes through it (``SharedManifest``) or another connection.
+        return iter([dict(row) for row in self._conn.execute(sql, params)])
+
+    def get_listing_refreshed(self, folder_id: str) -> Optional[str]:
+        """Return when a folder's listing index was last brought up to date."""
+
+        cur = self._conn.execute(
+            "SELECT refreshed_at FROM listing_folders WHERE folder_id = ?",
+            (folder_id,),
+        )
+        row = cur.fetchone()
+        return row["refreshed_at"] if row else None
+
+    def mark_listing_refreshed(self, folder_id: str, refreshed_at: Optional[str] = None) -> None:
+        """Record that a folder's listing index is fresh as of ``refreshed_at``."""
+
+        with self._conn:
+            self._mark_listing_refreshed(folder_id, refreshed_at or datetime.utcnow().isoformat())
+
+    def _mark_listing_refreshed(self, folder_id: str, refreshed_at: str) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO listing_folders (folder_id, refreshed_at)
+            VALUES (?, ?)
+            ON CONFLICT(folder_id) DO UPDATE SET
+                refreshed_at = excluded.refreshed_at
+            """,
+            (folder_id, refreshed_at),
+        )
+
+    def delete_listing(self, folder_id: str, file_id: str) -> None:
+        """Drop a file from the listing index of ``folder_id``."""
+
+        with self._conn:
+            self._conn.execute("DELETE FROM listings WHERE folder_id = ? AND file_id = ?", (folder_id, file_id))
+
+    def clear_listing(self, folder_id: str) -> None:
+        """Drop every indexed entry of a folder (before a full re-listing)."""
+
+        with self._conn:
+            self._conn.execute("DELETE FROM listings WHERE folder_id = ?", (folder_id,))
+
+
+class SharedManifest:
+    """
+    One manifest connection shared by worker threads.
+
+    Every ``Manifest`` method is available and runs under a lock, so concurrent
+    transfers (``lp pull`` of many files) record progress through a single
+    SQLite connection instead of opening one each. ``query_listing`` fetches
+    its rows inside the call, so the listing of ``lp pull --folder`` can be
+    served from the same connection.
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        self._manifest = Manifest(db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._manifest, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args: Any, **kwargs: Any) -> Any:
+            with self._lock:
+                return attr(*args, **kwargs)
+
+        return locked
+
+    def __enter__(self) -> "SharedManifest":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+__all__ = ["Manifest", "SharedManifest"]
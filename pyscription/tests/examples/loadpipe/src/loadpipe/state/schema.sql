@@ -27,3 +27,43 @@ CREATE TABLE IF NOT EXISTS runs (
   finished_at TEXT,
   status TEXT
 );
+
+CREATE TABLE IF NOT EXISTS change_tokens (
+  scope TEXT PRIMARY KEY,
+  page_token TEXT,
+  updated_at TEXT
+);
+
+-- A file in several folders has one row per folder.
+CREATE TABLE IF NOT EXISTS listings (
+  file_id TEXT NOT NULL,
+  folder_id TEXT NOT NULL,
+  name TEXT,
+  size INTEGER,
+  md5 TEXT,
+  mime TEXT,
+  modified TEXT,
+  updated_at TEXT,
+  PRIMARY KEY (folder_id, file_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_listings_folder_name ON listings (folder_id, name);
+CREATE INDEX IF NOT EXISTS idx_listings_folder_modified ON listings (folder_id, modified);
+
+-- Full re-listings are written here in batches, then swapped into listings at once.
+CREATE TABLE IF NOT EXISTS listing_staging (
+  file_id TEXT NOT NULL,
+  folder_id TEXT NOT NULL,
+  name TEXT,
+  size INTEGER,
+  md5 TEXT,
+  mime TEXT,
+  modified TEXT,
+  updated_at TEXT,
+  PRIMARY KEY (folder_id, file_id)
+);
+
+CREATE TABLE IF NOT EXISTS listing_folders (
+  folder_id TEXT PRIMARY KEY,
+  refreshed_at TEXT
+);